@@ -0,0 +1 @@
+"""Performance benchmarks for the subject checkers (``python -m benchmarks.run``)."""
@@ -0,0 +1,250 @@
+"""
+``python -m benchmarks.run``: times every subject ``Tester`` on synthetic submissions.
+
+Each scenario (see ``benchmarks/scenarios.py``) is graded ``--repeat`` times,
+every time in a fresh interpreter with the result cache off and an empty
+mypy cache, so runs are cold and independent. Three numbers are recorded:
+
+- ``wall_seconds``: best wall time of the repeats, from the subject import
+  to the end of the report;
+- ``subprocesses``: processes started (``subprocess.Popen`` plus one per
+  script run by the warm script pool);
+- ``peak_rss_kb``: peak resident set size of the grader or of its children.
+
+They are compared with ``benchmarks/baseline.json``; the command exits 1
+when a scenario got slower or bigger than ``--threshold`` (a fraction) over
+its baseline, or starts more processes. ``--update`` rewrites the baseline.
+Wall times only compare on the machine that recorded the baseline.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.scenarios import REPO_ROOT, scenarios
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 5
+# Wall-time differences below this are noise, whatever the ratio.
+MIN_WALL_DELTA = 0.05
+
+
+def machine():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def _maxrss_kb(usage):
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere.
+    return usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+
+
+def _measure(subject, submission, output):
+    """Child process: grades ``submission`` once and writes the metrics to ``output``."""
+    import importlib
+    import resource
+
+    from germinette import lint, script_pool
+
+    spawned = 0
+    popen_init = subprocess.Popen.__init__
+    pool_run = script_pool.ScriptPool.run
+
+    def counting_popen(self, *args, **kwargs):
+        nonlocal spawned
+        spawned += 1
+        popen_init(self, *args, **kwargs)
+
+    def counting_pool_run(self, *args, **kwargs):
+        nonlocal spawned
+        result = pool_run(self, *args, **kwargs)
+        spawned += 1
+        return result
+
+    subprocess.Popen.__init__ = counting_popen
+    script_pool.ScriptPool.run = counting_pool_run
+
+    os.chdir(submission)
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w", encoding="utf-8")
+    try:
+        started = time.perf_counter()
+        tester = importlib.import_module(f"germinette.subjects.{subject}").Tester()
+        tester.run()
+        wall = time.perf_counter() - started
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+        script_pool.pool.close()
+        lint.shutdown()
+
+    peak = max(
+        _maxrss_kb(resource.getrusage(resource.RUSAGE_SELF)),
+        _maxrss_kb(resource.getrusage(resource.RUSAGE_CHILDREN)),
+    )
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"wall_seconds": wall, "subprocesses": spawned, "peak_rss_kb": peak}, f)
+
+
+def run_scenario(subject, builder, repeat=DEFAULT_REPEAT):
+    """Grades one scenario ``repeat`` times and returns its metrics."""
+    workdir = tempfile.mkdtemp(prefix="germinette-bench-")
+    try:
+        submission = os.path.join(workdir, subject)
+        os.makedirs(submission)
+        builder(submission)
+        env = dict(os.environ)
+        env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+        env["GERMINETTE_NO_CACHE"] = "1"
+        runs = []
+        for i in range(repeat):
+            # A fresh cache home per run keeps mypy's incremental cache cold.
+            env["XDG_CACHE_HOME"] = os.path.join(workdir, f"cache-{i}")
+            output = os.path.join(workdir, f"run-{i}.json")
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.run", "--measure", subject, submission, output],
+                cwd=REPO_ROOT, env=env, check=True, stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            with open(output, "r", encoding="utf-8") as f:
+                runs.append(json.load(f))
+        return {
+            "wall_seconds": round(min(r["wall_seconds"] for r in runs), 4),
+            "subprocesses": max(r["subprocesses"] for r in runs),
+            "peak_rss_kb": max(r["peak_rss_kb"] for r in runs),
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """Returns ``[(scenario, message)]`` for every metric that regressed past ``threshold``."""
+    regressions = []
+    for name, metrics in current.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        wall, base_wall = metrics["wall_seconds"], base["wall_seconds"]
+        if wall > base_wall * (1 + threshold) and wall - base_wall > MIN_WALL_DELTA:
+            regressions.append((name, f"wall time {base_wall:.3f}s -> {wall:.3f}s"))
+        if metrics["subprocesses"] > base["subprocesses"]:
+            regressions.append((name, f"subprocesses {base['subprocesses']} -> {metrics['subprocesses']}"))
+        if metrics["peak_rss_kb"] > base["peak_rss_kb"] * (1 + threshold):
+            regressions.append((name, f"peak RSS {base['peak_rss_kb']} KiB -> {metrics['peak_rss_kb']} KiB"))
+    return regressions
+
+
+def load_baseline(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"machine": None, "scenarios": {}}
+
+
+def _change(value, base, fmt):
+    if base is None:
+        return fmt(value)
+    if not base:
+        return f"{fmt(value)} (was {fmt(base)})"
+    return f"{fmt(value)} ({(value - base) / base:+.0%})"
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Time the subject checkers on synthetic submissions and compare with the baseline.",
+    )
+    parser.add_argument("-k", metavar="PATTERN", help="Only run scenarios matching this glob")
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT, metavar="N",
+        help=f"Runs per scenario; the best wall time is kept (default: {DEFAULT_REPEAT})",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, metavar="FRACTION",
+        help=f"Allowed slowdown / growth over the baseline (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--baseline", default=BASELINE, metavar="FILE", help="Baseline JSON file")
+    parser.add_argument("--update", action="store_true", help="Record the results as the new baseline")
+    parser.add_argument("--measure", nargs=3, metavar=("SUBJECT", "DIR", "OUTPUT"), help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.measure:
+        _measure(*args.measure)
+        return 0
+    if args.repeat < 1:
+        parser.error("--repeat must be a positive integer")
+    if args.threshold < 0:
+        parser.error("--threshold must not be negative")
+
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+    selected = {
+        name: spec for name, spec in scenarios().items() if not args.k or fnmatch.fnmatch(name, args.k)
+    }
+    if not selected:
+        console.print(f"[bold red]No scenario matches[/bold red] {args.k}")
+        return 2
+
+    baseline = load_baseline(args.baseline)
+    if baseline["machine"] and baseline["machine"] != machine() and not args.update:
+        console.print(
+            "[yellow]Baseline was recorded on another machine "
+            f"({baseline['machine']['platform']}, Python {baseline['machine']['python']}); "
+            "wall times are not comparable.[/yellow]"
+        )
+
+    current = {}
+    table = Table(title=f"Benchmarks (best of {args.repeat})")
+    for column in ("Scenario", "Wall", "Subprocesses", "Peak RSS"):
+        table.add_column(column, justify="left" if column == "Scenario" else "right")
+    with console.status("") as status:
+        for name, (subject, builder) in selected.items():
+            status.update(f"Grading {name}...")
+            metrics = current[name] = run_scenario(subject, builder, args.repeat)
+            base = baseline["scenarios"].get(name, {})
+            table.add_row(
+                name,
+                _change(metrics["wall_seconds"], base.get("wall_seconds"), lambda v: f"{v:.3f}s"),
+                _change(metrics["subprocesses"], base.get("subprocesses"), str),
+                _change(metrics["peak_rss_kb"], base.get("peak_rss_kb"), lambda v: f"{v / 1024:.1f} MiB"),
+            )
+    console.print(table)
+
+    if args.update:
+        recorded = dict(baseline["scenarios"])
+        recorded.update(current)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"machine": machine(), "scenarios": dict(sorted(recorded.items()))}, f, indent=2)
+            f.write("\n")
+        console.print(f"[green]Baseline written to {args.baseline}[/green]")
+        return 0
+
+    regressions = compare(current, baseline["scenarios"], args.threshold)
+    for name, message in regressions:
+        console.print(f"[bold red]REGRESSION[/bold red] {name}: {message}")
+    if regressions:
+        return 1
+    console.print(f"[bold green]No regression beyond {args.threshold:.0%}.[/bold green]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
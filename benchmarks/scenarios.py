@@ -0,0 +1,159 @@
+"""
+Synthetic submissions the benchmarks grade.
+
+Every subject gets two trees laid out the way students hand them in:
+
+- ``<subject>-clean``: one flake8-clean, fully typed stub per expected file.
+  The stubs do not implement the subject, so output checks still fail, but
+  every static check, import and script run happens.
+- ``<subject>-broken``: the same files with typical defects (unused imports,
+  long lines, missing type hints, a forbidden ``eval``) so the failure paths
+  and their reports are timed too.
+
+Module 07 is also graded against ``tests/fixtures/python_module_07_golden``,
+the one known-good submission in the repository (``python_module_07-golden``).
+A-Maze-ing has no scenario: it needs a complete maze generator project.
+"""
+import os
+import shutil
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GOLDEN_07 = os.path.join(REPO_ROOT, "tests", "fixtures", "python_module_07_golden")
+
+# Files each subject looks for, relative to the submission root.
+SUBJECT_FILES = {
+    "python_module_00": [
+        f"ex{i}/{name}.py" for i, name in enumerate([
+            "ft_hello_garden", "ft_garden_name", "ft_plot_area", "ft_harvest_total",
+            "ft_plant_age", "ft_water_reminder", "ft_count_harvest_recursive", "ft_seed_inventory",
+        ])
+    ] + ["ex6/ft_count_harvest_iterative.py"],
+    "python_module_01": [
+        f"ex{i}/{name}.py" for i, name in enumerate([
+            "ft_garden_intro", "ft_garden_data", "ft_plant_growth", "ft_plant_factory",
+            "ft_garden_security", "ft_plant_types", "ft_garden_analytics",
+        ])
+    ],
+    "python_module_02": [
+        f"ex{i}/{name}.py" for i, name in enumerate([
+            "ft_first_exception", "ft_raise_exception", "ft_different_errors",
+            "ft_custom_errors", "ft_finally_block",
+        ])
+    ],
+    "python_module_03": [
+        f"ex{i}/{name}.py" for i, name in enumerate([
+            "ft_command_quest", "ft_score_analytics", "ft_coordinate_system", "ft_achievement_tracker",
+            "ft_inventory_system", "ft_data_stream", "ft_data_alchemist",
+        ])
+    ],
+    "python_module_04": [
+        f"ex{i}/{name}.py" for i, name in enumerate([
+            "ft_ancient_text", "ft_archive_creation", "ft_stream_management", "ft_vault_security",
+        ])
+    ],
+    "python_module_05": [
+        f"ex{i}/{name}.py" for i, name in enumerate(["data_processor", "data_stream", "data_pipeline"])
+    ],
+    "python_module_06": [
+        "elements.py",
+        "alchemy/__init__.py",
+        "alchemy/elements.py",
+        "alchemy/potions.py",
+        "alchemy/transmutation/__init__.py",
+        "alchemy/transmutation/recipes.py",
+        "alchemy/grimoire/__init__.py",
+        "alchemy/grimoire/light_spellbook.py",
+        "alchemy/grimoire/light_validator.py",
+        "alchemy/grimoire/dark_spellbook.py",
+        "alchemy/grimoire/dark_validator.py",
+    ] + [
+        f"{name}.py" for name in [
+            "ft_alembic_0", "ft_alembic_1", "ft_alembic_2", "ft_alembic_3", "ft_alembic_4", "ft_alembic_5",
+            "ft_distillation_0", "ft_distillation_1",
+            "ft_transmutation_0", "ft_transmutation_1", "ft_transmutation_2",
+            "ft_kaboom_0", "ft_kaboom_1",
+        ]
+    ],
+    "python_module_07": [
+        "__init__.py",
+        "ex0/__init__.py", "ex0/creatures.py", "ex0/factories.py",
+        "ex1/__init__.py", "ex1/capabilities.py", "ex1/creatures.py", "ex1/factories.py",
+        "ex2/__init__.py", "ex2/strategies.py",
+        "battle.py", "capacitor.py", "tournament.py",
+    ],
+    "python_module_08": ["ex0/construct.py", "ex1/loading.py", "ex2/oracle.py"],
+    "python_module_09": ["ex0/space_station.py", "ex1/alien_contact.py", "ex2/space_crew.py"],
+    "python_module_10": [
+        "ex0/lambda_spells.py", "ex1/higher_magic.py", "ex2/scope_mysteries.py",
+        "ex3/functools_artifacts.py", "ex4/decorator_mastery.py",
+    ],
+}
+
+_CLEAN = '''"""Benchmark stub for {name}."""
+
+
+def {name}() -> None:
+    """Print the exercise name."""
+    print("{name}")
+
+
+def main() -> None:
+    """Run the stub."""
+    {name}()
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+_BROKEN = '''import os, sys
+
+
+def {name}(value, other = None):
+    result = eval("value + 1")
+    print("{name} produced a result that is far too long for a single flake8 line", result)
+    return result
+
+
+if __name__ == "__main__":
+    {name}(41)
+'''
+
+
+def _module_name(path):
+    name = os.path.splitext(os.path.basename(path))[0]
+    return "ft_package" if name == "__init__" else name
+
+
+def _write(root, relpath, content):
+    path = os.path.join(root, relpath)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def build_synthetic(subject, root, broken=False):
+    """Writes the ``clean`` or ``broken`` stub tree for ``subject`` under ``root``."""
+    template = _BROKEN if broken else _CLEAN
+    for relpath in SUBJECT_FILES[subject]:
+        if relpath.endswith("__init__.py") and not broken:
+            _write(root, relpath, '"""Package marker."""\n')
+            continue
+        _write(root, relpath, template.format(name=_module_name(relpath)))
+
+
+def build_golden_07(root):
+    shutil.copytree(
+        GOLDEN_07, root, dirs_exist_ok=True,
+        ignore=shutil.ignore_patterns("__pycache__", "README.md"),
+    )
+
+
+def scenarios():
+    """``{name: (subject, builder)}`` where ``builder(root)`` writes the submission."""
+    found = {}
+    for subject in SUBJECT_FILES:
+        found[f"{subject}-clean"] = (subject, lambda root, s=subject: build_synthetic(s, root))
+        found[f"{subject}-broken"] = (subject, lambda root, s=subject: build_synthetic(s, root, broken=True))
+    found["python_module_07-golden"] = ("python_module_07", build_golden_07)
+    return dict(sorted(found.items()))
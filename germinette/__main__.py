@@ -1,18 +1,17 @@
 import sys
 import os
 import argparse
-import subprocess
-from rich.console import Console
-from rich.panel import Panel
-from germinette.core import GerminetteRunner
 from . import __version__
-from germinette.utils import check_update
 
-console = Console()
+# rich, the runner and the lint backends are imported in main() once the
+# arguments are parsed, so --version / --help / usage errors stay cheap.
+console = None
 REPO_ISSUES_URL = "https://github.com/ExceptedPrism3/germinette/issues"
 
 def update_repo():
     """Updates the local git repository found in configuration."""
+    import subprocess
+
     repo_path = None
     config_file = os.path.expanduser("~/.germinette_repo_path")
     
@@ -72,15 +71,97 @@ def update_germinette():
     except Exception as e:
         console.print(f"[bold red]❌ Update failed:[/bold red] {e}")
 
+def _report_profile(args):
+    """Prints the ``--profile`` tables and writes the ``--profile-trace`` file."""
+    import time
+    from germinette import profiling
+
+    profiler = profiling.profiler
+    wall = time.perf_counter() - profiler.started
+    if args.profile:
+        profiling.print_report(console, profiler.spans, wall, top=args.profile_top)
+        console.print()
+    if args.profile_trace:
+        try:
+            profiling.write_trace(args.profile_trace, profiler.spans, profiler.started)
+        except OSError as e:
+            console.print(f"[bold red]❌ Could not write profile trace:[/bold red] {e}")
+        else:
+            console.print(f"[dim]Profile trace written to {args.profile_trace}[/dim]")
+        console.print()
+
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Germinette - 42 Python Testing Tool")
+    if sys.argv[1:2] == ["batch"]:
+        from germinette import batch
+        sys.exit(batch.main(sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(
+        description="Germinette - 42 Python Testing Tool",
+        epilog="Grade many submissions at once: germinette batch <module> <dir-glob> (see germinette batch --help)",
+    )
     parser.add_argument("module", nargs="?", help="Module to test (e.g., module_00)")
     parser.add_argument("--exercise", "-e", help="Specific exercise to test")
     parser.add_argument("--update", "-u", action="store_true", help="Update Germinette to the latest version")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose / debug printing")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, metavar="N",
+        help="Run independent exercises on N worker processes (report order is unchanged)",
+    )
+    parser.add_argument(
+        "--watch", "-w", action="store_true",
+        help="Keep running: re-grade the exercises affected by each file save and show which verdicts changed",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Re-run every exercise, even those whose files did not change since the last run",
+    )
+    parser.add_argument(
+        "--sweep", type=int, default=0, metavar="N",
+        help="A-Maze-ing: also run the generator on N configs with other SEED / WIDTH / HEIGHT / PERFECT values "
+             "and list the ones whose maze fails the checks (runs --jobs at a time)",
+    )
+    parser.add_argument(
+        "--format", choices=("rich", "jsonl"), default="rich",
+        help="jsonl: stream structured results as JSON Lines on stdout (the report moves to stderr)",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Time every check, script run and import; print per-phase, per-exercise and slowest-operation tables",
+    )
+    parser.add_argument(
+        "--profile-top", type=int, default=10, metavar="N",
+        help="Rows in the --profile slowest-operations table (default: 10)",
+    )
+    parser.add_argument(
+        "--profile-trace", metavar="FILE",
+        help="Also write the timings as a Chrome trace-event JSON file (open in chrome://tracing or Perfetto)",
+    )
     parser.add_argument("--version", "-v", action="version", version=f"germinette {__version__}")
     
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be a positive integer")
+    if args.sweep < 0:
+        parser.error("--sweep must be a non-negative integer")
+    if args.sweep and args.watch:
+        parser.error("--sweep cannot be combined with --watch")
+    if args.profile_top < 1:
+        parser.error("--profile-top must be a positive integer")
+    profiling = args.profile or args.profile_trace
+    if profiling:
+        from germinette.profiling import profiler
+        profiler.enable()
+    if args.format == "jsonl":
+        from germinette import results
+        results.open_stream(sys.stdout)
+        # Everything printed for humans goes to stderr, keeping stdout machine-readable.
+        sys.stdout = sys.stderr
+
+    global console
+    from rich.console import Console
+    from rich.panel import Panel
+    from germinette.utils import UpdateCheck, check_update
+    console = Console()
 
     if args.update:
         # Check updates first
@@ -98,16 +179,17 @@ def main() -> None:
             )
         return
 
-    # Check for updates silently
-    has_update, remote_ver, check_ok = check_update(__version__)
+    # Check for updates in the background; the result is only needed for the footer
+    update_check = UpdateCheck(__version__).start()
     
     banner_text = f"[bold green]🌱 Germinette[/bold green] [dim]v{__version__}[/dim] - [italic]Python Checker for 42[/italic]"
     console.print(Panel.fit(banner_text))
 
-    if has_update:
-        console.print(f"\n[bold yellow]🔔 Update Available: v{remote_ver}[/bold yellow]")
-        console.print("[dim]Run 'germinette --update' to get the latest features![/dim]\n")
+    from germinette.core import GerminetteRunner
+    from germinette import lint, pycache
 
+    # Student imports and scripts must not leave __pycache__ in the submission.
+    pycache.setup()
     runner = GerminetteRunner()
     run_outcome = None  # True = all exercises OK, False = failures, None = no test run
 
@@ -131,15 +213,35 @@ def main() -> None:
                      os.chdir(abs_path)
                      console.print(f"[bold blue]Switched working directory to:[/bold blue] {abs_path}")
             
-            run_outcome = runner.run_module(module_name_extracted, args.exercise, verbose=args.verbose)
+            if args.watch:
+                from germinette import watch
+                run_outcome = watch.watch(
+                    runner, module_name_extracted, args.exercise, verbose=args.verbose, jobs=args.jobs, force=args.force
+                )
+            else:
+                run_outcome = runner.run_module(
+                    module_name_extracted, args.exercise, verbose=args.verbose, jobs=args.jobs, force=args.force,
+                    sweep=args.sweep,
+                )
+        elif args.watch:
+            from germinette import watch
+            run_outcome = watch.watch(runner, None, verbose=args.verbose, jobs=args.jobs, force=args.force)
         else:
             # interactive mode or auto-detect
-            run_outcome = runner.interactive_menu(verbose=args.verbose)
+            run_outcome = runner.interactive_menu(
+                verbose=args.verbose, jobs=args.jobs, force=args.force, sweep=args.sweep
+            )
     finally:
-        # Cleanup __pycache__
+        # Cleanup __pycache__, stop the mypy daemon and trim the result cache
         GerminetteRunner.cleanup_pycache()
+        lint.shutdown()
+        lint.result_cache.prune()
+        pycache.prune()
         console.print()
 
+        if profiling and run_outcome is not None:
+            _report_profile(args)
+
         if run_outcome is True:
             console.print(
                 Panel.fit(
@@ -175,6 +277,7 @@ def main() -> None:
 
         # Version / update reminder (last thing on screen)
         console.print()
+        has_update, remote_ver, check_ok = update_check.result()
         if has_update:
             console.print(
                 Panel.fit(
@@ -0,0 +1,328 @@
+"""
+``germinette batch <module> <dir-glob>``: grade many submissions in one run.
+
+Every directory matching the glob is graded by the module's ``Tester`` in its
+own forked process (cwd set to the submission, private ``TMPDIR``, console
+output captured), at most ``--jobs`` at a time. The parent imports the
+checker once before forking, so each submission starts warm, and a
+submission that hangs is killed after ``--timeout`` seconds, together with
+everything it started in its process group, without holding up the others.
+One line is printed per finished submission, followed by a summary table.
+"""
+import argparse
+import glob
+import importlib
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import time
+
+DEFAULT_TIMEOUT = 600
+
+
+def discover(pattern):
+    """Directories matching ``pattern`` (``**`` allowed), sorted and de-duplicated."""
+    seen = set()
+    found = []
+    for match in sorted(glob.glob(os.path.expanduser(pattern), recursive=True)):
+        if not os.path.isdir(match):
+            continue
+        real = os.path.realpath(match)
+        if real in seen:
+            continue
+        seen.add(real)
+        found.append(match)
+    return found
+
+
+def _log_name(submission):
+    path = os.path.relpath(os.path.abspath(submission))
+    if path.startswith(os.pardir):
+        path = os.path.abspath(submission).lstrip(os.sep)
+    return path.replace(os.sep, "__") + ".log"
+
+
+def _grade(module_name, submission, exercise, verbose, result_path):
+    """Child process: grades one submission and writes its result as JSON."""
+    from germinette import lint, pycache, results, script_pool
+    from germinette.core import GerminetteRunner, _CapturedStream
+
+    _own_group(0)
+    started = time.monotonic()
+    abs_path = os.path.abspath(submission)
+    workdir = tempfile.mkdtemp(prefix="germinette-batch-")
+    os.environ["TMPDIR"] = workdir
+    tempfile.tempdir = workdir
+    # One dmypy daemon per submission would cost more than it saves.
+    os.environ["GERMINETTE_NO_LINT_DAEMON"] = "1"
+    results.set_context(submission=submission)
+
+    result = {"submission": submission, "status": "error", "ok": 0, "ko": 0, "failed": [], "log": ""}
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    out = _CapturedStream(real_stdout)
+    sys.stdout = sys.stderr = out
+    try:
+        os.chdir(abs_path)
+        pycache.setup()
+        pycache.prime()
+        tester = importlib.import_module(f"germinette.subjects.{module_name}").Tester()
+        tester.verbose = verbose
+        tester.jobs = 1
+        tester.run(exercise)
+        errors = getattr(tester, "grouped_errors", {}) or {}
+        result.update(
+            status="fail" if errors else "pass",
+            ok=getattr(tester, "ok_count", 0),
+            ko=getattr(tester, "ko_count", 0),
+            failed=list(errors),
+        )
+    except BaseException as e:
+        import traceback
+
+        traceback.print_exc()
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        sys.stdout, sys.stderr = real_stdout, real_stderr
+        GerminetteRunner.cleanup_pycache(abs_path)
+        script_pool.pool.close()
+        lint.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    result["log"] = out.getvalue()
+    result["duration"] = time.monotonic() - started
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+
+
+def _own_group(pid):
+    """Makes ``pid`` (0: this process) lead its own process group; set from both sides of the fork."""
+    try:
+        os.setpgid(pid, 0)
+    except (AttributeError, OSError):
+        pass
+
+
+def _kill(process):
+    """SIGKILLs a grader and its process group (make, lint tools, anything else it started there)."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, OSError):
+        process.kill()
+
+
+def run_batch(module_name, submissions, jobs=1, exercise=None, verbose=False, timeout=DEFAULT_TIMEOUT,
+              on_result=None):
+    """
+    Grades ``submissions`` on up to ``jobs`` processes; returns their results in input order.
+
+    Each result is a dict with ``submission``, ``status`` (``pass``, ``fail``,
+    ``error`` or ``timeout``), ``ok`` / ``ko`` check counts, ``failed`` exercise
+    labels, ``duration`` and the captured ``log``. ``on_result`` is called with
+    each result as soon as its submission finishes.
+    """
+    from multiprocessing.connection import wait
+
+    # Import the checker (and everything it pulls in) once, before forking.
+    importlib.import_module(f"germinette.subjects.{module_name}")
+    context = multiprocessing.get_context("fork" if hasattr(os, "fork") else "spawn")
+    results = [None] * len(submissions)
+    pending = list(enumerate(submissions))
+    running = {}  # sentinel -> (index, process, result_path, deadline, started)
+    result_dir = tempfile.mkdtemp(prefix="germinette-batch-results-")
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        while pending or running:
+            while pending and len(running) < jobs:
+                index, submission = pending.pop(0)
+                result_path = os.path.join(result_dir, f"{index}.json")
+                process = context.Process(
+                    target=_grade, args=(module_name, submission, exercise, verbose, result_path), daemon=True
+                )
+                started = time.monotonic()
+                process.start()
+                _own_group(process.pid)
+                running[process.sentinel] = (index, process, result_path, started + timeout, started)
+
+            now = time.monotonic()
+            next_deadline = min(entry[3] for entry in running.values())
+            ready = wait(list(running), timeout=max(0.0, next_deadline - now))
+            now = time.monotonic()
+            for sentinel in list(running):
+                index, process, result_path, deadline, started = running[sentinel]
+                if sentinel not in ready and now < deadline:
+                    continue
+                del running[sentinel]
+                if sentinel not in ready:
+                    _kill(process)
+                process.join()
+                result = _read_result(result_path)
+                if result is None:
+                    timed_out = sentinel not in ready
+                    result = {
+                        "submission": submissions[index],
+                        "status": "timeout" if timed_out else "error",
+                        "ok": 0, "ko": 0, "failed": [], "log": "",
+                        "duration": now - started,
+                        "error": f"killed after {timeout:g} seconds" if timed_out
+                        else f"grader exited with code {process.exitcode}",
+                    }
+                results[index] = result
+                if on_result is not None:
+                    on_result(result)
+    finally:
+        for index, process, *_ in running.values():
+            _kill(process)
+            process.join()
+        shutil.rmtree(result_dir, ignore_errors=True)
+    return results
+
+
+def _read_result(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+_STATUS_STYLES = {
+    "pass": "[bold green]PASS[/bold green]",
+    "fail": "[bold red]FAIL[/bold red]",
+    "error": "[bold yellow]ERROR[/bold yellow]",
+    "timeout": "[bold magenta]TIMEOUT[/bold magenta]",
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="germinette batch",
+        description="Grade every submission directory matching a glob with one module checker.",
+    )
+    parser.add_argument("module", help="Module checker to use (e.g., python_module_00)")
+    parser.add_argument("pattern", metavar="dir-glob", help="Submission directories, e.g. 'cohort/*/python_module_00'")
+    parser.add_argument("--exercise", "-e", help="Specific exercise to test")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=os.cpu_count() or 1, metavar="N",
+        help="Submissions graded concurrently (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=DEFAULT_TIMEOUT, metavar="SECONDS",
+        help=f"Kill a submission's grader after this long (default: {DEFAULT_TIMEOUT})",
+    )
+    parser.add_argument("--log-dir", metavar="DIR", help="Save each submission's full report to DIR")
+    parser.add_argument(
+        "--format", choices=("rich", "jsonl"), default="rich",
+        help="jsonl: stream structured results as JSON Lines on stdout (the report moves to stderr)",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose / debug printing")
+    return parser
+
+
+def main(argv):
+    """Entry point for ``germinette batch``; returns the process exit code."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be a positive integer")
+    if args.timeout <= 0:
+        parser.error("--timeout must be positive")
+
+    from germinette import results
+
+    if args.format != "jsonl":
+        return _main(args)
+    results.open_stream(sys.stdout)
+    try:
+        return _main(args)
+    finally:
+        results.close_stream()
+
+
+def _main(args):
+    from rich.console import Console
+    from rich.markup import escape
+    from rich.table import Table
+    from germinette import results
+    from germinette.core import GerminetteRunner
+
+    # With --format jsonl stdout carries the records; the human report goes to stderr.
+    console = Console(stderr=args.format == "jsonl")
+    try:
+        importlib.import_module(f"germinette.subjects.{args.module}")
+    except ModuleNotFoundError as e:
+        if e.name != f"germinette.subjects.{args.module}":
+            raise
+        import difflib
+
+        available = GerminetteRunner().list_modules() + ["a_maze_ing"]
+        console.print(f"[bold red]❌ Module '{escape(args.module)}' not found![/bold red]")
+        matches = difflib.get_close_matches(args.module, available, n=1, cutoff=0.6)
+        if matches:
+            console.print(f"\n[green]Did you mean [bold]{matches[0]}[/bold]?[/green]")
+        return 2
+
+    submissions = discover(args.pattern)
+    if not submissions:
+        console.print(f"[bold red]No submission directories match[/bold red] {escape(args.pattern)}")
+        return 2
+    if args.log_dir:
+        os.makedirs(args.log_dir, exist_ok=True)
+
+    jobs = min(args.jobs, len(submissions))
+    console.print(
+        f"[bold]Grading {len(submissions)} submission(s) with {args.module}[/bold] "
+        f"[dim]({jobs} job(s), timeout {args.timeout:g}s)[/dim]"
+    )
+    width = len(str(len(submissions)))
+    done = 0
+
+    def report(result):
+        nonlocal done
+        done += 1
+        results.emit("submission", **{k: v for k, v in result.items() if k != "log"})
+        if args.log_dir:
+            with open(os.path.join(args.log_dir, _log_name(result["submission"])), "w", encoding="utf-8") as f:
+                f.write(result.get("log", ""))
+                if result.get("error"):
+                    f.write(f"\n{result['error']}\n")
+        console.print(
+            f"[dim][{done:>{width}}/{len(submissions)}][/dim] {_STATUS_STYLES[result['status']]} "
+            f"{escape(result['submission'])} [dim]({result['duration']:.1f}s)[/dim]"
+        )
+
+    started = time.monotonic()
+    graded = run_batch(
+        args.module, submissions, jobs=jobs, exercise=args.exercise, verbose=args.verbose,
+        timeout=args.timeout, on_result=report,
+    )
+    elapsed = time.monotonic() - started
+
+    table = Table(title=f"{args.module} — batch summary")
+    table.add_column("Submission", overflow="fold")
+    table.add_column("Result")
+    table.add_column("KO", justify="right")
+    table.add_column("Failed exercises", overflow="fold")
+    table.add_column("Time", justify="right")
+    for result in graded:
+        table.add_row(
+            escape(result["submission"]),
+            _STATUS_STYLES[result["status"]],
+            str(result["ko"]),
+            escape(", ".join(result["failed"]) or result.get("error", "")),
+            f"{result['duration']:.1f}s",
+        )
+    console.print()
+    console.print(table)
+
+    counts = {status: sum(1 for r in graded if r["status"] == status) for status in _STATUS_STYLES}
+    console.print(
+        f"[bold]{len(graded)} submission(s)[/bold] in {elapsed:.1f}s "
+        f"({len(graded) / elapsed if elapsed else 0:.1f}/s): "
+        + ", ".join(f"{_STATUS_STYLES[s]} {n}" for s, n in counts.items() if n)
+    )
+    return 0 if counts["pass"] == len(graded) else 1
@@ -0,0 +1,142 @@
+"""
+On-disk result cache for the style and type checks.
+
+Entries live under ``~/.cache/germinette/results`` as small JSON files named by
+a SHA-256 key (file contents + germinette / tool versions + checker config), so
+an unchanged file gets its diagnostics back without re-running the checkers.
+A hit refreshes the entry's mtime; ``prune()`` then evicts the least recently
+used entries once the directory grows past ``max_bytes``.
+
+Set ``GERMINETTE_NO_CACHE=1`` to bypass the cache entirely.
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+from germinette import __version__
+from germinette.utils import user_cache_dir
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# path -> ((mtime_ns, size), sha256 hex digest)
+_file_digests = {}
+
+
+def file_digest(path):
+    """SHA-256 of a file's bytes, memoized on (mtime, size); None if unreadable."""
+    try:
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size)
+        memo = _file_digests.get(path)
+        if memo and memo[0] == signature:
+            return memo[1]
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+    _file_digests[path] = (signature, digest)
+    return digest
+
+
+class ResultCache:
+    """LRU-evicted, size-capped store of JSON-serializable check results."""
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self):
+        return os.environ.get("GERMINETTE_NO_CACHE", "").strip() in ("", "0")
+
+    @staticmethod
+    def key(*parts):
+        """Builds a cache key from string parts (the germinette version is always included)."""
+        h = hashlib.sha256()
+        for part in (__version__,) + parts:
+            data = str(part).encode("utf-8", "surrogateescape")
+            h.update(len(data).to_bytes(8, "little"))
+            h.update(data)
+        return h.hexdigest()
+
+    def _root(self):
+        if self.directory is None:
+            self.directory = user_cache_dir("results")
+        return self.directory
+
+    def _entry_path(self, key):
+        return os.path.join(self._root(), key[:2], key[2:] + ".json")
+
+    def contains(self, key):
+        """True when ``key`` has an entry (does not count as a hit or refresh it)."""
+        return bool(key) and self.enabled and os.path.exists(self._entry_path(key))
+
+    def lookup(self, key):
+        """Returns ``(True, value)`` on a hit, ``(False, None)`` otherwise."""
+        if not key or not self.enabled:
+            return False, None
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)["value"]
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, value
+
+    def store(self, key, value):
+        """Saves ``value`` under ``key``; failures are ignored (the cache is best effort)."""
+        if not key or not self.enabled:
+            return
+        path = self._entry_path(key)
+        tmp = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"value": value}, f)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            if tmp and os.path.exists(tmp):
+                os.remove(tmp)
+
+    def prune(self):
+        """Evicts least recently used entries until the cache fits in ``max_bytes``."""
+        if not self.enabled or self.directory is None:
+            return
+        prune_dir(self.directory, self.max_bytes)
+
+
+def prune_dir(directory, max_bytes):
+    """Removes the least recently written files under ``directory`` once they total more than ``max_bytes``."""
+    entries = []
+    total = 0
+    for dirpath, _, filenames in os.walk(directory):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+    if total <= max_bytes:
+        return
+    # Evict down to 80% of the cap so the next runs do not prune again right away.
+    target = max_bytes * 0.8
+    for _, size, path in sorted(entries):
+        if total <= target:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+result_cache = ResultCache()
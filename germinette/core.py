@@ -1,12 +1,18 @@
+import functools
+import io
 import os
 import re
 import sys
+import time
 import importlib
 from pathlib import Path
 from urllib.parse import quote
 from rich.console import Console
 from rich.markup import escape
 from rich.panel import Panel
+from germinette import incremental, pycache, results, strict_rules
+from germinette.profiling import profiler, timed
+from germinette.source_index import source_index
 
 console = Console()
 
@@ -158,25 +164,75 @@ class ModuleDetector:
         },
     }
 
+    # Detections by directory fingerprint (see ``_listing``).
+    _cache = {}
+    _CACHE_SIZE = 64
+
     @classmethod
-    def detect(cls):
-        """Scans current directory and returns the best detected module or None.
+    def _signature_dirs(cls):
+        """Subdirectories named by any signature: the only ones worth listing."""
+        dirs = set()
+        for signature in cls.MODULE_SIGNATURES.values():
+            dirs.update(signature.get("dirs", []))
+            dirs.update(p.split("/", 1)[0] for p in signature.get("files", []) if "/" in p)
+        return dirs
 
-        Detection is score-based to avoid false positives when different modules
-        share generic folder layouts (for example, ex0/ex1/ex2).
+    @classmethod
+    def _listing(cls, cwd):
+        """``([(name, is_dir)], fingerprint)`` of ``cwd`` from one ``os.scandir`` pass.
+
+        The fingerprint holds the top-level listing and the modification times
+        of ``cwd`` and of its signature subdirectories, which change whenever an
+        entry is added to or removed from them.
         """
-        cwd = os.getcwd()
+        wanted = cls._signature_dirs()
+        try:
+            with os.scandir(cwd) as entries:
+                top = []
+                stamps = []
+                for entry in entries:
+                    is_dir = entry.is_dir()
+                    top.append((entry.name, is_dir))
+                    if is_dir and entry.name in wanted:
+                        stamps.append((entry.name, entry.stat().st_mtime_ns))
+            stamps.append((".", os.stat(cwd).st_mtime_ns))
+        except OSError:
+            return [], None
+        return top, (os.path.abspath(cwd), tuple(sorted(top)), tuple(sorted(stamps)))
 
-        best_mod = None
-        best_score = 0.0
-        best_reason = None
+    @classmethod
+    def scan(cls, cwd, top=None):
+        """Snapshot of ``cwd`` for ``match``: ``(paths, dirs)`` as ``/``-separated relative paths.
+
+        Lists ``cwd`` and only the subdirectories some signature mentions.
+        """
+        if top is None:
+            top, _ = cls._listing(cwd)
+        wanted = cls._signature_dirs()
+        paths = {name for name, _ in top}
+        dirs = {name for name, is_dir in top if is_dir}
+        for name in sorted(dirs & wanted):
+            try:
+                with os.scandir(os.path.join(cwd, name)) as entries:
+                    paths.update(f"{name}/{entry.name}" for entry in entries)
+            except OSError:
+                pass
+        return frozenset(paths), frozenset(dirs)
 
+    @classmethod
+    def match(cls, paths, dirs):
+        """Scores every signature against a ``scan`` snapshot; returns a ``Detection`` or None.
+
+        Detection is score-based to avoid false positives when different modules
+        share generic folder layouts (for example, ex0/ex1/ex2).
+        """
+        scores = []
         for mod_name, signature in cls.MODULE_SIGNATURES.items():
             files = signature.get("files", [])
-            dirs = signature.get("dirs", [])
+            sig_dirs = signature.get("dirs", [])
 
-            matched_files = [p for p in files if os.path.exists(os.path.join(cwd, p))]
-            matched_dirs = [d for d in dirs if os.path.isdir(os.path.join(cwd, d))]
+            matched_files = [p for p in files if p in paths]
+            matched_dirs = [d for d in sig_dirs if d in dirs]
 
             file_hits = len(matched_files)
             dir_hits = len(matched_dirs)
@@ -184,22 +240,72 @@ class ModuleDetector:
                 continue
 
             file_ratio = file_hits / max(1, len(files))
-            dir_ratio = dir_hits / max(1, len(dirs))
+            dir_ratio = dir_hits / max(1, len(sig_dirs))
 
             # Files are highly distinctive; directories are secondary hints.
             score = (file_hits * 10.0) + (dir_hits * 2.0) + file_ratio + (dir_ratio * 0.5)
+            # Share of the signature present; ``x.py`` and ``ex0/x.py`` are alternatives.
+            expected = {p.rsplit("/", 1)[-1] for p in files}
+            found = {p.rsplit("/", 1)[-1] for p in matched_files}
+            coverage = (len(found) * 10.0 + dir_hits * 2.0) / (len(expected) * 10.0 + len(sig_dirs) * 2.0)
+            reason = matched_files[0] if matched_files else matched_dirs[0]
+            scores.append((score, mod_name, coverage, reason))
+
+        if not scores:
+            return None
+        # Highest score wins; ties go to the module declared first.
+        best = max(scores, key=lambda item: item[0])
+        runner_up = max((item[0] for item in scores if item is not best), default=0.0)
+        score, mod_name, coverage, reason = best
+        # Discounted when another module matches almost as well.
+        confidence = coverage * (0.5 + 0.5 * (score - runner_up) / score)
+        return Detection(mod_name, round(confidence, 3), reason, score)
 
-            if score > best_score:
-                best_score = score
-                best_mod = mod_name
-                best_reason = matched_files[0] if matched_files else matched_dirs[0]
+    @classmethod
+    def detect_with_confidence(cls, cwd=None):
+        """The best ``Detection`` for ``cwd`` (default: the current directory), or None.
 
-        if best_mod is not None:
-            reason = best_reason if best_reason is not None else "signature score"
-            console.print(f"[bold green]Detected {best_mod} based on {reason}[/bold green]")
-            return best_mod
+        Results are cached per directory fingerprint: on an unchanged directory
+        only ``cwd`` itself is listed again.
+        """
+        cwd = cwd or os.getcwd()
+        top, fingerprint = cls._listing(cwd)
+        if fingerprint is not None and fingerprint in cls._cache:
+            return cls._cache[fingerprint]
+        detection = cls.match(*cls.scan(cwd, top))
+        if fingerprint is not None:
+            if len(cls._cache) >= cls._CACHE_SIZE:
+                cls._cache.clear()
+            cls._cache[fingerprint] = detection
+        return detection
+
+    @classmethod
+    def detect(cls):
+        """Scans current directory and returns the best detected module or None."""
+        detection = cls.detect_with_confidence()
+        if detection is None:
+            return None
+        console.print(f"[bold green]Detected {detection.module} based on {detection.reason}[/bold green]")
+        return detection.module
+
+
+class Detection:
+    """Outcome of ``ModuleDetector.detect_with_confidence``.
+
+    ``confidence`` (0 to 1) is the share of the module's signature found in the
+    directory, lowered when another module scores nearly as high; ``reason`` is
+    the first matching file (or directory) and ``score`` the raw signature score.
+    """
+
+    def __init__(self, module, confidence, reason, score):
+        self.module = module
+        self.confidence = confidence
+        self.reason = reason
+        self.score = score
+
+    def __repr__(self):
+        return f"Detection({self.module!r}, confidence={self.confidence})"
 
-        return None
 
 class GerminetteRunner:
     def __init__(self):
@@ -213,12 +319,12 @@ class GerminetteRunner:
                     modules.append(f[:-3])
         return sorted(modules)
 
-    def interactive_menu(self, verbose=False):
+    def interactive_menu(self, verbose=False, jobs=1, force=False, sweep=0):
         # Auto-detect first
         detected = ModuleDetector.detect()
         if detected:
             console.print(f"Auto-running tests for [bold cyan]{detected}[/bold cyan]...")
-            return self.run_module(detected, verbose=verbose)
+            return self.run_module(detected, verbose=verbose, jobs=jobs, force=force, sweep=sweep)
 
         modules = self.list_modules()
         if not modules:
@@ -238,37 +344,55 @@ class GerminetteRunner:
 
     @staticmethod
     def cleanup_pycache(root_dir=None):
-        """Recursively removes __pycache__ directories."""
-        if root_dir is None:
-            root_dir = os.getcwd()
-        
-        for dirpath, dirnames, filenames in os.walk(root_dir):
-            if "__pycache__" in dirnames:
-                cache_path = os.path.join(dirpath, "__pycache__")
-                try:
-                    import shutil
-                    shutil.rmtree(cache_path)
-                    # console.print(f"[dim]Cleaned: {cache_path}[/dim]")
-                except Exception as e:
-                    pass
-            # Don't walk into __pycache__ (though we just deleted it)
-            if "__pycache__" in dirnames:
-                dirnames.remove("__pycache__")
-
-    def run_module(self, module_name, exercise=None, verbose=False):
+        """Removes the __pycache__ directories germinette created (see ``germinette.pycache``)."""
+        pycache.cleanup(root_dir)
+
+    def run_module(self, module_name, exercise=None, verbose=False, jobs=1, force=False, quiet_replay=False, sweep=0):
         """
         Run tests for a subject module.
 
+        Exercises whose inputs did not change since the last run replay their
+        cached verdict unless ``force`` is set (see ``germinette.incremental``);
+        ``quiet_replay`` replays them without printing their output again.
+        ``sweep`` is the number of generated configs of ``--sweep`` (A-Maze-ing).
+
         Returns:
             True: tests ran and nothing was recorded in grouped_errors.
             False: tests ran but at least one error was recorded (or no grouped_errors attr).
             None: module could not be loaded or run (missing module, invalid Tester, etc.).
         """
+        started = time.perf_counter()
+        self.tester = None
+        results.emit("run_start", module=module_name, exercise=exercise)
+        outcome = None
+        try:
+            outcome = self._run_module(module_name, exercise, verbose, jobs, force, quiet_replay, sweep)
+            return outcome
+        finally:
+            errors = getattr(self.tester, "grouped_errors", None) or {}
+            results.emit(
+                "run_end",
+                module=module_name,
+                status={True: "pass", False: "fail"}.get(outcome, "error"),
+                errors=sum(len(messages) for messages in errors.values()),
+                failed=list(errors),
+                duration=round(time.perf_counter() - started, 6),
+            )
+
+    def _run_module(self, module_name, exercise, verbose, jobs, force=False, quiet_replay=False, sweep=0):
         try:
             # Dynamically import the module checker
             mod = importlib.import_module(f"germinette.subjects.{module_name}")
             tester = getattr(mod, "Tester")()
+            self.tester = tester
             tester.verbose = verbose
+            tester.jobs = jobs
+            tester.reuse_verdicts = not force
+            tester.quiet_replay = quiet_replay
+            tester.sweep = sweep
+            if sweep and not hasattr(tester, "test_seed_sweep"):
+                console.print("[yellow]--sweep only applies to A-Maze-ing; ignored for this module.[/yellow]")
+            pycache.prime()
             tester.run(exercise)
             ge = getattr(tester, "grouped_errors", None)
             if isinstance(ge, dict):
@@ -299,13 +423,235 @@ class GerminetteRunner:
             traceback.print_exc()
             return None
 
+class _CapturedStream(io.StringIO):
+    """Buffers writes while reporting the terminal traits of the real stream.
+
+    Rich decides on colors / hyperlinks by asking the stream whether it is a
+    TTY, so the buffered output of a worker matches what a serial run prints.
+    """
+
+    def __init__(self, real_stream):
+        super().__init__()
+        self._real_stream = real_stream
+
+    def isatty(self):
+        try:
+            return self._real_stream.isatty()
+        except Exception:
+            return False
+
+    @property
+    def encoding(self):
+        return getattr(self._real_stream, "encoding", "utf-8")
+
+
+class _TeeStream(_CapturedStream):
+    """Writes through to the real stream while keeping a copy (replayed by incremental runs)."""
+
+    def write(self, s):
+        self._real_stream.write(s)
+        return super().write(s)
+
+    def flush(self):
+        self._real_stream.flush()
+
+
+# Tester whose exercises the forked workers run (inherited through fork, never pickled).
+_PARALLEL_TESTER = None
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _run_exercise_in_worker(index):
+    """Runs one exercise of ``_PARALLEL_TESTER`` and returns its buffered results."""
+    tester = _PARALLEL_TESTER
+    _, func = tester._parallel_exercises[index]
+    tester.grouped_errors = {}
+    tester.ok_count = 0
+    tester.ko_count = 0
+    tester.verdicts = {}
+    tester.replayed = set()
+    # Spans copied from the parent at fork time are already in its list.
+    profiler.take()
+
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    out = _CapturedStream(real_stdout)
+    err = _CapturedStream(real_stderr)
+    sys.stdout, sys.stderr = out, err
+    try:
+        tester._run_exercise(func)
+    finally:
+        sys.stdout, sys.stderr = real_stdout, real_stderr
+    return (out.getvalue(), err.getvalue(), tester.grouped_errors, tester.ok_count, tester.ko_count,
+            profiler.take(), tester.verdicts, tester.replayed)
+
+
+def _timed_check(check):
+    """Remembers which check ran last, on which file and for how long (for result records and ``--profile``)."""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, path, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                with profiler.span(check, f"{method.__name__}({os.path.basename(str(path))})"):
+                    return method(self, path, *args, **kwargs)
+            finally:
+                self._last_check = {
+                    "check": check,
+                    "file": path,
+                    "duration": round(time.perf_counter() - started, 6),
+                }
+        return wrapper
+    return decorate
+
+
+# Defaults for every student script run (see ``ScriptRunner``).
+SCRIPT_TIMEOUT = 10
+SCRIPT_CPU_SECONDS = 20
+SCRIPT_MEMORY_BYTES = 4 * 1024 ** 3
+SCRIPT_MAX_OUTPUT_BYTES = 4 * 1024 ** 2
+# Cap on any single file a script writes (stdout / stderr included); well above any maze.
+SCRIPT_MAX_FILE_BYTES = 256 * 1024 ** 2
+
+# Prefix of the note appended to stderr when a run is stopped; ``check_for_crash`` looks for it.
+SCRIPT_STOPPED_PREFIX = "Error: Script execution "
+
+
+class ScriptResult:
+    """Outcome of one ``ScriptRunner.run`` call.
+
+    ``killed_by`` is None for a normal exit, otherwise one of ``"timeout"``,
+    ``"cpu"``, ``"memory"``, ``"output"``, ``"file"`` or ``"signal"``; a matching
+    ``Error: Script execution ...`` line is then appended to ``stderr``.
+    """
+
+    def __init__(self, args, returncode, stdout, stderr, duration=0.0,
+                 peak_rss_kb=None, cpu_seconds=None, killed_by=None, truncated=False):
+        self.args = args
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.duration = duration
+        self.peak_rss_kb = peak_rss_kb
+        self.cpu_seconds = cpu_seconds
+        self.killed_by = killed_by
+        self.truncated = truncated
+
+    @property
+    def output(self):
+        return self.stdout + self.stderr
+
+
+class ScriptRunner:
+    """Runs student scripts with a wall-clock timeout, CPU / address-space / file-size rlimits and capped output.
+
+    Every subject goes through ``BaseTester.script_runner`` so a pathological
+    submission (infinite loop, runaway allocation, endless printing) is stopped
+    instead of hanging the grading run.
+    """
+
+    def __init__(self, timeout=SCRIPT_TIMEOUT, cpu_seconds=SCRIPT_CPU_SECONDS,
+                 memory_bytes=SCRIPT_MEMORY_BYTES, max_output_bytes=SCRIPT_MAX_OUTPUT_BYTES,
+                 max_file_bytes=SCRIPT_MAX_FILE_BYTES):
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_bytes = memory_bytes
+        self.max_output_bytes = max_output_bytes
+        self.max_file_bytes = max_file_bytes
+
+    def _limits(self):
+        limits = {}
+        if self.cpu_seconds:
+            # SIGXCPU at the soft limit, SIGKILL one second later if it is handled.
+            limits["RLIMIT_CPU"] = (int(self.cpu_seconds), int(self.cpu_seconds) + 1)
+        if self.memory_bytes:
+            limits["RLIMIT_AS"] = (self.memory_bytes, self.memory_bytes)
+        if self.max_file_bytes:
+            # Writes past the cap fail (EFBIG), so endless printing stops eventually. Output
+            # itself is cut at ``max_output_bytes`` when read back, not here: the limit applies
+            # to every file, and a large maze written to OUTPUT_FILE is legitimate.
+            limits["RLIMIT_FSIZE"] = (self.max_file_bytes, self.max_file_bytes)
+        return limits
+
+    @timed("script")
+    def run(self, cmd, cwd=None, input=None, env=None, timeout=None):
+        """
+        Runs ``cmd`` (``[sys.executable, script, *args]``) and returns a ``ScriptResult``.
+
+        ``timeout`` overrides the runner's wall-clock limit for this call. Stdin
+        is empty unless ``input`` is given. Never raises on timeout or limits.
+        """
+        import errno
+        import signal
+        from germinette import script_pool
+
+        timeout = self.timeout if timeout is None else timeout
+        with incremental.script_run(cmd, cwd) as traced:
+            raw = script_pool.run(
+                cmd, cwd=cwd, input=input, timeout=timeout, env=env,
+                limits=self._limits(), max_output_bytes=self.max_output_bytes, trace=traced is not None,
+            )
+            if traced is not None:
+                traced["opened"] = raw.opened
+        rc = raw.returncode
+        stderr_tail = raw.stderr.rstrip().rsplit("\n", 1)[-1]
+        killed_by, note = None, None
+        if raw.timed_out:
+            killed_by, note = "timeout", f"timed out after {timeout:g} seconds."
+        elif self.cpu_seconds and (rc == -signal.SIGXCPU or (
+                rc == -signal.SIGKILL and (raw.cpu_seconds or 0) >= self.cpu_seconds)):
+            # SIGKILL: the script handled SIGXCPU and ran into the hard limit.
+            killed_by, note = "cpu", f"exceeded the CPU time limit ({self.cpu_seconds:g} seconds)."
+        elif raw.truncated:
+            killed_by, note = "output", f"produced more than {self.max_output_bytes} bytes of output; the rest was discarded."
+        elif self.max_file_bytes and (rc == -signal.SIGXFSZ or (
+                rc != 0 and stderr_tail.startswith(f"OSError: [Errno {errno.EFBIG}]"))):
+            # Python ignores SIGXFSZ, so the write raises EFBIG instead.
+            killed_by, note = "file", (
+                f"wrote a file larger than the file-size limit ({self.max_file_bytes // 1024 ** 2} MiB)."
+            )
+        elif self.memory_bytes and rc != 0 and stderr_tail.startswith("MemoryError"):
+            killed_by, note = "memory", f"exceeded the memory limit ({self.memory_bytes // 1024 ** 2} MiB)."
+        elif rc < 0:
+            try:
+                name = signal.Signals(-rc).name
+            except ValueError:
+                name = f"signal {-rc}"
+            killed_by, note = "signal", f"was killed by {name}."
+
+        stderr = raw.stderr
+        if note:
+            stderr += ("" if not stderr or stderr.endswith("\n") else "\n") + SCRIPT_STOPPED_PREFIX + note + "\n"
+        return ScriptResult(
+            args=cmd,
+            returncode=rc,
+            stdout=raw.stdout,
+            stderr=stderr,
+            duration=raw.duration,
+            peak_rss_kb=raw.maxrss_kb,
+            cpu_seconds=raw.cpu_seconds,
+            killed_by=killed_by,
+            truncated=raw.truncated,
+        )
+
+
 class BaseTester:
+    # Shared by every subject; see ``ScriptRunner``.
+    script_runner = ScriptRunner()
+
     def __init__(self):
         self.exercises = []
         self.grouped_errors = {}
         self.ok_count = 0
         self.ko_count = 0
         self.title = ""
+        self.jobs = 1
+        self._lint_results = {}
 
     def record_error(self, exercise_label, error_type, message):
         """Records an error grouped by exercise label."""
@@ -314,7 +660,24 @@ class BaseTester:
         if exercise_label not in self.grouped_errors:
             self.grouped_errors[exercise_label] = []
         self.grouped_errors[exercise_label].append(f"[bold]{error_type}[/bold]\n{message}")
+        recorded = getattr(self, '_recorded_errors', None)
+        if recorded is not None:
+            recorded.append([exercise_label, error_type, message, getattr(self, '_last_check', None)])
         self.mark_ko()
+        if results.enabled():
+            text = results.plain(message)
+            file, line = results.location(text)
+            last = getattr(self, '_last_check', None) or {}
+            results.emit(
+                "result",
+                exercise=exercise_label,
+                check=results.check_id(error_type),
+                severity="error",
+                message=text,
+                file=file or last.get("file"),
+                line=line,
+                duration=last.get("duration"),
+            )
 
     def mark_ok(self):
         self.ok_count = getattr(self, 'ok_count', 0) + 1
@@ -347,6 +710,98 @@ class BaseTester:
             else:
                 console.print(f"[bold green]✨ All checks passed![/bold green]")
 
+    def _exercise_name(self, func):
+        return next((n for n, f in getattr(self, 'exercises', []) if f == func), getattr(func, "__name__", "?"))
+
+    def _record_crash(self, name, exc):
+        """Records exercise ``name`` as KO because its check raised ``exc``, with the formatted traceback."""
+        import traceback
+
+        text = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__)).rstrip()
+        console.print(f"[bold red]✘ {escape(name)}: the check itself raised {escape(type(exc).__name__)}[/bold red]")
+        self.record_error(name, "Checker Error", f"The exercise check raised an exception:\n{escape(text)}")
+
+    def _run_exercise(self, func):
+        """
+        Runs one exercise callable and emits its ``exercise`` result record. An
+        exception raised by the check makes the exercise KO (see ``_record_crash``)
+        instead of ending the run.
+        """
+        name = self._exercise_name(func)
+        started = time.perf_counter()
+        ko_before = getattr(self, 'ko_count', 0)
+        self._last_check = None
+        if not hasattr(self, 'verdicts'):
+            self.verdicts = {}
+            self.replayed = set()
+        cached = False
+        try:
+            with profiler.exercise_span(name):
+                if getattr(self, 'reuse_verdicts', False) and incremental.enabled():
+                    cached = self._run_incremental(name, func)
+                else:
+                    func()
+        except Exception as e:
+            self._record_crash(name, e)
+        finally:
+            status = "fail" if getattr(self, 'ko_count', 0) > ko_before else "pass"
+            self.verdicts[name] = status
+            if cached:
+                self.replayed.add(name)
+            results.emit(
+                "exercise",
+                exercise=name,
+                status=status,
+                duration=round(time.perf_counter() - started, 6),
+                cached=cached,
+            )
+
+    def _run_incremental(self, name, func):
+        """
+        Replays the verdict of exercise ``name`` when none of its inputs changed
+        since it was recorded (returns True); otherwise runs it and records its
+        output, errors and dependencies for the next run (returns False).
+        """
+        root = os.getcwd()
+        key = incremental.exercise_key(self, name, root)
+        verdict = incremental.lookup(key)
+        quiet = getattr(self, 'quiet_replay', False)
+        if verdict is not None:
+            if not quiet:
+                sys.stdout.write(verdict["stdout"])
+                sys.stderr.write(verdict["stderr"])
+            ok_count = getattr(self, 'ok_count', 0)
+            ko_count = getattr(self, 'ko_count', 0)
+            for label, error_type, message, last_check in verdict["errors"]:
+                self._last_check = last_check
+                self.record_error(label, error_type, message)
+            self.ok_count = ok_count + verdict["ok"]
+            self.ko_count = ko_count + verdict["ko"]
+            if not quiet:
+                console.print("[dim]↺ Unchanged since the last run: cached result (--force to re-run)[/dim]")
+            return True
+
+        ok_count = getattr(self, 'ok_count', 0)
+        ko_count = getattr(self, 'ko_count', 0)
+        self._recorded_errors = []
+        real_stdout, real_stderr = sys.stdout, sys.stderr
+        out, err = _TeeStream(real_stdout), _TeeStream(real_stderr)
+        sys.stdout, sys.stderr = out, err
+        try:
+            with incremental.recording(root) as deps:
+                func()
+        finally:
+            sys.stdout, sys.stderr = real_stdout, real_stderr
+            errors, self._recorded_errors = self._recorded_errors, None
+        incremental.store(key, deps, {
+            "stdout": out.getvalue(),
+            "stderr": err.getvalue(),
+            "errors": errors,
+            "ok": getattr(self, 'ok_count', 0) - ok_count,
+            "ko": getattr(self, 'ko_count', 0) - ko_count,
+        })
+        return False
+
     def run(self, exercise_name=None):
         title = getattr(self, 'title', "")
         if title:
@@ -361,7 +816,7 @@ class BaseTester:
             clean_filter = exercise_name.replace(".py", "")
             for name, func in exercises:
                 if name == clean_filter or name.replace(".py", "") == clean_filter:
-                    func()
+                    self._run_exercise(func)
                     found = True
                     break
             if not found:
@@ -372,28 +827,144 @@ class BaseTester:
                     f"No exercise matches '{exercise_name}'.",
                 )
         else:
-            for _, func in exercises:
-                func()
+            self.run_exercises([func for _, func in exercises])
             
         self.display_error_report()
 
-    def _run_script(self, path, timeout=10):
-        """Runs a python script and returns stdout."""
-        import subprocess
+    def run_exercises(self, funcs):
+        """
+        Runs exercise callables in declaration order.
+
+        With ``jobs`` > 1 the exercises run on a pool of forked workers; each
+        worker buffers its console output and recorded errors, which are then
+        replayed here in declaration order so the report matches a serial run.
+        """
+        if len(funcs) > 1:
+            self.prime_lint()
+        if not hasattr(self, 'verdicts'):
+            self.verdicts = {}
+            self.replayed = set()
+
+        jobs = getattr(self, 'jobs', 1) or 1
+        if jobs <= 1 or len(funcs) <= 1 or not hasattr(os, "fork"):
+            for func in funcs:
+                self._run_exercise(func)
+            return
+
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from germinette import lint
+
+        # Start the mypy daemon before forking so every worker shares it.
+        lint.start()
+
+        global _PARALLEL_TESTER
+        self._parallel_exercises = list(enumerate(funcs))
+        _PARALLEL_TESTER = self
+        sys.stdout.flush()
+        sys.stderr.flush()
         try:
-            result = subprocess.run(
-                [sys.executable, path],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=timeout
-            )
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(funcs)),
+                mp_context=multiprocessing.get_context("fork"),
+            ) as pool:
+                futures = [pool.submit(_run_exercise_in_worker, i) for i in range(len(funcs))]
+                for func, future in zip(funcs, futures):
+                    try:
+                        out, err, errors, ok_count, ko_count, spans, verdicts, replayed = future.result()
+                    except Exception as e:
+                        # The worker died or its results could not be sent back.
+                        name = self._exercise_name(func)
+                        self._record_crash(name, e)
+                        self.verdicts[name] = "fail"
+                        continue
+                    profiler.spans.extend(spans)
+                    self.verdicts.update(verdicts)
+                    self.replayed.update(replayed)
+                    sys.stdout.write(out)
+                    sys.stdout.flush()
+                    if err:
+                        sys.stderr.write(err)
+                        sys.stderr.flush()
+                    for label, messages in errors.items():
+                        self.grouped_errors.setdefault(label, []).extend(messages)
+                    self.ok_count = getattr(self, 'ok_count', 0) + ok_count
+                    self.ko_count = getattr(self, 'ko_count', 0) + ko_count
+        finally:
+            _PARALLEL_TESTER = None
+            del self._parallel_exercises
+
+    def prime_lint(self, root_dir=None):
+        """
+        Lints every student file under ``root_dir`` in one batch (one flake8
+        run, one mypy run per import root) so ``check_flake8`` can answer from
+        the results instead of launching both tools once per file.
+        """
+        from germinette import lint
+
+        if root_dir is None:
+            finder = getattr(self, '_find_root_dir', None)
+            root_dir = finder() if finder else os.getcwd()
+        paths = []
+        for path in lint.collect_sources(root_dir):
+            keys = lint.cache_keys(path)
+            # Files whose results are all cached need no pre-pass.
+            if not all(k and lint.result_cache.contains(k) for k in keys):
+                paths.append(path)
+        if len(paths) < 2:
+            return
+        try:
+            with profiler.span("lint_batch", f"lint_many({len(paths)} files)"):
+                results = lint.lint_many(paths)
+        except Exception:
+            return
+        self._lint_results = {
+            key: (_file_signature(key), flake8_result, mypy_result)
+            for key, (flake8_result, mypy_result) in results.items()
+        }
+
+    def _batched_lint(self, path):
+        """Returns the pre-pass ``(flake8, mypy)`` results for ``path`` (None when absent or stale)."""
+        key = os.path.normpath(os.path.abspath(path))
+        entry = getattr(self, '_lint_results', {}).get(key)
+        if entry is None or entry[0] is None or entry[0] != _file_signature(key):
+            return None, None
+        return entry[1], entry[2]
+
+    def _cached_check(self, name, path, check):
+        """
+        Runs ``check(path)`` through the on-disk result cache, keyed by file
+        contents and by germinette's own sources (an edited check is not served
+        stale results).
+        """
+        from germinette.cache import ResultCache, file_digest, result_cache
+
+        digest = file_digest(os.path.normpath(os.path.abspath(path)))
+        key = ResultCache.key(name, incremental.package_digest(), digest) if digest else None
+        hit, value = result_cache.lookup(key)
+        self._debug_cache(name, path, key, hit)
+        if hit:
+            return value
+        value = check(path)
+        result_cache.store(key, value)
+        return value
+
+    def _debug_cache(self, check, path, key, hit):
+        from germinette.cache import result_cache
+
+        if key and result_cache.enabled and getattr(self, 'verbose', False):
+            state = "hit" if hit else "miss"
+            console.print(f"[dim]Debug: result cache {state} ({check}) for {escape(os.path.basename(path))}[/dim]")
+
+    @_timed_check("script")
+    def _run_script(self, path, timeout=None):
+        """Runs a python script and returns stdout (plus stderr if it failed or was stopped)."""
+        try:
+            result = self.script_runner.run([sys.executable, path], timeout=timeout)
+            if result.returncode != 0 or result.killed_by:
+                # Return stderr as well for error checking
+                return result.output
             return result.stdout
-        except subprocess.TimeoutExpired:
-            return "Error: Script execution timed out after 10 seconds."
-        except subprocess.CalledProcessError as e:
-            # Return stderr as well for error checking
-            return e.stdout + e.stderr
         except Exception as e:
             return str(e)
 
@@ -405,7 +976,8 @@ class BaseTester:
         if "Traceback (most recent call last):" in output or \
            "SyntaxError:" in output or \
            "IndentationError:" in output or \
-           "AttributeError:" in output: # Added AttributeError explicitly for safety
+           "AttributeError:" in output or \
+           SCRIPT_STOPPED_PREFIX in output: # AttributeError explicitly for safety; stopped runs (timeout, limits) too
             
             # If explicit "Runtime Error" is already recorded, maybe we don't need to duplicate?
             # But this helper is meant to BE the check.
@@ -420,26 +992,28 @@ class BaseTester:
             return True
         return False
 
+    @_timed_check("docstrings")
     def check_docstrings(self, path):
         """Checks if the module itself and all classes/functions have docstrings."""
+        return self._cached_check("docstrings", path, self._check_docstrings)
+
+    def _check_docstrings(self, path):
         import ast
         
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
+            source = source_index.get(path)
             
             missing = []
             
             # Check Module-level Docstring (Top of file)
-            if not ast.get_docstring(tree):
+            if not ast.get_docstring(source.tree):
                  missing.append(f"Line 1: Missing module-level docstring (top of file)")
 
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)):
-                    # Strictly check everything
-                    if not ast.get_docstring(node):
-                        node_type = "Class" if isinstance(node, ast.ClassDef) else "Method"
-                        missing.append(f"Line {node.lineno}: Missing docstring for {node_type} '{node.name}'")
+            for node in source.definitions:
+                # Strictly check everything
+                if not ast.get_docstring(node):
+                    node_type = "Class" if isinstance(node, ast.ClassDef) else "Method"
+                    missing.append(f"Line {node.lineno}: Missing docstring for {node_type} '{node.name}'")
             
             if missing:
                 return "\n".join(missing)
@@ -449,23 +1023,39 @@ class BaseTester:
             return f"Error checking docstrings: {e}"
 
     # Credit to @tirnovantudor8-maker (GitHub Issue #19) and @eloiberlinger1 for reporting and clarifying the mypy internal crash on circular imports!
+    @_timed_check("flake8")
     def check_flake8(self, path, timeout=10):
         """Runs flake8 and mypy; returns None only if both pass."""
         import subprocess
+        from germinette import lint
         
         try:
-            flake8_result = subprocess.run(
-                [sys.executable, "-m", "flake8", path],
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            mypy_result = subprocess.run(
-                [sys.executable, "-m", "mypy", path],
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            # Result cache first, then the batch pre-pass, then the warm backends
+            # (in-process flake8, dmypy), then one subprocess per tool.
+            flake8_key, mypy_key = lint.cache_keys(path)
+            incremental.note("lint", path)
+            flake8_result = lint.cached_result(flake8_key)
+            mypy_result = lint.cached_result(mypy_key)
+            self._debug_cache("flake8", path, flake8_key, flake8_result is not None)
+            self._debug_cache("mypy", path, mypy_key, mypy_result is not None)
+
+            batched_flake8, batched_mypy = self._batched_lint(path)
+            if flake8_result is None:
+                flake8_result = batched_flake8 or lint.run_flake8(path) or subprocess.run(
+                    [sys.executable, "-m", "flake8", path],
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                )
+                lint.store_result(flake8_key, flake8_result)
+            if mypy_result is None:
+                mypy_result = batched_mypy or lint.run_mypy(path, timeout=timeout) or subprocess.run(
+                    [sys.executable, "-m", "mypy", path],
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                )
+                lint.store_result(mypy_key, mypy_result)
 
             mypy_lines = (mypy_result.stdout or mypy_result.stderr or "").strip().splitlines()
             is_mypy_internal_error = any("INTERNAL ERROR" in line for line in mypy_lines)
@@ -526,31 +1116,31 @@ class BaseTester:
             return f"Error running style checks (flake8/mypy): {e}"
 
     # Credit to @eloiberlinger1 (GitHub PR #3) for implementing mandatory type hint checks across module exercises!
+    @_timed_check("type_hints")
     def check_type_hints(self, path):
         """Checks if all functions and methods have type hints (annotations)."""
-        import ast
-        
+        return self._cached_check("type_hints", path, self._check_type_hints)
+
+    def _check_type_hints(self, path):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
+            source = source_index.get(path)
             
             missing = []
             
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if node.name.startswith("__") and node.name != "__init__":
+            for node in source.functions:
+                if node.name.startswith("__") and node.name != "__init__":
+                    continue
+                
+                # Check return type annotation
+                if node.returns is None:
+                    missing.append(f"Line {node.lineno}: Missing return type hint for function '{node.name}'")
+                
+                # Check parameter type annotations (skip 'self' and 'cls')
+                for arg in node.args.args:
+                    if arg.arg in ('self', 'cls'):
                         continue
-                    
-                    # Check return type annotation
-                    if node.returns is None:
-                        missing.append(f"Line {node.lineno}: Missing return type hint for function '{node.name}'")
-                    
-                    # Check parameter type annotations (skip 'self' and 'cls')
-                    for arg in node.args.args:
-                        if arg.arg in ('self', 'cls'):
-                            continue
-                        if arg.annotation is None:
-                            missing.append(f"Line {node.lineno}: Missing type hint for parameter '{arg.arg}' in function '{node.name}'")
+                    if arg.annotation is None:
+                        missing.append(f"Line {node.lineno}: Missing type hint for parameter '{arg.arg}' in function '{node.name}'")
             
             if missing:
                 return "\n".join(missing)
@@ -561,155 +1151,76 @@ class BaseTester:
 
     def check_try_except(self, path, exercise_label):
         """Checks if the file contains at least one try...except block."""
-        import ast
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-            
-            has_try = False
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Try):
-                    has_try = True
-                    break
-            
-            if not has_try:
-                console.print(f"[red]KO (Strictness: Missing try/except)[/red]")
-                # We return the error string instead of printing locally to allow caller to handle recording?
-                # But BaseTester usually returns strings?
-                # The existing methods return strings.
-                # However, python_module_02 implementation printed directly.
-                # To be consistent with check_docstrings, I should return error string or None.
-                return "Strict check failed: You MUST use 'try/except' blocks."
-            return None
+            err = self._run_strict_rule(path, strict_rules.RequireTryExceptRule())
         except Exception as e:
             return f"AST Error in check_try_except: {e}"
+        if err:
+            console.print(f"[red]KO (Strictness: Missing try/except)[/red]")
+        return err
 
     def check_authorized_functions(self, path, allowed):
         """Checks if all called functions are in the allowed list (or built-in exceptions)."""
-        import ast
-        import builtins
-        
-        # Always allow exceptions (classes inheriting BaseException)
-        builtin_exceptions = {item for item in dir(builtins) 
-                              if isinstance(getattr(builtins, item), type) 
-                              and issubclass(getattr(builtins, item), BaseException)}
-        
-        # Per-exercise ``allowed`` list is authoritative for builtins; exceptions + super are extra.
-        allowed_set = set(allowed).union(builtin_exceptions).union({'super'})
-
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-            
-            violation = None
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call):
-                     func_name = None
-                     if isinstance(node.func, ast.Name):
-                         func_name = node.func.id
-                     elif isinstance(node.func, ast.Attribute):
-                         # Handle obj.method() ?
-                         # If checking strict functions, usually we check builtins.
-                         # Methods on objects (e.g. list.append) are hard to filter via AST without type interference.
-                         # We usually only restrict global builtins.
-                         pass
-                     
-                     if func_name and func_name in dir(builtins):
-                         if func_name not in allowed_set:
-                             violation = func_name
-                             break
-            
-            if violation:
-                return f"You used '{violation}()' which is NOT authorized.\nAuthorized: {', '.join(allowed)}"
-            return None
-                
+            return self._run_strict_rule(path, strict_rules.AuthorizedFunctionsRule(allowed))
         except Exception as e:
             return f"AST Error in check_authorized_functions: {e}"
 
     def check_no_file_io(self, path):
         """Checks if file I/O operations (open) are present."""
-        import ast
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Name) and node.func.id == 'open':
-                         return "File I/O Forbidden: 'open()' function detected."
-            return None
+            return self._run_strict_rule(path, strict_rules.NoFileIORule())
         except Exception as e:
             return f"AST Error in check_no_file_io: {e}"
 
     def check_imports(self, path, allowed_modules):
         """Checks if only allowed modules are imported."""
-        import ast
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-            
-            # __future__ is always legal (e.g. `from __future__ import annotations`).
-            # typing_extensions: backport for Self, ParamSpec, etc. on Python < 3.11 (e.g. 42 lab 3.10)
-            allowed_set = set(allowed_modules).union(
-                {'typing', 'typing_extensions', 'collections', '__future__'}
-            )
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name.split('.')[0] not in allowed_set:
-                            return f"Forbidden Import: '{alias.name}' is not authorized."
-                elif isinstance(node, ast.ImportFrom):
-                    # Allow relative imports (level > 0)
-                    if node.level > 0:
-                        continue
-                    if node.module and node.module.split('.')[0] not in allowed_set:
-                        return f"Forbidden Import: '{node.module}' is not authorized."
-            return None
+            return self._run_strict_rule(path, strict_rules.AllowedImportsRule(allowed_modules))
         except Exception as e:
             return f"AST Error in check_imports: {e}"
 
+    def _run_strict_rule(self, path, rule):
+        strict_rules.run_rules(source_index.get(path).tree, [rule])
+        return rule.report()
+
+    @_timed_check("strict")
     def verify_strict(self, path, exercise_label, allowed_funcs, allowed_imports=["sys"], enforce_try_except=False):
         """
-        Runs a suite of strict checks:
+        Runs a suite of strict checks in one AST traversal:
         1. No File I/O
         2. Authorized Imports Only
         3. Try/Except (Optional)
         4. Authorized Functions Only
+
+        Every failing rule is recorded with all of its violations; the console
+        shows the KO of the first one.
         """
         file_prefix = f"[bold cyan]File:[/bold cyan] [cyan]{os.path.basename(path)}[/cyan]\n\n"
 
-        # 1. No File I/O
-        err = None
+        rules = []
         if 'open' not in allowed_funcs:
-            err = self.check_no_file_io(path)
-            
-        if err:
-            console.print(f"[red]KO (Forbidden Operation)[/red]")
-            self.record_error(exercise_label, "Forbidden Operation", file_prefix + err)
-            return False
+            rules.append(strict_rules.NoFileIORule())
+        rules.append(strict_rules.AllowedImportsRule(allowed_imports))
+        if enforce_try_except:
+            rules.append(strict_rules.RequireTryExceptRule())
+        rules.append(strict_rules.AuthorizedFunctionsRule(allowed_funcs))
 
-        # 2. Imports
-        err = self.check_imports(path, allowed_imports)
-        if err:
-            console.print(f"[red]KO (Forbidden Import)[/red]")
-            self.record_error(exercise_label, "Forbidden Import", file_prefix + err)
+        try:
+            strict_rules.run_rules(source_index.get(path).tree, rules)
+        except Exception as e:
+            console.print(f"[red]KO (AST Error)[/red]")
+            self.record_error(exercise_label, "AST Error", file_prefix + f"AST Error in verify_strict: {e}")
             return False
 
-        # 3. Try/Except (if required)
-        if enforce_try_except:
-            err = self.check_try_except(path, exercise_label)
-            if err:
-                console.print(f"[red]KO (Strictness)[/red]")
-                self.record_error(exercise_label, "Structure Error", file_prefix + err)
-                return False
-
-        # 4. Authorized Functions
-        err = self.check_authorized_functions(path, allowed_funcs)
-        if err:
-            console.print(f"[red]KO (Forbidden Function)[/red]")
-            self.record_error(exercise_label, "Authorized Functions", file_prefix + err)
-            return False
-        
-        return True
+        passed = True
+        for rule in rules:
+            err = rule.report()
+            if not err:
+                continue
+            if passed:
+                console.print(f"[red]KO ({rule.ko_label})[/red]")
+                passed = False
+            self.record_error(exercise_label, rule.error_type, file_prefix + err)
+        return passed
 
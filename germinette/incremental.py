@@ -0,0 +1,227 @@
+"""
+Incremental re-grading: replay an exercise's verdict while its inputs are unchanged.
+
+While an exercise runs, every input it touches under the submission root is
+recorded together with its state at that moment:
+
+- files it opens and directories it lists in-process (through an audit hook,
+  so student imports, source checks and data files are all seen);
+- for ``check_flake8``, the lint cache keys (the file, its mypy import root,
+  the flake8 / mypy configuration and tool versions);
+- for student scripts, the script and every file and directory it opened,
+  as listed by the warm interpreter running it (``germinette.script_pool``),
+  data files such as ``config.txt`` included; files the run itself rewrote
+  (a maze's OUTPUT_FILE) are outputs and do not count. When the list is
+  unavailable (fresh interpreter, killed script) every file under the
+  script's working directory counts instead.
+
+The exercise's console output, recorded errors and OK / KO counts are stored
+in the result cache with those dependencies, keyed by the germinette version
+and every source of the package, the exercise and the submission's file
+listing (so adding or removing a file re-runs everything). On the next run
+the verdict is replayed when every dependency still has the recorded state.
+``germinette --force`` (or ``GERMINETTE_NO_CACHE=1``) re-runs every exercise.
+"""
+import hashlib
+import os
+import sys
+from contextlib import contextmanager
+
+from germinette import lint
+from germinette.cache import ResultCache, file_digest, result_cache
+
+# Above this many files the submission listing is not worth fingerprinting.
+MAX_LISTING = 2000
+
+# The recording in progress: {"root": ..., "deps": {...}}, or None.
+_active = None
+# Fingerprint of the installed germinette package (computed once per process).
+_package = None
+_hook_installed = False
+_in_hook = False
+
+
+def _hash(text):
+    return hashlib.sha256(text.encode("utf-8", "surrogateescape")).hexdigest()
+
+
+def _listing(path):
+    try:
+        return _hash("\n".join(sorted(os.listdir(path))))
+    except OSError:
+        return None
+
+
+def _sources(root):
+    paths = lint.walk_files(root, ".py", MAX_LISTING)
+    if paths is None:
+        return None
+    return _hash("\n".join(f"{p}:{file_digest(p)}" for p in paths))
+
+
+def _lint(path):
+    return "|".join(str(key) for key in lint.cache_keys(path))
+
+
+_STATES = {"file": file_digest, "dir": _listing, "sources": _sources, "lint": _lint}
+
+
+def state(kind, target):
+    """Current state of one dependency (compared with the recorded one on replay)."""
+    return _STATES[kind](target)
+
+
+def _tracked(path):
+    root = _active["root"]
+    if not path.startswith(root + os.sep):
+        return False
+    parts = path[len(root) + 1:].split(os.sep)
+    return not any(part.startswith(".") or part in lint._PRUNE_DIRS for part in parts)
+
+
+def note(kind, target):
+    """Records ``target`` as an input of the exercise being recorded (first state wins)."""
+    global _in_hook
+    if _active is None or _in_hook:
+        return
+    target = os.path.abspath(target)
+    if kind in ("file", "dir") and not _tracked(target) and target != _active["root"]:
+        return
+    dep = f"{kind}:{target}"
+    if dep in _active["deps"]:
+        return
+    _in_hook = True
+    try:
+        _active["deps"][dep] = state(kind, target)
+    finally:
+        _in_hook = False
+
+
+@contextmanager
+def script_run(cmd, cwd=None):
+    """
+    Records what the student script run inside the block depends on. Yields
+    None when nothing is being recorded, else a dict whose ``"opened"`` the
+    caller sets to the run's ``(kind, path)`` list (None: unknown).
+    """
+    if _active is None:
+        yield None
+        return
+    cwd = cwd or os.getcwd()
+    script = cmd[1] if len(cmd) > 1 and not cmd[1].startswith("-") else None
+    if script:
+        note("file", os.path.join(cwd, script))
+    paths = lint.walk_files(cwd, "", MAX_LISTING)
+    if paths is None:
+        note("sources", cwd)
+        yield None
+        return
+    # Every file around the script, in its state before the run; narrowed afterwards.
+    deps = _active["deps"]
+    around = {f"file:{os.path.abspath(path)}" for path in paths}
+    added = []
+    for dep in sorted(around - deps.keys()):
+        note("file", dep[len("file:"):])
+        if dep in deps:
+            added.append(dep)
+    traced = {"opened": None}
+    try:
+        yield traced
+    finally:
+        opened = traced["opened"]
+        read = None if opened is None else {f"{kind}:{path}" for kind, path in opened}
+        for dep in added:
+            # Not opened, or rewritten by the run (an output, which would never match on replay).
+            if (read is not None and dep not in read) or state("file", dep[len("file:"):]) != deps[dep]:
+                del deps[dep]
+        # Opened elsewhere under the root (a shared data file, a listed directory).
+        prefix = os.path.abspath(cwd) + os.sep
+        for kind, path in opened or ():
+            if kind == "dir" or (f"file:{path}" not in around and not path.startswith(prefix)):
+                note(kind, path)
+
+
+def _audit(event, args):
+    if _active is None or _in_hook:
+        return
+    if event == "open":
+        path = args[0]
+    elif event in ("os.listdir", "os.scandir"):
+        path = args[0] if args and args[0] is not None else "."
+    else:
+        return
+    if isinstance(path, bytes):
+        path = os.fsdecode(path)
+    if not isinstance(path, str):
+        return
+    note("file" if event == "open" else "dir", path)
+
+
+@contextmanager
+def recording(root):
+    """Collects the dependencies of the code run inside the block into the yielded dict."""
+    global _active, _hook_installed
+    if not _hook_installed:
+        sys.addaudithook(_audit)
+        _hook_installed = True
+    previous = _active
+    _active = {"root": os.path.abspath(root), "deps": {}}
+    try:
+        yield _active["deps"]
+    finally:
+        _active = previous
+
+
+def package_digest():
+    """Version and sources of the whole germinette package: editing any checker code invalidates results."""
+    global _package
+    if _package is None:
+        import germinette
+
+        paths = lint.walk_files(os.path.dirname(os.path.abspath(germinette.__file__)), ".py", MAX_LISTING) or ()
+        _package = _hash(germinette.__version__ + "\n" + "\n".join(f"{p}:{file_digest(p)}" for p in paths))
+    return _package
+
+
+def exercise_key(tester, exercise, root):
+    """Result-cache key of one exercise's verdict; None when the submission is too big to fingerprint."""
+    files = lint.walk_files(root, "", MAX_LISTING)
+    if files is None:
+        return None
+    return ResultCache.key(
+        "exercise",
+        sys.version,
+        package_digest(),
+        # A checker defined outside the package (plugins, tests).
+        file_digest(getattr(sys.modules.get(type(tester).__module__), "__file__", None) or ""),
+        type(tester).__qualname__,
+        exercise,
+        os.path.abspath(root),
+        bool(getattr(tester, "verbose", False)),
+        sys.stdout.isatty(),
+        "\n".join(os.path.relpath(p, root) for p in files),
+    )
+
+
+def lookup(key):
+    """The stored verdict for ``key`` if every recorded dependency is unchanged, else None."""
+    if key is None:
+        return None
+    hit, value = result_cache.lookup(key)
+    if not hit:
+        return None
+    for dep, recorded in value["deps"].items():
+        kind, target = dep.split(":", 1)
+        if state(kind, target) != recorded:
+            return None
+    return value
+
+
+def store(key, deps, verdict):
+    """Saves ``verdict`` (output, errors, counts) with the dependencies it was computed from."""
+    if key is not None:
+        result_cache.store(key, dict(verdict, deps=deps))
+
+
+def enabled():
+    return result_cache.enabled
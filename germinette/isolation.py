@@ -0,0 +1,235 @@
+"""
+Loading student modules in-process without leaking state into the grader.
+
+The Module 09 / 10 checkers call the student's functions and classes directly,
+so the module has to be executed in the grader's own interpreter. ``load()``
+makes that safe for a long-lived process (``--watch``, batch grading, editor
+integrations):
+
+- the file is first imported in a forked child with stdin closed and output
+  discarded. The child reports over a pipe whether the import succeeded and,
+  if not, the student's traceback; it is killed after ``IMPORT_TIMEOUT``
+  seconds. An import that loops, waits for input or kills the interpreter
+  fails that exercise instead of the run;
+- the in-process import then runs between a snapshot and a restore of
+  ``sys.modules`` and ``sys.path``: modules of the submission it pulled in
+  (and entries it replaced) are dropped afterwards, so the next exercise or
+  submission imports its own code. Standard-library and third-party modules
+  stay loaded.
+
+A module object cannot be handed back from the child, so the file's top level
+runs twice: once in the probe, once in-process. Its side effects (prints, file
+writes) happen twice too. The second run can behave differently (time, random,
+files the first run created), so it is also stopped after ``IMPORT_TIMEOUT``
+seconds, by a ``SIGALRM`` timer when called from the main thread.
+
+Third-party modules the file imports (e.g. pydantic) are imported in the
+grader before forking, so the child starts warm and they load only once.
+"""
+import json
+import os
+import select
+import signal
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from germinette.source_index import source_index
+
+IMPORT_TIMEOUT = 10
+
+
+class ImportFailed(Exception):
+    """The student module could not be imported; ``details`` holds its traceback."""
+
+    def __init__(self, message, details=""):
+        super().__init__(message)
+        self.details = details
+
+
+class _Expired(BaseException):
+    """Raised by the alarm in ``_deadline``; a BaseException so ``except Exception`` does not swallow it."""
+
+
+@contextmanager
+def _deadline(timeout):
+    """Interrupts the block with ``_Expired`` after ``timeout`` seconds (main thread with SIGALRM only)."""
+    if not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def expire(signum, frame):
+        raise _Expired
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+@contextmanager
+def isolated(root):
+    """Restores ``sys.path`` and drops the modules under ``root`` imported inside the block."""
+    root = os.path.abspath(root) + os.sep
+    saved_path = list(sys.path)
+    saved_modules = dict(sys.modules)
+    try:
+        yield
+    finally:
+        sys.path[:] = saved_path
+        for name, module in list(sys.modules.items()):
+            before = saved_modules.get(name)
+            if module is before:
+                continue
+            origin = getattr(module, "__file__", None) or ""
+            if before is not None:
+                sys.modules[name] = before
+            elif os.path.abspath(origin).startswith(root):
+                del sys.modules[name]
+
+
+def _local(name, dirs):
+    return any(os.path.exists(os.path.join(d, name + ".py")) or os.path.isdir(os.path.join(d, name)) for d in dirs)
+
+
+def _warm(path):
+    """Imports the third-party / standard modules ``path`` imports, before forking."""
+    import ast
+    import importlib
+
+    try:
+        imports = source_index.get(path).imports
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return
+    dirs = (os.path.dirname(os.path.abspath(path)), os.getcwd())
+    names = set()
+    for node in imports:
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif node.level == 0 and node.module:
+            names.add(node.module.split(".")[0])
+    for name in sorted(names):
+        if name in sys.modules or _local(name, dirs):
+            continue
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # The child reports it as the student's import error.
+            pass
+
+
+def _exec(path, name):
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _child(path, name, write_fd):
+    import traceback
+
+    try:
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        # Fresh streams: another thread may have held the inherited ones' locks.
+        sys.stdin = open(0, "r", closefd=False)
+        sys.stdout = sys.stderr = open(1, "w", closefd=False)
+        _exec(path, name)
+        report = {"ok": True}
+    except BaseException as e:
+        message = str(e)
+        if isinstance(e, SystemExit):
+            message = f"the module exits while being imported (exit code {e.code})"
+        tb = e.__traceback__
+        # Drop the frames of this module so the traceback starts at the import.
+        while tb is not None and tb.tb_frame.f_code.co_filename == __file__:
+            tb = tb.tb_next
+        report = {
+            "ok": False,
+            "message": message,
+            "details": "".join(traceback.format_exception(type(e), e, tb)),
+        }
+    try:
+        os.write(write_fd, json.dumps(report).encode())
+    finally:
+        os._exit(0)
+
+
+def _read(fd, deadline):
+    """Everything the child writes to ``fd``, or None if it is still running at ``deadline``."""
+    data = b""
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            return None
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            return data
+        data += chunk
+
+
+def probe(path, name, timeout=IMPORT_TIMEOUT):
+    """Imports ``path`` in a forked child; raises ``ImportFailed`` if that fails or times out."""
+    if not hasattr(os, "fork"):
+        return
+    _warm(path)
+    read_fd, write_fd = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        _child(path, name, write_fd)
+    os.close(write_fd)
+    data = None
+    try:
+        data = _read(read_fd, time.monotonic() + timeout)
+    finally:
+        os.close(read_fd)
+        if data is None:
+            # Timed out, or the grader is being interrupted.
+            os.kill(pid, signal.SIGKILL)
+        _, status = os.waitpid(pid, 0)
+    if data is None:
+        raise ImportFailed(f"import did not finish within {timeout:g} seconds (endless loop or waiting for input?)")
+    if not data:
+        code = os.waitstatus_to_exitcode(status)
+        how = f"signal {signal.Signals(-code).name}" if code < 0 else f"exit status {code}"
+        raise ImportFailed(f"the interpreter stopped during the import ({how})")
+    report = json.loads(data)
+    if not report["ok"]:
+        raise ImportFailed(report["message"], report["details"])
+
+
+def load(path, name, timeout=IMPORT_TIMEOUT):
+    """
+    Probes ``path`` (see ``probe``), then executes it in-process as module
+    ``name`` without leaking imports, again within ``timeout`` seconds.
+    """
+    probe(path, name, timeout)
+    with isolated(os.getcwd()):
+        try:
+            with _deadline(timeout):
+                return _exec(path, name)
+        except _Expired:
+            raise ImportFailed(
+                f"import did not finish within {timeout:g} seconds when run again in the grader "
+                "(the top level runs twice: does it depend on time, randomness or files it wrote?)"
+            ) from None
+
+
+def print_traceback(exc):
+    """Prints the traceback of a failed ``load``: the student's when it failed in the probe."""
+    import traceback
+
+    if isinstance(exc, ImportFailed):
+        sys.stderr.write(exc.details)
+    else:
+        traceback.print_exception(type(exc), exc, exc.__traceback__)
@@ -0,0 +1,497 @@
+"""
+Warm flake8 / mypy backends for ``BaseTester.check_flake8``.
+
+Spawning ``python -m flake8`` and ``python -m mypy`` for every student file pays
+interpreter startup, plugin discovery and the typeshed load each time. Instead:
+
+- flake8 runs in-process through its legacy API (one style guide per working
+  directory, reused for every file);
+- mypy goes through a ``dmypy`` daemon that is started once per run and queried
+  over its local socket.
+
+Both helpers return a ``subprocess.CompletedProcess``-shaped result, or ``None``
+when the backend is unavailable so the caller can fall back to the subprocess
+path. Set ``GERMINETTE_NO_LINT_DAEMON=1`` to always use the subprocess path.
+"""
+import atexit
+import contextlib
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from germinette.cache import ResultCache, file_digest, result_cache
+from germinette.utils import user_cache_dir
+
+# The daemon stops by itself after this many idle seconds, even if germinette
+# was killed before it could send "stop".
+DAEMON_IDLE_TIMEOUT = 600
+
+# cwd -> (legacy StyleGuide, list collecting formatted output lines)
+_style_guides = {}
+
+# None: not started yet, False: unavailable, dict: running daemon
+_daemon = None
+
+# Directories never linted (virtualenvs are detected by their pyvenv.cfg).
+_PRUNE_DIRS = {"__pycache__", "node_modules", "site-packages"}
+# Above this many files a directory is probably not a submission.
+MAX_SOURCES = 200
+
+# flake8 / mypy read these from the working directory (or its parents).
+_CONFIG_FILES = ("setup.cfg", "tox.ini", ".flake8", "mypy.ini", ".mypy.ini", "pyproject.toml")
+
+_tool_fingerprint = None
+_config_fingerprints = {}
+
+
+def walk_files(root_dir, suffix="", max_files=MAX_SOURCES):
+    """
+    Lists the files ending in ``suffix`` under ``root_dir``, skipping hidden
+    directories, caches and virtualenvs; None when there are more than ``max_files``.
+    """
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if not d.startswith(".")
+            and d not in _PRUNE_DIRS
+            and not os.path.exists(os.path.join(dirpath, d, "pyvenv.cfg"))
+        )
+        paths.extend(os.path.join(dirpath, f) for f in sorted(filenames) if f.endswith(suffix))
+        if len(paths) > max_files:
+            return None
+    return paths
+
+
+def collect_sources(root_dir, max_files=MAX_SOURCES):
+    """Lists the .py files under ``root_dir``; empty when there are more than ``max_files``."""
+    return walk_files(root_dir, ".py", max_files) or []
+
+
+def _disabled():
+    return os.environ.get("GERMINETTE_NO_LINT_DAEMON", "").strip() not in ("", "0")
+
+
+def _result(returncode, stdout="", stderr=""):
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr=stderr)
+
+
+def _make_style_guide():
+    from flake8.api import legacy
+    from flake8.formatting.default import Default
+
+    lines = []
+
+    class _CollectingFormatter(Default):
+        """Default flake8 output format, collected into ``lines`` without colors."""
+
+        def after_init(self):
+            super().after_init()
+            self.color = False
+
+        def _write(self, output):
+            lines.append(output)
+
+    guide = legacy.get_style_guide()
+    guide.init_report(_CollectingFormatter)
+    return guide, lines
+
+
+def run_flake8(path):
+    """Lints ``path`` with an in-process flake8; returns None if unavailable."""
+    return run_flake8_many([path])
+
+
+def run_flake8_many(paths):
+    """Lints ``paths`` in one in-process flake8 pass; returns None if unavailable."""
+    if _disabled():
+        return None
+    cwd = os.getcwd()
+    try:
+        if cwd not in _style_guides:
+            _style_guides[cwd] = _make_style_guide()
+        guide, lines = _style_guides[cwd]
+        del lines[:]
+        # Plugins may print; keep that out of the germinette report.
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = guide.check_files(list(paths))
+        output = "".join(line + "\n" for line in lines)
+        return _result(1 if report.total_errors else 0, output)
+    except Exception:
+        _style_guides.pop(cwd, None)
+        return None
+
+
+def start(timeout=30):
+    """Starts the dmypy daemon for this process; returns its status file or None."""
+    global _daemon
+    if _daemon is not None:
+        return _daemon["status_file"] if _daemon else None
+    _daemon = False
+    if _disabled():
+        return None
+    try:
+        import mypy.dmypy.client  # noqa: F401
+    except ImportError:
+        return None
+
+    state_dir = tempfile.mkdtemp(prefix="germinette-dmypy-")
+    status_file = os.path.join(state_dir, "dmypy.json")
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", "mypy.dmypy", "--status-file", status_file,
+             "start", "--timeout", str(DAEMON_IDLE_TIMEOUT)],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        started = result.returncode == 0 and os.path.exists(status_file)
+    except Exception:
+        started = False
+    if not started:
+        shutil.rmtree(state_dir, ignore_errors=True)
+        return None
+
+    _daemon = {
+        "status_file": status_file,
+        "state_dir": state_dir,
+        "cwd": os.getcwd(),
+        "pid": os.getpid(),
+    }
+    atexit.register(shutdown)
+    return status_file
+
+
+def run_mypy(path, timeout=10):
+    """Type-checks ``path`` through the dmypy daemon; returns None if unavailable."""
+    return _run_dmypy([path], timeout)
+
+
+def _run_dmypy(paths, timeout):
+    global _daemon
+    if _daemon and _daemon["cwd"] != os.getcwd() and _daemon["pid"] == os.getpid():
+        # Relative paths and config files resolve against the daemon's working
+        # directory, so follow the caller to its new one.
+        shutdown()
+        _daemon = None
+    if _daemon is None:
+        start()
+    if not _daemon or _daemon["cwd"] != os.getcwd():
+        return None
+    try:
+        from mypy.dmypy.client import request
+        from mypy.version import __version__ as mypy_version
+
+        # ``request`` asks sys.stdout whether to colorize; a buffer keeps output plain.
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            response = request(
+                _daemon["status_file"],
+                "run",
+                timeout=int(timeout),
+                version=mypy_version,
+                args=list(paths),
+                export_types=False,
+            )
+    except Exception:
+        response = {"error": "dmypy request failed"}
+
+    if "error" in response or "restart" in response or "status" not in response:
+        # Crashed, busy or reconfigured daemon: use plain mypy for the rest of the run.
+        shutdown()
+        return None
+    return _result(response["status"], response.get("out", ""), response.get("err", ""))
+
+
+def _norm(path):
+    return os.path.normpath(os.path.abspath(path))
+
+
+def _split_by_path(output, paths):
+    """Groups tool output lines by the file they start with; other lines follow the previous file."""
+    groups = {_norm(p): [] for p in paths}
+    current = None
+    for line in output.splitlines():
+        head = line.split(":", 1)[0]
+        key = _norm(head) if head and ":" in line else None
+        if key in groups:
+            current = key
+        elif key is not None and head.endswith((".py", ".pyi")):
+            # A file outside ``paths`` (e.g. a module mypy followed an import to).
+            current = None
+        if current is not None:
+            groups[current].append(line)
+    return groups
+
+
+def _mypy_search_base(path):
+    # mypy puts the first ancestor without an ``__init__.py`` on its search path;
+    # files sharing it resolve imports exactly as they would when checked alone.
+    directory = os.path.dirname(_norm(path))
+    while os.path.exists(os.path.join(directory, "__init__.py")):
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    return directory
+
+
+def _module_file(base, dotted):
+    """The source of module ``dotted`` under ``base``, or None."""
+    stem = os.path.join(base, *dotted.split("."))
+    for candidate in (stem + ".py", stem + ".pyi", os.path.join(stem, "__init__.py")):
+        if os.path.isfile(candidate):
+            return _norm(candidate)
+    return None
+
+
+def _local_imports(path, base):
+    """Files under ``base`` that ``path`` imports (what mypy follows when checking it alone)."""
+    import ast
+    from germinette.source_index import source_index
+
+    try:
+        imports = source_index.get(path).imports
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return set()
+    package = os.path.relpath(os.path.dirname(_norm(path)), base).replace(os.sep, ".")
+    package = [] if package == "." else package.split(".")
+    found = set()
+    for node in imports:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        else:
+            prefix = package[:len(package) - node.level + 1] if node.level else []
+            module = ".".join(prefix + ([node.module] if node.module else []))
+            names = [module] if module else []
+            names += [f"{module}.{alias.name}" if module else alias.name for alias in node.names]
+        for name in names:
+            parts = name.split(".")
+            # ``import a.b`` also imports ``a``.
+            for end in range(1, len(parts) + 1):
+                target = _module_file(base, ".".join(parts[:end]))
+                if target:
+                    found.add(target)
+    return found
+
+
+def _import_closure(path, base):
+    """``path`` and every file under ``base`` it imports, directly or not."""
+    closure = {_norm(path)}
+    pending = [_norm(path)]
+    while pending:
+        for target in _local_imports(pending.pop(), base):
+            if target not in closure:
+                closure.add(target)
+                pending.append(target)
+    return closure
+
+
+def _batch_flake8(paths, timeout):
+    result = run_flake8_many(paths)
+    if result is None:
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", "flake8", *paths],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except Exception:
+            return {}
+    if result.returncode not in (0, 1):
+        return {}
+    results = {}
+    for key, lines in _split_by_path(result.stdout, paths).items():
+        output = "".join(line + "\n" for line in lines)
+        results[key] = _result(1 if lines and result.returncode else 0, output)
+    return results
+
+
+def _batch_mypy(paths, timeout):
+    result = _run_dmypy(paths, timeout)
+    if result is None:
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", "mypy", "--cache-dir", user_cache_dir("mypy"), *paths],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except Exception:
+            return {}
+    output = result.stdout or ""
+    if (
+        result.returncode not in (0, 1)
+        or result.stderr
+        or "prevented further checking" in output
+        or "INTERNAL ERROR" in output
+    ):
+        # Blocking errors stop mypy before every file is checked: answer nothing.
+        return {}
+    lines = output.splitlines()
+    if lines and (lines[-1].startswith("Found ") or lines[-1].startswith("Success: ")):
+        lines = lines[:-1]
+    # mypy also reports the errors of the modules a file imports: a file
+    # importing one with errors is re-checked alone, as mypy would see it.
+    failing = {_norm(line.split(":", 1)[0]) for line in lines if ": error:" in line}
+    base = _mypy_search_base(paths[0])
+    results = {}
+    for key, own in _split_by_path("\n".join(lines), paths).items():
+        if result.returncode and failing - {key} and _import_closure(key, base) & (failing - {key}):
+            results[key] = _solo_mypy(key, timeout)
+            continue
+        errors = sum(1 for line in own if ": error:" in line)
+        if errors and result.returncode:
+            plural = "s" if errors != 1 else ""
+            summary = f"Found {errors} error{plural} in 1 file (checked 1 source file)"
+        else:
+            errors = 0
+            summary = "Success: no issues found in 1 source file"
+        output = "".join(line + "\n" for line in own + [summary])
+        results[key] = _result(1 if errors else 0, output)
+    return results
+
+
+def _solo_mypy(path, timeout):
+    result = run_mypy(path, timeout)
+    if result is None:
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", "mypy", "--cache-dir", user_cache_dir("mypy"), path],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except Exception:
+            return None
+    return result if result.returncode in (0, 1) else None
+
+
+def lint_many(paths, timeout=60):
+    """
+    Runs flake8 once and mypy once per import root over ``paths``.
+
+    Returns ``{abs_path: (flake8_result, mypy_result)}``; either result is None
+    when the batch could not answer for that file, so the caller re-checks it
+    on its own. Results match what a per-file run of each tool prints.
+    """
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return {}
+    flake8_results = _batch_flake8(paths, timeout)
+
+    mypy_results = {}
+    groups = {}
+    for path in paths:
+        groups.setdefault(_mypy_search_base(path), []).append(path)
+    for group in groups.values():
+        mypy_results.update(_batch_mypy(group, timeout))
+
+    return {
+        _norm(p): (flake8_results.get(_norm(p)), mypy_results.get(_norm(p)))
+        for p in paths
+    }
+
+
+def _tools():
+    """Python, flake8 (+ plugins) and mypy versions, computed once per process."""
+    global _tool_fingerprint
+    if _tool_fingerprint is None:
+        from importlib import metadata
+
+        parts = [sys.version]
+        for dist in ("flake8", "mypy"):
+            try:
+                parts.append(f"{dist}=={metadata.version(dist)}")
+            except metadata.PackageNotFoundError:
+                parts.append(f"{dist}==missing")
+        try:
+            entry_points = metadata.entry_points()
+            if hasattr(entry_points, "select"):
+                plugins = entry_points.select(group="flake8.extension")
+            else:
+                plugins = entry_points.get("flake8.extension", [])
+            parts.extend(sorted(f"{ep.name}={ep.value}" for ep in plugins))
+        except Exception:
+            pass
+        _tool_fingerprint = "\n".join(parts)
+    return _tool_fingerprint
+
+
+def _config(cwd):
+    """Contents of the flake8 / mypy config files that apply in ``cwd``."""
+    if cwd not in _config_fingerprints:
+        candidates = [
+            os.path.expanduser("~/.config/mypy/config"),
+            os.path.expanduser("~/.mypy.ini"),
+        ]
+        directory = cwd
+        while True:
+            candidates.extend(os.path.join(directory, name) for name in _CONFIG_FILES)
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+        _config_fingerprints[cwd] = "\n".join(
+            f"{path}:{file_digest(path)}" for path in candidates if os.path.isfile(path)
+        )
+    return _config_fingerprints[cwd]
+
+
+def cache_keys(path):
+    """
+    Result-cache keys ``(flake8_key, mypy_key)`` for ``path``; None when not cacheable.
+
+    flake8 only depends on the file itself, while mypy also reads the modules
+    it imports, so its key covers every source under the file's import root.
+    """
+    key = _norm(path)
+    digest = file_digest(key)
+    if digest is None:
+        return None, None
+    cwd = os.getcwd()
+    common = (_tools(), _config(cwd), cwd, key)
+    flake8_key = ResultCache.key("flake8", *common, digest)
+    sources = collect_sources(_mypy_search_base(key))
+    digests = [file_digest(p) for p in sources]
+    if not sources or None in digests:
+        return flake8_key, None
+    tree = "\n".join(f"{p}:{d}" for p, d in zip(sources, digests))
+    return flake8_key, ResultCache.key("mypy", *common, tree)
+
+
+def cached_result(key):
+    """Returns the cached tool result for ``key`` (or None on a miss)."""
+    hit, value = result_cache.lookup(key)
+    if not hit:
+        return None
+    return _result(*value)
+
+
+def store_result(key, result):
+    """Caches a tool result unless the tool itself failed (exit status > 1)."""
+    if key and result is not None and result.returncode in (0, 1):
+        result_cache.store(key, [result.returncode, result.stdout or "", result.stderr or ""])
+
+
+def shutdown():
+    """Stops the daemon started by this process and removes its state directory."""
+    global _daemon
+    daemon = _daemon
+    if not daemon or daemon["pid"] != os.getpid():
+        # Forked workers share the parent's daemon; only the parent stops it.
+        if daemon:
+            _daemon = False
+        return
+    _daemon = False
+    try:
+        from mypy.dmypy.client import request
+
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            request(daemon["status_file"], "stop", timeout=5)
+    except Exception:
+        pass
+    shutil.rmtree(daemon["state_dir"], ignore_errors=True)
@@ -0,0 +1,355 @@
+"""
+Grid engine for the A-Maze-ing output checks.
+
+The output file's hex rows are decoded into one flat row-major buffer of cell
+values (one byte per cell, through ``bytes.translate``), and the validity
+checks run as whole-array operations on it instead of per-cell Python loops:
+
+- with NumPy installed (``pip install germinette[fast]``) on a ``uint8``
+  array view of the buffer;
+- otherwise on the ``bytes`` themselves, each row turned into a Python integer
+  bitset (one byte per cell) so a row of neighbour comparisons or a 3-cell
+  window is a few C-level integer operations.
+
+Both backends return the same results, in the order the checker reports them.
+Cell bits follow the subject: a set bit is a closed wall, N=0 E=1 S=2 W=3.
+
+``read_output()`` reads an ``OUTPUT_FILE`` through a read-only memory map: the
+separator and trailer are located in the mapping, and the grid rows are
+validated and translated one at a time straight into the packed cell buffer,
+so a large maze costs about one byte per cell rather than a decoded copy of
+the file plus a list of row strings.
+
+``Grid.analyze()`` answers the traversal questions (reachability from ENTRY,
+shortest distances, loops) from one union-find pass over the open passages
+and one breadth-first search, on flat per-cell arrays.
+"""
+import hashlib
+import mmap
+import re
+from collections import deque
+
+try:
+    import numpy
+except ImportError:  # optional: the bytes backend below is used instead
+    numpy = None
+
+NORTH, EAST, SOUTH, WEST = 0, 1, 2, 3
+CLOSED = 0xF
+
+_INVALID = 0xFF
+_HEX = bytearray([_INVALID]) * 256
+for _i, _c in enumerate(b"0123456789abcdef"):
+    _HEX[_c] = _i
+    _HEX[bytes([_c]).upper()[0]] = _i
+_HEX = bytes(_HEX)
+# value -> 1 if the wall is closed / if the cell is fully open, else 0
+_WALL = [bytes((value >> bit) & 1 for value in range(256)) for bit in range(4)]
+_OPEN = bytes(int(value == 0) for value in range(256))
+# The first empty line: at the very start, or right after another line break.
+_SEPARATOR = re.compile(rb"(?:^|\n)\r?\n")
+
+
+def _lowest(bits):
+    """Cell index of the lowest set cell of a row bitset, None if empty."""
+    if not bits:
+        return None
+    return ((bits & -bits).bit_length() - 1) // 8
+
+
+class Grid:
+    """Cells of a ``width`` x ``height`` maze as flat row-major ``bytes``."""
+
+    def __init__(self, width, height, cells, use_numpy=None):
+        if len(cells) != width * height:
+            raise ValueError("cell count does not match the grid size")
+        self.width = width
+        self.height = height
+        # bytes / bytearray buffers (from ``read_output``) are used as they are.
+        self.cells = cells if isinstance(cells, (bytes, bytearray)) else bytes(cells)
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        self._array = (
+            numpy.frombuffer(self.cells, dtype=numpy.uint8).reshape(height, width)
+            if use_numpy and width and height else None
+        )
+
+    @classmethod
+    def parse(cls, rows, use_numpy=None):
+        """Decodes equal-length hex rows; raises ``ValueError`` on other characters or ragged rows."""
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("rows have different lengths")
+        cells = "".join(rows).encode("ascii", "replace").translate(_HEX)
+        if _INVALID in cells:
+            raise ValueError("grid rows must be hex digits only")
+        return cls(width, len(rows), cells, use_numpy)
+
+    def cell(self, x, y):
+        return self.cells[y * self.width + x]
+
+    def rows(self):
+        """Cell values as a list of rows."""
+        w = self.width
+        return [list(self.cells[y * w:(y + 1) * w]) for y in range(self.height)]
+
+    def count(self, value):
+        """Number of cells equal to ``value``."""
+        return self.cells.count(value)
+
+    def open_borders(self):
+        """Sides with an open outer wall, in the order N (top), S (bottom), W (left), E (right)."""
+        w, h = self.width, self.height
+        if not w or not h:
+            return []
+        if self._array is not None:
+            a = self._array
+            edges = {
+                "N": a[0] >> NORTH, "S": a[h - 1] >> SOUTH, "W": a[:, 0] >> WEST, "E": a[:, w - 1] >> EAST,
+            }
+            return [side for side, bits in edges.items() if not numpy.all(bits & 1)]
+        edges = {
+            "N": self.cells[:w].translate(_WALL[NORTH]),
+            "S": self.cells[(h - 1) * w:].translate(_WALL[SOUTH]),
+            "W": self.cells[::w].translate(_WALL[WEST]),
+            "E": self.cells[w - 1::w].translate(_WALL[EAST]),
+        }
+        return [side for side, closed in edges.items() if 0 in closed]
+
+    def incoherent_walls(self):
+        """
+        ``[(kind, x, y)]``: the first wall per row that its two cells disagree on.
+
+        ``kind`` is ``"NS"`` (between (x, y) and (x, y-1)) or ``"EW"`` (between
+        (x, y) and (x+1, y)); on the same cell the N/S wall is reported first.
+        """
+        w, h = self.width, self.height
+        if not w or not h:
+            return []
+        if self._array is not None:
+            a = self._array
+            ns = numpy.zeros((h, w), dtype=bool)
+            ew = numpy.zeros((h, w), dtype=bool)
+            ns[1:] = ((a[1:] >> NORTH) & 1) != ((a[:-1] >> SOUTH) & 1)
+            ew[:, :-1] = ((a[:, :-1] >> EAST) & 1) != ((a[:, 1:] >> WEST) & 1)
+            either = ns | ew
+            ys = numpy.flatnonzero(either.any(axis=1))
+            xs = either[ys].argmax(axis=1)
+            return [("NS" if ns[y, x] else "EW", int(x), int(y)) for y, x in zip(ys, xs)]
+        found = []
+        inner = int.from_bytes(b"\x01" * (w - 1), "little")
+        previous_south = None
+        for y in range(h):
+            row = self.cells[y * w:(y + 1) * w]
+            north = int.from_bytes(row.translate(_WALL[NORTH]), "little")
+            east = int.from_bytes(row.translate(_WALL[EAST]), "little")
+            west = int.from_bytes(row.translate(_WALL[WEST]), "little")
+            x_ns = _lowest(north ^ previous_south) if previous_south is not None else None
+            x_ew = _lowest((east ^ (west >> 8)) & inner)
+            if x_ns is not None and (x_ew is None or x_ns <= x_ew):
+                found.append(("NS", x_ns, y))
+            elif x_ew is not None:
+                found.append(("EW", x_ew, y))
+            previous_south = int.from_bytes(row.translate(_WALL[SOUTH]), "little")
+        return found
+
+    def open_areas(self, size=3):
+        """``[(x, y)]``: the first fully open ``size`` x ``size`` window per window row."""
+        w, h = self.width, self.height
+        if w < size or h < size:
+            return []
+        if self._array is not None:
+            runs = self._array == 0
+            for shift in range(1, size):
+                runs = runs[:, :-1] & (self._array[:, shift:] == 0)
+            windows = runs
+            for shift in range(1, size):
+                windows = windows[:-1] & runs[shift:]
+            ys = numpy.flatnonzero(windows.any(axis=1))
+            xs = windows[ys].argmax(axis=1)
+            return [(int(x), int(y)) for y, x in zip(ys, xs)]
+        runs = []
+        for y in range(h):
+            zero = int.from_bytes(self.cells[y * w:(y + 1) * w].translate(_OPEN), "little")
+            run = zero
+            for shift in range(1, size):
+                run &= zero >> (8 * shift)
+            runs.append(run)
+        found = []
+        for y in range(h - size + 1):
+            window = runs[y]
+            for shift in range(1, size):
+                window &= runs[y + shift]
+            x = _lowest(window)
+            if x is not None:
+                found.append((x, y))
+        return found
+
+    def analyze(self, entry):
+        """
+        Connectivity, distances and loops of the maze, as an ``Analysis``.
+
+        Passages are walls open from the cell's own side, as a student's path
+        is walked: the union-find pass joins each cell with its east and south
+        neighbour through them (a passage between two cells already joined
+        closes a loop), and the search from ``entry`` fills the distances.
+        """
+        w, h, cells = self.width, self.height, self.cells
+        n = w * h
+        parent = list(range(n))
+        size = [1] * n
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        loops = []
+        east_closed = cells.translate(_WALL[EAST])
+        south_closed = cells.translate(_WALL[SOUTH])
+        for i in range(n):
+            for j, closed in ((i + 1, east_closed[i] or (i + 1) % w == 0), (i + w, south_closed[i] or i + w >= n)):
+                if closed:
+                    continue
+                a, b = find(i), find(j)
+                if a == b:
+                    loops.append((i, j))
+                    continue
+                if size[a] < size[b]:
+                    a, b = b, a
+                parent[b] = a
+                size[a] += size[b]
+
+        distance = [-1] * n
+        x, y = entry
+        if 0 <= x < w and 0 <= y < h:
+            start = y * w + x
+            distance[start] = 0
+            queue = deque([start])
+            north, east, south, west = (_WALL[bit] for bit in (NORTH, EAST, SOUTH, WEST))
+            while queue:
+                i = queue.popleft()
+                value, column, step = cells[i], i % w, distance[i] + 1
+                for j, closed in (
+                    (i - w, north[value] or i < w),
+                    (i + 1, east[value] or column == w - 1),
+                    (i + w, south[value] or i + w >= n),
+                    (i - 1, west[value] or column == 0),
+                ):
+                    if not closed and distance[j] < 0:
+                        distance[j] = step
+                        queue.append(j)
+        return Analysis(self, find, size, loops, distance)
+
+
+class Analysis:
+    """
+    Result of ``Grid.analyze``.
+
+    ``distance`` holds, per cell (row-major), the number of steps from ENTRY or
+    -1 if ENTRY cannot reach it. ``components`` counts the connected areas of
+    cells that are not fully closed and ``isolated_closed`` the fully closed
+    cells no passage leads to. ``loops`` lists ``((x, y), (x2, y2))`` passages
+    that close a loop, in row-major order.
+    """
+
+    def __init__(self, grid, find, size, loops, distance):
+        w = grid.width
+        self._find = find
+        self._width, self._height = w, grid.height
+        self.distance = distance
+        roots = set()
+        self.isolated_closed = 0
+        for i, value in enumerate(grid.cells):
+            if value != CLOSED:
+                roots.add(find(i))
+            elif size[find(i)] == 1:
+                self.isolated_closed += 1
+        self.components = len(roots)
+        self.loops = [((a % w, a // w), (b % w, b // w)) for a, b in loops]
+        self.unreachable_open = [
+            (i % w, i // w) for i, value in enumerate(grid.cells) if distance[i] < 0 and value != CLOSED
+        ]
+
+    def distance_to(self, x, y):
+        """Steps from ENTRY to (x, y), None if it is unreachable or outside the grid."""
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return None
+        steps = self.distance[y * self._width + x]
+        return steps if steps >= 0 else None
+
+    def loops_through(self, x, y):
+        """The ``loops`` inside the connected area of (x, y)."""
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return []
+        root = self._find(y * self._width + x)
+        return [loop for loop in self.loops if self._find(loop[0][1] * self._width + loop[0][0]) == root]
+
+
+class Output:
+    """
+    An ``OUTPUT_FILE`` as read by ``read_output``.
+
+    ``trailer`` is the list of lines after the first empty line, None when the
+    file has no empty line. ``height`` counts the grid rows before it and
+    ``width`` is the length of the first; ``ragged`` / ``bad_hex`` tell whether
+    the rows differ in length / hold anything but hex digits. ``cells`` is the
+    packed buffer of the rows, only complete when neither is set. ``digest``
+    identifies the grid rows' text, for comparing two runs' outputs.
+    """
+
+    def __init__(self):
+        self.trailer = None
+        self.width = 0
+        self.height = 0
+        self.ragged = False
+        self.bad_hex = False
+        self.cells = bytearray()
+        self.digest = None
+
+    def grid(self, use_numpy=None):
+        """The rows as a ``Grid``; raises ``ValueError`` if they are not a valid hex grid."""
+        if self.bad_hex or self.ragged:
+            raise ValueError("grid rows must be equal-length hex digits")
+        return Grid(self.width, self.height, self.cells, use_numpy)
+
+
+def read_output(path):
+    """Reads the grid section and trailer of the output file at ``path`` (see ``Output``)."""
+    output = Output()
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file cannot be mapped: it has no separator either
+            return output
+    with mapped:
+        separator = _SEPARATOR.search(mapped)
+        if separator is None:
+            return output
+        # Same lines as ``read_text().splitlines()`` would give for the trailer.
+        trailer = mapped[separator.end():].decode("utf-8", "replace")
+        output.trailer = trailer.replace("\r\n", "\n").replace("\r", "\n").splitlines()
+        digest = hashlib.sha256()
+        end = separator.start()
+        pos = 0
+        while pos < end:
+            newline = mapped.find(b"\n", pos, end)
+            stop = end if newline < 0 else newline
+            row = mapped[pos:stop]
+            if row.endswith(b"\r"):
+                row = row[:-1]
+            digest.update(row + b"\n")
+            if output.height == 0:
+                output.width = len(row)
+            elif len(row) != output.width:
+                output.ragged = True
+            packed = row.translate(_HEX)
+            if not row or _INVALID in packed:
+                output.bad_hex = True
+            if not (output.bad_hex or output.ragged):
+                output.cells += packed
+            output.height += 1
+            pos = stop + 1
+        output.digest = digest.hexdigest()
+    return output
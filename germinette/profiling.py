@@ -0,0 +1,208 @@
+"""
+Timing spans behind ``--profile`` and ``--profile-trace``.
+
+Checks (flake8 / mypy, strict AST rules, docstrings, type hints), student
+script runs, student module imports and each exercise callable open a span
+on the process-wide ``profiler``. Spans are only recorded once ``enable()``
+was called, so an unprofiled run pays one attribute check per call.
+
+A span opened while another of the same phase is open (``_load_module``
+calling ``_load_from_path``) is folded into the outer one. Spans of
+different phases nest (a flake8 check inside an exercise): the report
+shows each phase's self time, so the phases add up to the wall time.
+Forked ``--jobs`` workers send their spans back with their results.
+"""
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+
+DEFAULT_TOP = 10
+
+
+class Profiler:
+    """Collects ``(phase, name, exercise, start, duration, pid)`` spans."""
+
+    def __init__(self):
+        self.enabled = False
+        self.spans = []
+        self.exercise = None
+        self.started = None
+        self._open = set()
+
+    def enable(self):
+        self.enabled = True
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def span(self, phase, name=None):
+        if not self.enabled or phase in self._open:
+            yield
+            return
+        self._open.add(phase)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._open.discard(phase)
+            self.spans.append({
+                "phase": phase,
+                "name": name or phase,
+                "exercise": self.exercise,
+                "start": start,
+                "duration": time.perf_counter() - start,
+                "pid": os.getpid(),
+            })
+
+    @contextmanager
+    def exercise_span(self, name):
+        """Times one exercise callable; spans opened inside are attributed to it."""
+        previous, self.exercise = self.exercise, name
+        try:
+            with self.span("exercise", name):
+                yield
+        finally:
+            self.exercise = previous
+
+    def take(self):
+        """Returns and forgets the spans recorded so far (used by forked workers)."""
+        spans, self.spans = self.spans, []
+        return spans
+
+
+profiler = Profiler()
+
+
+def _detail(args):
+    """Short label for a span from the call's first argument (a path or a command)."""
+    if not args:
+        return ""
+    first = args[0]
+    if isinstance(first, (list, tuple)) and len(first) > 1:
+        first = first[1]
+    if isinstance(first, (str, os.PathLike)):
+        return os.path.basename(os.fspath(first))
+    return str(first)
+
+
+def timed(phase):
+    """Decorator: records each call of a method as a ``phase`` span."""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not profiler.enabled:
+                return method(self, *args, **kwargs)
+            detail = _detail(args)
+            name = f"{method.__name__}({detail})" if detail else method.__name__
+            with profiler.span(phase, name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def self_times(spans):
+    """Adds ``self`` (duration minus directly nested spans) to each span, per process."""
+    for span in spans:
+        span["self"] = span["duration"]
+    ordered = sorted(spans, key=lambda s: (s["pid"], s["start"], -s["duration"]))
+    stack = []
+    for span in ordered:
+        while stack and (stack[-1]["pid"] != span["pid"]
+                         or stack[-1]["start"] + stack[-1]["duration"] <= span["start"]):
+            stack.pop()
+        if stack:
+            stack[-1]["self"] -= span["duration"]
+        stack.append(span)
+    return spans
+
+
+def summarize(spans, top=DEFAULT_TOP):
+    """Aggregates spans into ``{"phases", "exercises", "slowest"}`` rows."""
+    self_times(spans)
+    phases = {}
+    exercises = {}
+    for span in spans:
+        row = phases.setdefault(span["phase"], {"phase": span["phase"], "calls": 0, "total": 0.0, "self": 0.0, "max": 0.0})
+        row["calls"] += 1
+        row["total"] += span["duration"]
+        row["self"] += span["self"]
+        row["max"] = max(row["max"], span["duration"])
+        if span["exercise"] is not None:
+            ex = exercises.setdefault(span["exercise"], {"exercise": span["exercise"], "total": 0.0, "phases": {}})
+            if span["phase"] == "exercise":
+                ex["total"] += span["duration"]
+            ex["phases"][span["phase"]] = ex["phases"].get(span["phase"], 0.0) + span["self"]
+    slowest = sorted((s for s in spans if s["phase"] != "exercise"), key=lambda s: -s["duration"])[:top]
+    return {
+        "phases": sorted(phases.values(), key=lambda r: -r["self"]),
+        "exercises": sorted(exercises.values(), key=lambda r: -r["total"]),
+        "slowest": slowest,
+    }
+
+
+def print_report(console, spans, wall, top=DEFAULT_TOP):
+    """Prints the per-phase, per-exercise and slowest-operation tables."""
+    from rich.markup import escape
+    from rich.table import Table
+
+    summary = summarize(spans, top)
+    console.print()
+    console.rule("[bold cyan]Profile[/bold cyan]")
+
+    table = Table(title=f"Time by phase (wall {wall:.2f}s; self time excludes nested phases, "
+                        "and sums over --jobs workers)")
+    for column in ("Phase", "Calls", "Self", "Total", "Mean", "Max", "% of wall"):
+        table.add_column(column, justify="left" if column == "Phase" else "right")
+    for row in summary["phases"]:
+        table.add_row(
+            row["phase"], str(row["calls"]), f"{row['self']:.3f}s", f"{row['total']:.3f}s",
+            f"{row['total'] / row['calls']:.3f}s", f"{row['max']:.3f}s",
+            f"{100 * row['self'] / wall:.1f}%" if wall else "-",
+        )
+    console.print(table)
+
+    table = Table(title="Time by exercise")
+    table.add_column("Exercise")
+    table.add_column("Total", justify="right")
+    table.add_column("Breakdown (self time)")
+    for row in summary["exercises"]:
+        parts = sorted(row["phases"].items(), key=lambda item: -item[1])
+        breakdown = ", ".join(
+            f"{'other' if phase == 'exercise' else phase} {seconds:.2f}s" for phase, seconds in parts if seconds >= 0.005
+        )
+        table.add_row(escape(str(row["exercise"])), f"{row['total']:.3f}s", breakdown)
+    console.print(table)
+
+    table = Table(title=f"Slowest {len(summary['slowest'])} operations")
+    table.add_column("Phase")
+    table.add_column("Operation", overflow="fold")
+    table.add_column("Exercise")
+    table.add_column("Time", justify="right")
+    for span in summary["slowest"]:
+        table.add_row(span["phase"], escape(span["name"]), escape(str(span["exercise"] or "-")), f"{span['duration']:.3f}s")
+    console.print(table)
+
+
+def write_trace(path, spans, origin):
+    """Writes spans as a Chrome trace-event file (chrome://tracing, Perfetto)."""
+    main_pid = os.getpid()
+    events = []
+    for pid in sorted({span["pid"] for span in spans} | {main_pid}):
+        events.append({
+            "name": "process_name", "ph": "M", "pid": pid, "tid": pid,
+            "args": {"name": "germinette" if pid == main_pid else f"worker {pid}"},
+        })
+    for span in spans:
+        events.append({
+            "name": span["name"],
+            "cat": span["phase"],
+            "ph": "X",
+            "ts": round((span["start"] - origin) * 1e6, 1),
+            "dur": round(span["duration"] * 1e6, 1),
+            "pid": span["pid"],
+            "tid": span["pid"],
+            "args": {"exercise": span["exercise"]},
+        })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
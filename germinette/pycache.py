@@ -0,0 +1,140 @@
+"""
+Keeps grading from leaving ``__pycache__`` directories in the submission.
+
+Importing or running student code normally writes bytecode next to it.
+``setup()`` sends it elsewhere instead of cleaning up afterwards:
+
+- by default to a private ``PYTHONPYCACHEPREFIX`` under
+  ``~/.cache/germinette/pycache``, shared by in-process imports (the subjects'
+  module loaders) and child interpreters (the script runner, ``make``,
+  the lint fallbacks), so repeat runs skip compiling unchanged modules.
+  ``prime()`` compiles the submission's sources there as hash-checked
+  ``.pyc`` files, which Python validates against the source contents rather
+  than its mtime, so an edit within the same second is never missed;
+- with ``GERMINETTE_NO_CACHE=1`` (or no usable cache directory), nowhere:
+  ``sys.dont_write_bytecode`` in-process and ``PYTHONDONTWRITEBYTECODE=1``
+  for children.
+
+Any ``__pycache__`` directory this process still creates (e.g. by a checker
+importing with bytecode enabled) is recorded through an audit hook, and
+``cleanup()`` removes exactly those: no walk of the submission, and nothing
+inside a virtualenv or another ``PRUNE_DIRS`` directory is ever touched.
+Directories the student created themselves are left alone.
+"""
+import os
+import shutil
+import sys
+
+from germinette.cache import prune_dir
+from germinette.utils import user_cache_dir
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Never cleaned up: environments and dependency trees, whoever created them.
+PRUNE_DIRS = {".venv", "venv", "env", ".env", ".tox", ".nox", ".git", "node_modules", "site-packages"}
+
+# Absolute paths of the __pycache__ directories created by this process.
+_created = set()
+_hook_installed = False
+# The private bytecode directory in use, or None.
+prefix = None
+
+
+def _audit(event, args):
+    if event != "os.mkdir" or not args:
+        return
+    path = args[0]
+    if isinstance(path, bytes):
+        path = os.fsdecode(path)
+    if isinstance(path, str) and os.path.basename(path) == "__pycache__":
+        _created.add(os.path.abspath(path))
+
+
+def _track():
+    global _hook_installed
+    if not _hook_installed:
+        sys.addaudithook(_audit)
+        _hook_installed = True
+
+
+def avoid_writes():
+    """Stops bytecode writes for this process and its children; records the ones that slip through."""
+    sys.dont_write_bytecode = True
+    os.environ["PYTHONDONTWRITEBYTECODE"] = "1"
+    _track()
+
+
+def redirect(cache_dir):
+    """Sends the bytecode of this process and of the children it starts to ``cache_dir``."""
+    global prefix
+    prefix = os.path.abspath(cache_dir)
+    sys.pycache_prefix = prefix
+    os.environ["PYTHONPYCACHEPREFIX"] = prefix
+    _track()
+
+
+def setup():
+    """Keeps bytecode out of the submission: a private prefix, or none when caching is off."""
+    if os.environ.get("GERMINETTE_NO_CACHE", "").strip() not in ("", "0"):
+        avoid_writes()
+        return
+    try:
+        redirect(user_cache_dir("pycache"))
+    except OSError:
+        avoid_writes()
+
+
+def prime(root_dir=None):
+    """Compiles the submission's sources into the prefix as hash-checked ``.pyc`` files.
+
+    Sources that already have one are skipped: the import system re-validates
+    it by content and rewrites it (still hash-checked) when the source changed.
+    """
+    if prefix is None or sys.pycache_prefix != prefix or sys.dont_write_bytecode:
+        return
+    import importlib.util
+    import py_compile
+
+    from germinette import lint
+
+    for path in lint.walk_files(root_dir or os.getcwd(), ".py") or ():
+        cfile = importlib.util.cache_from_source(path)
+        if os.path.exists(cfile):
+            continue
+        try:
+            py_compile.compile(
+                path, cfile=cfile, doraise=True, invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH
+            )
+        except (py_compile.PyCompileError, OSError, ValueError):
+            # Syntax errors are reported by the checks themselves.
+            pass
+
+
+def prune(max_bytes=DEFAULT_MAX_BYTES):
+    """Evicts the least recently written ``.pyc`` files once the prefix grows past ``max_bytes``."""
+    if prefix is None:
+        return
+    prune_dir(prefix, max_bytes)
+
+
+def pruned(path, root):
+    """True if ``path`` is inside a ``PRUNE_DIRS`` directory or a virtualenv below ``root``."""
+    relative = os.path.relpath(path, root)
+    parts = relative.split(os.sep)
+    current = root
+    for part in parts[:-1]:
+        current = os.path.join(current, part)
+        if part in PRUNE_DIRS or os.path.exists(os.path.join(current, "pyvenv.cfg")):
+            return True
+    return False
+
+
+def cleanup(root_dir=None):
+    """Removes the ``__pycache__`` directories this process created under ``root_dir`` (default: cwd)."""
+    root = os.path.abspath(root_dir or os.getcwd())
+    prefix = root + os.sep
+    for path in sorted(_created):
+        if not path.startswith(prefix) or pruned(path, root):
+            continue
+        _created.discard(path)
+        shutil.rmtree(path, ignore_errors=True)
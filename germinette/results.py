@@ -0,0 +1,99 @@
+"""
+Machine-readable run results, streamed as JSON Lines (``--format jsonl``).
+
+Each record is one JSON object per line, written and flushed as soon as it
+happens (forked ``--jobs`` workers and batch graders write straight to the
+same stream), so a dashboard can follow a run live. Every record has an
+``event`` field:
+
+- ``run_start`` / ``run_end``: ``module``; ``run_end`` adds ``status``
+  (``pass``, ``fail`` or ``error``), ``errors``, ``failed`` and ``duration``;
+- ``exercise``: ``exercise``, ``status``, ``duration`` and ``cached`` (the
+  verdict was replayed by an incremental run) once an exercise callable returns;
+- ``result``: one recorded failure, with ``exercise``, ``check`` (slug of the
+  error type, e.g. ``style-error``), ``severity``, ``message`` (markup
+  stripped), ``file``, ``line`` and ``duration`` (the last timed check of the
+  exercise, when known);
+- ``submission``: one finished ``germinette batch`` submission.
+
+Context set with ``set_context`` (the batch submission, for instance) is
+added to every record.
+"""
+import json
+import os
+import re
+import time
+
+_stream = None
+_context = {}
+
+# flake8 ("path.py:12:5: E501 ...") or rule ("Line 12: ...") locations in a message
+_LOCATION = re.compile(r"^(?:(?P<file>[^\s:][^:\n]*\.py):(?P<line>\d+):|Line (?P<rule_line>\d+):)", re.MULTILINE)
+
+
+def open_stream(stream, **context):
+    """Starts emitting records to ``stream`` (a text file object, e.g. the real stdout)."""
+    global _stream
+    _stream = stream
+    _context.clear()
+    _context.update(context)
+
+
+def close_stream():
+    global _stream
+    _stream = None
+    _context.clear()
+
+
+def enabled():
+    return _stream is not None
+
+
+def set_context(**context):
+    _context.update(context)
+
+
+def emit(event, **fields):
+    """Writes one record (no-op unless a stream is open)."""
+    if _stream is None:
+        return
+    record = {"event": event, "time": round(time.time(), 3)}
+    record.update(_context)
+    record.update(fields)
+    data = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+    # One write per record so lines from concurrent workers do not interleave mid-line.
+    try:
+        fd = _stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        _stream.write(data.decode("utf-8"))
+        _stream.flush()
+        return
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+
+def check_id(error_type):
+    """``"Style Error"`` -> ``"style-error"``."""
+    return re.sub(r"[^a-z0-9]+", "-", str(error_type).lower()).strip("-") or "error"
+
+
+def plain(markup):
+    """Message text without rich markup."""
+    from rich.errors import MarkupError
+    from rich.text import Text
+
+    try:
+        return Text.from_markup(str(markup)).plain
+    except MarkupError:
+        return str(markup)
+
+
+def location(message):
+    """``(file, line)`` of the first flake8 / rule location in ``message``, else ``(None, None)``."""
+    match = _LOCATION.search(message)
+    if not match:
+        return None, None
+    if match.group("file"):
+        return match.group("file"), int(match.group("line"))
+    return None, int(match.group("rule_line"))
@@ -0,0 +1,486 @@
+"""
+Warm interpreters for running student scripts without a cold interpreter start.
+
+``python path.py`` pays interpreter startup (site, encodings, common stdlib
+imports) on every scenario. Instead a spare interpreter is kept started and
+warm in the background; a script runs in it, and the next spare starts while
+it does. Each spare:
+
+- never imported germinette (it is started with ``-c``), so ``sys.modules``
+  only holds the interpreter's own and a few preloaded stdlib modules, never
+  anything from a previous student run;
+- runs one script only, with its own random ``PYTHONHASHSEED`` (unless the
+  environment pins one), so string hashes and ``set`` order differ between
+  runs exactly as they do between fresh interpreters;
+- gives the script a brand-new ``__main__`` module, ``sys.argv``,
+  ``sys.path[0]``, cwd, environment, stdin and captured stdout / stderr,
+  exactly like a fresh ``python path.py``;
+- reports uncaught exceptions through ``sys.excepthook`` and exits with the
+  same status codes CPython would;
+- on request, lists the files the script opened and the directories it listed
+  (an audit hook installed just before it starts), for incremental re-grading.
+
+``run()`` is the backend of ``germinette.core.ScriptRunner``: it applies
+rlimits before the script starts, kills the whole process group on timeout and
+caps the captured output. It spawns a fresh interpreter, with the same limits
+and result, whenever the pool cannot reproduce the call (other interpreter
+flags, a different ``PYTHON*`` environment, no ``os.fork``) or is busy with a
+call from another thread, so concurrent runs do not wait for each other. Set
+``GERMINETTE_NO_SCRIPT_POOL=1`` to always spawn a fresh interpreter.
+"""
+import atexit
+import json
+import locale
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits
+    resource = None
+
+# Imported by each spare before its script arrives; all are side-effect free.
+PRELOAD = ("abc", "typing", "collections", "dataclasses", "enum", "functools", "itertools", "math")
+
+_SERVER_SOURCE = r'''
+import json, os, sys
+
+req_fd = int(sys.argv[1])
+for _name in sys.argv[2].split(","):
+    if _name:
+        try:
+            __import__(_name)
+        except Exception:
+            pass
+del _name
+
+
+def _exit_code(exc):
+    code = exc.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code & 0xFF
+    try:
+        print(code, file=sys.stderr)
+    except Exception:
+        pass
+    return 1
+
+
+def _apply_limits(limits):
+    import resource
+    for name, (soft, hard) in limits.items():
+        which = getattr(resource, name)
+        current = resource.getrlimit(which)[1]
+        if current != resource.RLIM_INFINITY:
+            soft, hard = min(soft, current), min(hard, current)
+        try:
+            resource.setrlimit(which, (soft, hard))
+        except (ValueError, OSError):
+            pass
+
+
+def _redirect(fd, path, flags):
+    tmp = os.open(path, flags)
+    os.dup2(tmp, fd)
+    os.close(tmp)
+
+
+def _trace():
+    """Audit hook collecting ``[kind, absolute path]`` of every open and directory listing."""
+    seen = set()
+    fsdecode, abspath = os.fsdecode, os.path.abspath
+
+    def hook(event, args):
+        if event == "open":
+            kind = "file"
+        elif event in ("os.listdir", "os.scandir"):
+            kind = "dir"
+        else:
+            return
+        target = args[0] if args else None
+        if target is None and kind == "dir":
+            target = "."
+        if isinstance(target, (str, bytes)):
+            seen.add((kind, abspath(fsdecode(target))))
+
+    sys.addaudithook(hook)
+    return seen
+
+
+def _child(req):
+    os.setpgid(0, 0)
+    _redirect(0, req["stdin"] or os.devnull, os.O_RDONLY)
+    _redirect(1, req["stdout"], os.O_WRONLY | os.O_TRUNC)
+    _redirect(2, req["stderr"], os.O_WRONLY | os.O_TRUNC)
+    os.environ.clear()
+    os.environ.update(req["env"])
+    os.chdir(req["cwd"])
+    if req["limits"]:
+        _apply_limits(req["limits"])
+
+    path = req["argv"][0]
+    sys.argv = list(req["argv"])
+    sys.path[0] = os.path.dirname(os.path.realpath(path))
+    if "random" in sys.modules:
+        sys.modules["random"].seed()
+
+    import builtins, types
+    from importlib.machinery import SourceFileLoader
+    main = types.ModuleType("__main__")
+    main.__file__ = os.path.abspath(path)
+    main.__builtins__ = builtins
+    main.__loader__ = SourceFileLoader("__main__", path)
+    sys.modules["__main__"] = main
+    # Captured now: the script may rebind ``json`` or ``os`` attributes.
+    trace, dump, os_exit = (_trace() if req.get("trace") else None), json.dumps, os._exit
+
+    code = 0
+    try:
+        with open(path, "rb") as f:
+            source = f.read()
+    except OSError as e:
+        sys.stderr.write(f"{sys.executable}: can't open file {os.path.abspath(path)!r}: [Errno {e.errno}] {e.strerror}\n")
+        source, code = None, 2
+    if source is not None:
+        try:
+            exec(compile(source, path, "exec", dont_inherit=True), main.__dict__)
+        except SystemExit as e:
+            code = _exit_code(e)
+        except BaseException:
+            etype, value, tb = sys.exc_info()
+            # Drop this runner's frame so the traceback starts in the student file.
+            tb = tb.tb_next if tb is not None else None
+            sys.excepthook(etype, value.with_traceback(tb), tb)
+            code = 1
+    try:
+        if "threading" in sys.modules:
+            sys.modules["threading"]._shutdown()
+        import atexit
+        atexit._run_exitfuncs()
+    except SystemExit as e:
+        code = _exit_code(e)
+    except BaseException:
+        pass
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+    if trace is not None:
+        try:
+            with open(req["trace"], "w", encoding="utf-8") as f:
+                f.write(dump(sorted(trace)))
+        except Exception:
+            pass
+    os_exit(code)
+
+
+with os.fdopen(req_fd, "rb") as requests:
+    line = requests.readline()
+if line:
+    _child(json.loads(line))
+'''
+
+
+def _python_env(env):
+    # Variables read at interpreter startup: a forked child cannot apply new values.
+    return {k: v for k, v in env.items() if k.startswith("PYTHON")}
+
+
+def _pinned_hash_seed(env):
+    return env.get("PYTHONHASHSEED", "random") not in ("", "random")
+
+
+def _disabled():
+    return os.environ.get("GERMINETTE_NO_SCRIPT_POOL", "").strip() not in ("", "0")
+
+
+def _apply_limits(limits):
+    # Same as the spare's copy; runs in the child between fork and exec.
+    for name, (soft, hard) in limits.items():
+        which = getattr(resource, name)
+        current = resource.getrlimit(which)[1]
+        if current != resource.RLIM_INFINITY:
+            soft, hard = min(soft, current), min(hard, current)
+        try:
+            resource.setrlimit(which, (soft, hard))
+        except (ValueError, OSError):
+            pass
+
+
+class _PoolError(Exception):
+    """The spare misbehaved; the caller falls back to a fresh interpreter."""
+
+
+class ScriptPool:
+    """One warm spare interpreter per process, replaced after each script (a forked germinette worker starts its own)."""
+
+    def __init__(self):
+        self._proc = None
+        self._owner = None
+        self._requests = None
+        self._workdir = None
+        self._python_env = None
+        # One script at a time: the capture files in the work directory are shared.
+        self.lock = threading.Lock()
+
+    def _start(self):
+        if self._owner != os.getpid() or self._workdir is None:
+            self._workdir = tempfile.mkdtemp(prefix="germinette-run-")
+        env = dict(os.environ)
+        if not _pinned_hash_seed(env):
+            # A fresh ``python`` picks a random hash seed; the spare must too.
+            env["PYTHONHASHSEED"] = str(int.from_bytes(os.urandom(4), "little") % 4294967295 + 1)
+        req_r, req_w = os.pipe()
+        try:
+            self._proc = subprocess.Popen(
+                [sys.executable, "-c", _SERVER_SOURCE, str(req_r), ",".join(PRELOAD)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                pass_fds=(req_r,),
+                env=env,
+            )
+        except BaseException:
+            os.close(req_w)
+            raise
+        finally:
+            os.close(req_r)
+        self._owner = os.getpid()
+        self._requests = os.fdopen(req_w, "wb", buffering=0)
+        self._python_env = _python_env(os.environ)
+
+    def _ensure_started(self):
+        if self._proc is not None and self._owner != os.getpid():
+            # Inherited from the parent through fork: leave it to the parent.
+            self._proc = None
+        if self._proc is None or self._proc.poll() is not None:
+            self._start()
+
+    def eligible(self, cmd, env):
+        return (
+            hasattr(os, "fork")
+            and not _disabled()
+            and len(cmd) >= 2
+            and cmd[0] == sys.executable
+            and not str(cmd[1]).startswith("-")
+            and (self._python_env is None or _python_env(env) == self._python_env)
+        )
+
+    def run(self, cmd, cwd=None, input=None, timeout=None, env=None, limits=None, max_output_bytes=None,
+            trace=False):
+        """Runs ``cmd`` (``[sys.executable, script, *args]``) in the warm spare interpreter; see ``run()``."""
+        env = dict(os.environ if env is None else env)
+        self._ensure_started()
+        if _python_env(env) != self._python_env:
+            raise _PoolError("interpreter environment differs from the spare's")
+
+        proc, requests = self._proc, self._requests
+        self._proc = self._requests = None
+
+        files = _prepare_files(self._workdir, input)
+        request = {
+            "argv": [str(part) for part in cmd[1:]],
+            # The spare's cwd is wherever it was started: always pass the caller's.
+            "cwd": os.path.abspath(os.fspath(cwd) if cwd else os.getcwd()),
+            "env": env,
+            "limits": limits or {},
+            "stdin": files["stdin"] if input is not None else None,
+            "stdout": files["stdout"],
+            "stderr": files["stderr"],
+            "trace": files["trace"] if trace else None,
+        }
+        started = time.monotonic()
+        try:
+            with requests:
+                requests.write(json.dumps(request).encode() + b"\n")
+        except OSError as e:
+            _kill_group(proc.pid)
+            proc.wait()
+            raise _PoolError(str(e))
+        try:
+            # The next script's interpreter warms up while this one runs.
+            self._start()
+        except OSError:
+            pass
+
+        deadline = None if timeout is None else started + timeout
+        timed_out = False
+        try:
+            message = _wait(proc.pid, deadline)
+        except TimeoutError:
+            timed_out = True
+        except BaseException:
+            # KeyboardInterrupt: the student script must not outlive us.
+            _kill_group(proc.pid)
+            raise
+        if timed_out:
+            _kill_group(proc.pid)
+            message = _wait(proc.pid, None)
+        # Reaped above: keep Popen from waiting on the pid again.
+        proc.returncode = os.waitstatus_to_exitcode(message["status"])
+        return _collect(cmd, files, message, started, timed_out, max_output_bytes)
+
+    def close(self):
+        """Stops the spare (it also exits on its own when this process goes away)."""
+        proc, self._proc = self._proc, None
+        if proc is None or self._owner != os.getpid():
+            return
+        try:
+            self._requests.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        shutil.rmtree(self._workdir, ignore_errors=True)
+        self._workdir = None
+
+
+def _prepare_files(workdir, input):
+    files = {name: os.path.join(workdir, name) for name in ("stdin", "stdout", "stderr", "trace")}
+    for name in ("stdout", "stderr"):
+        open(files[name], "wb").close()
+    try:
+        os.remove(files["trace"])
+    except FileNotFoundError:
+        pass
+    if input is not None:
+        with open(files["stdin"], "wb") as f:
+            f.write(input.encode(locale.getpreferredencoding(False)))
+    return files
+
+
+def _collect(cmd, files, message, started, timed_out, max_output_bytes):
+    encoding = locale.getpreferredencoding(False)
+    result = subprocess.CompletedProcess(args=cmd, returncode=os.waitstatus_to_exitcode(message["status"]))
+    result.truncated = False
+    for name in ("stdout", "stderr"):
+        text, truncated = _read_text(files[name], encoding, max_output_bytes)
+        setattr(result, name, text)
+        result.truncated = result.truncated or truncated
+    try:
+        with open(files["trace"], "r", encoding="utf-8") as f:
+            result.opened = [tuple(entry) for entry in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        result.opened = None
+    result.duration = time.monotonic() - started
+    result.maxrss_kb = message.get("maxrss_kb")
+    result.cpu_seconds = message.get("cpu_seconds")
+    result.timed_out = timed_out
+    return result
+
+
+def _kill_group(pid):
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except OSError:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+def _wait(pid, deadline):
+    """``os.wait4`` with a deadline (raises ``TimeoutError``); returns the status message."""
+    delay = 0.001
+    while True:
+        wpid, status, usage = os.wait4(pid, 0 if deadline is None else os.WNOHANG)
+        if wpid:
+            return {
+                "status": status,
+                "maxrss_kb": usage.ru_maxrss,
+                "cpu_seconds": usage.ru_utime + usage.ru_stime,
+            }
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.05)
+
+
+def _spawn(cmd, cwd, input, timeout, env, limits, max_output_bytes):
+    """Fresh-interpreter path with the same limits, capture and result as the pool."""
+    with tempfile.TemporaryDirectory(prefix="germinette-run-") as workdir:
+        files = _prepare_files(workdir, input)
+        preexec = None
+        if limits and resource is not None:
+            def preexec():
+                _apply_limits(limits)
+        started = time.monotonic()
+        with open(files["stdin"] if input is not None else os.devnull, "rb") as stdin, \
+                open(files["stdout"], "wb") as stdout, open(files["stderr"], "wb") as stderr:
+            proc = subprocess.Popen(
+                cmd, cwd=cwd, env=env, stdin=stdin, stdout=stdout, stderr=stderr,
+                start_new_session=True, preexec_fn=preexec,
+            )
+        deadline = None if timeout is None else started + timeout
+        timed_out = False
+        try:
+            message = _wait(proc.pid, deadline)
+        except TimeoutError:
+            timed_out = True
+        except BaseException:
+            _kill_group(proc.pid)
+            raise
+        if timed_out:
+            _kill_group(proc.pid)
+            message = _wait(proc.pid, None)
+        # Reaped above: keep Popen from waiting on the pid again.
+        proc.returncode = os.waitstatus_to_exitcode(message["status"])
+        return _collect(cmd, files, message, started, timed_out, max_output_bytes)
+
+
+def _read_text(path, encoding, max_bytes=None):
+    with open(path, "rb") as f:
+        data = f.read() if max_bytes is None else f.read(max_bytes + 1)
+    truncated = max_bytes is not None and len(data) > max_bytes
+    if truncated:
+        data = data[:max_bytes]
+    # Same newline translation as subprocess text mode.
+    return data.decode(encoding, errors="replace").replace("\r\n", "\n").replace("\r", "\n"), truncated
+
+
+pool = ScriptPool()
+atexit.register(pool.close)
+if hasattr(os, "register_at_fork"):
+    # A forked worker starts its own spare; another thread's call is not running there.
+    os.register_at_fork(after_in_child=lambda: setattr(pool, "lock", threading.Lock()))
+
+
+def run(cmd, cwd=None, input=None, timeout=None, env=None, limits=None, max_output_bytes=None, trace=False):
+    """
+    Runs ``cmd`` (``[sys.executable, script, *args]``) with captured text output.
+
+    Uses the warm spare interpreter when it can reproduce the call and a fresh
+    interpreter otherwise. Scripts get an empty stdin unless ``input`` is given.
+    ``limits`` maps ``resource.RLIMIT_*`` names to ``(soft, hard)`` and is
+    applied in the child; stdout / stderr are each cut at ``max_output_bytes``.
+
+    Never raises on timeout: the script's process group is killed and the
+    returned ``CompletedProcess`` carries ``timed_out``, ``truncated``,
+    ``duration``, ``maxrss_kb`` and ``cpu_seconds`` besides the usual fields.
+    With ``trace``, ``opened`` lists the ``(kind, path)`` of the files ("file")
+    and directories ("dir") the script opened; it is None when that is unknown
+    (fresh interpreter, or the script was killed or left through ``os._exit``).
+    """
+    effective_env = os.environ if env is None else env
+    if pool.eligible(cmd, effective_env) and pool.lock.acquire(blocking=False):
+        try:
+            return pool.run(cmd, cwd=cwd, input=input, timeout=timeout, env=env,
+                            limits=limits, max_output_bytes=max_output_bytes, trace=trace)
+        except _PoolError:
+            pass
+        finally:
+            pool.lock.release()
+    return _spawn(cmd, cwd, input, timeout, env, limits, max_output_bytes)
@@ -0,0 +1,87 @@
+"""
+Per-run index of parsed student sources.
+
+Every static check used to open, read and ``ast.parse`` the same file again and
+then ``ast.walk`` the whole tree looking for one node type. ``source_index``
+parses each path once (re-parsing only when its mtime or size changes) and
+collects the node lists the checkers need in that same single walk, in
+``ast.walk`` order.
+"""
+import ast
+import os
+
+
+class SourceFile:
+    """One parsed file and its node lists, each in ``ast.walk`` order."""
+
+    def __init__(self, path, source):
+        self.path = path
+        self.source = source
+        self.tree = ast.parse(source)
+        self.calls = []
+        self.imports = []
+        self.functions = []
+        self.classes = []
+        self.tries = []
+        self.attributes = []
+        self.lambdas = []
+        # node -> position in ast.walk order, to merge lists of different types
+        self.order = {}
+
+        buckets = {
+            ast.Call: self.calls,
+            ast.Import: self.imports,
+            ast.ImportFrom: self.imports,
+            ast.FunctionDef: self.functions,
+            ast.AsyncFunctionDef: self.functions,
+            ast.ClassDef: self.classes,
+            ast.Try: self.tries,
+            ast.Attribute: self.attributes,
+            ast.Lambda: self.lambdas,
+        }
+        for position, node in enumerate(ast.walk(self.tree)):
+            bucket = buckets.get(type(node))
+            if bucket is not None:
+                bucket.append(node)
+                self.order[node] = position
+
+    @property
+    def definitions(self):
+        """Functions and classes together, in ``ast.walk`` order."""
+        return sorted(self.functions + self.classes, key=self.order.__getitem__)
+
+
+class SourceIndex:
+    """Caches a ``SourceFile`` per path, keyed by (mtime, size)."""
+
+    def __init__(self):
+        self._files = {}
+
+    def get(self, path):
+        """
+        Returns the ``SourceFile`` for ``path``.
+
+        Raises what reading and parsing would (``OSError``, ``UnicodeDecodeError``,
+        ``SyntaxError``), so callers keep their existing error handling.
+        """
+        key = os.path.normpath(os.path.abspath(path))
+        st = os.stat(key)
+        signature = (st.st_mtime_ns, st.st_size)
+        entry = self._files.get(key)
+        if entry is None or entry[0] != signature:
+            try:
+                with open(key, "r", encoding="utf-8") as f:
+                    entry = (signature, SourceFile(key, f.read()))
+            except (UnicodeDecodeError, SyntaxError, ValueError) as e:
+                # Unparsable files fail the same way for every checker: remember that too.
+                entry = (signature, e)
+            self._files[key] = entry
+        if isinstance(entry[1], Exception):
+            raise entry[1]
+        return entry[1]
+
+    def clear(self):
+        self._files.clear()
+
+
+source_index = SourceIndex()
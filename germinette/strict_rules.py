@@ -0,0 +1,145 @@
+"""
+Rule engine behind ``BaseTester.verify_strict``.
+
+Each rule lists the AST node types it inspects; ``run_rules`` walks the tree
+once and hands every node to the rules registered for its type. Rules collect
+all their violations (with line numbers), so students see every problem of a
+kind in one run instead of fixing them one at a time.
+"""
+import ast
+import builtins
+
+# Computed once per process instead of on every check.
+BUILTIN_NAMES = frozenset(dir(builtins))
+BUILTIN_EXCEPTIONS = frozenset(
+    name for name in BUILTIN_NAMES
+    if isinstance(getattr(builtins, name), type)
+    and issubclass(getattr(builtins, name), BaseException)
+)
+
+# __future__ is always legal (e.g. `from __future__ import annotations`).
+# typing_extensions: backport for Self, ParamSpec, etc. on Python < 3.11 (e.g. 42 lab 3.10)
+ALWAYS_ALLOWED_IMPORTS = frozenset({"typing", "typing_extensions", "collections", "__future__"})
+
+
+class Rule:
+    """One strict check; ``report()`` returns its error message or None."""
+
+    node_types = ()
+    error_type = ""
+    ko_label = ""
+
+    def __init__(self):
+        self.violations = []
+
+    def visit(self, node):
+        raise NotImplementedError
+
+    def add(self, node, text):
+        self.violations.append((getattr(node, "lineno", 0), getattr(node, "col_offset", 0), text))
+
+    def lines(self):
+        return [f"Line {lineno}: {text}" for lineno, _, text in sorted(self.violations)]
+
+    def report(self):
+        if not self.violations:
+            return None
+        return "\n".join(self.lines())
+
+
+class NoFileIORule(Rule):
+    node_types = (ast.Call,)
+    error_type = "Forbidden Operation"
+    ko_label = "Forbidden Operation"
+
+    def visit(self, node):
+        if isinstance(node.func, ast.Name) and node.func.id == "open":
+            self.add(node, "open()")
+
+    def report(self):
+        if not self.violations:
+            return None
+        return "\n".join(["File I/O Forbidden: 'open()' function detected."] + self.lines())
+
+
+class AllowedImportsRule(Rule):
+    node_types = (ast.Import, ast.ImportFrom)
+    error_type = "Forbidden Import"
+    ko_label = "Forbidden Import"
+
+    def __init__(self, allowed_modules):
+        super().__init__()
+        self.allowed = set(allowed_modules) | ALWAYS_ALLOWED_IMPORTS
+
+    def visit(self, node):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split(".")[0] not in self.allowed:
+                    self.add(node, f"Forbidden Import: '{alias.name}' is not authorized.")
+        # Allow relative imports (level > 0)
+        elif node.level == 0 and node.module and node.module.split(".")[0] not in self.allowed:
+            self.add(node, f"Forbidden Import: '{node.module}' is not authorized.")
+
+
+class RequireTryExceptRule(Rule):
+    node_types = (ast.Try,)
+    error_type = "Structure Error"
+    ko_label = "Strictness"
+
+    def __init__(self):
+        super().__init__()
+        self.found = False
+
+    def visit(self, node):
+        self.found = True
+
+    def report(self):
+        if self.found:
+            return None
+        return "Strict check failed: You MUST use 'try/except' blocks."
+
+
+class AuthorizedFunctionsRule(Rule):
+    node_types = (ast.Call,)
+    error_type = "Authorized Functions"
+    ko_label = "Forbidden Function"
+
+    def __init__(self, allowed):
+        super().__init__()
+        self.allowed_list = list(allowed)
+        # Per-exercise ``allowed`` list is authoritative for builtins; exceptions + super are extra.
+        self.allowed = set(allowed) | BUILTIN_EXCEPTIONS | {"super"}
+
+    def visit(self, node):
+        # Only global builtins are restricted: methods on objects (e.g. list.append)
+        # cannot be resolved from the AST alone.
+        if isinstance(node.func, ast.Name):
+            name = node.func.id
+            if name in BUILTIN_NAMES and name not in self.allowed:
+                self.add(node, f"You used '{name}()' which is NOT authorized.")
+
+    def report(self):
+        if not self.violations:
+            return None
+        return "\n".join(self.lines() + [f"Authorized: {', '.join(self.allowed_list)}"])
+
+
+class RuleVisitor(ast.NodeVisitor):
+    """Dispatches each node to the rules registered for its type, in one traversal."""
+
+    def __init__(self, rules):
+        self.dispatch = {}
+        for rule in rules:
+            for node_type in rule.node_types:
+                self.dispatch.setdefault(node_type, []).append(rule)
+
+    def visit(self, node):
+        for rule in self.dispatch.get(type(node), ()):
+            rule.visit(node)
+        self.generic_visit(node)
+
+
+def run_rules(tree, rules):
+    """Evaluates ``rules`` over ``tree`` in a single traversal and returns them."""
+    RuleVisitor(rules).visit(tree)
+    return rules
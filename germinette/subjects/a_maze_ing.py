@@ -1,18 +1,241 @@
 import os
 import re
 import ast
-import subprocess
+import random
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import deque
 from rich.console import Console
 from rich.panel import Panel
 
+from germinette import maze
 from germinette.core import BaseTester
 
 console = Console()
 
 
+def _output_signature(cfg_path):
+    """``(mtime_ns, size, inode)`` of the config's OUTPUT_FILE; None when it is missing or not configured."""
+    try:
+        cfg_txt = cfg_path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    m = re.search(r"^\s*OUTPUT_FILE\s*=\s*(.+?)\s*$", cfg_txt, re.MULTILINE)
+    if not m:
+        return None
+    try:
+        st = os.stat(Path.cwd() / m.group(1).strip())
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _maze_settings(cfg_text):
+    """``(width, height, entry, exit_, perfect)`` from a config, None if one of them is missing."""
+    width_m = re.search(r"^\s*WIDTH\s*=\s*(\d+)\s*$", cfg_text, re.MULTILINE)
+    height_m = re.search(r"^\s*HEIGHT\s*=\s*(\d+)\s*$", cfg_text, re.MULTILINE)
+    entry_m = re.search(r"^\s*ENTRY\s*=\s*(\d+)\s*,\s*(\d+)\s*$", cfg_text, re.MULTILINE)
+    exit_m = re.search(r"^\s*EXIT\s*=\s*(\d+)\s*,\s*(\d+)\s*$", cfg_text, re.MULTILINE)
+    perfect_m = re.search(r"^\s*PERFECT\s*=\s*(True|False)\s*$", cfg_text, re.MULTILINE)
+    if not (width_m and height_m and entry_m and exit_m and perfect_m):
+        return None
+    return (
+        int(width_m.group(1)),
+        int(height_m.group(1)),
+        (int(entry_m.group(1)), int(entry_m.group(2))),
+        (int(exit_m.group(1)), int(exit_m.group(2))),
+        perfect_m.group(1) == "True",
+    )
+
+
+def _pattern_42_findings(width, height, closed_cells, runtime_output):
+    # Subject v2.1: a visible "42" should be drawn using fully closed cells.
+    # If maze size is too small, omission is allowed but should be reported.
+    if width < 5 or height < 5:
+        if closed_cells == 0 and not re.search(r"too small|42", runtime_output, re.IGNORECASE):
+            return [("Maze Validity", 'Maze is too small to draw "42", but no explanatory message was printed.')]
+        return []
+    if closed_cells < 6:
+        return [("Maze Validity", 'Maze should contain a visible "42" made of several fully closed cells (0xF).')]
+    return []
+
+
+def _check_output(output, *, width, height, entry, exit_, perfect, runtime_output):
+    """
+    Validates a ``maze.Output`` against the config; returns ``(findings, validated)``.
+
+    ``findings`` are ``(error_type, message)`` pairs in report order.
+    ``validated`` is None when the file is not in the output format at all,
+    False when its grid cannot be checked (not hex, wrong size) and True once
+    every maze rule ran. Used by the main run and by each ``--sweep`` run.
+    """
+    findings = []
+    if output.trailer is None:
+        findings.append(("Format Error", "Output file must contain an empty separator line."))
+        return findings, None
+    trailer = output.trailer
+    if len(trailer) != 3:
+        findings.append(("Format Error", "Output trailer must contain exactly 3 lines: ENTRY, EXIT, shortest path."))
+        return findings, None
+    if not output.height:
+        findings.append(("Format Error", "Hex grid section is empty."))
+        return findings, None
+    if output.bad_hex:
+        findings.append(("Format Error", "Grid rows must be hex digits only."))
+    coord_re = re.compile(r"^\d+,\d+$")
+    if not coord_re.match(trailer[0]) or not coord_re.match(trailer[1]):
+        findings.append(("Format Error", "ENTRY/EXIT lines must be `x,y` coordinates."))
+    if not re.fullmatch(r"[NESW]*", trailer[2]):
+        findings.append(("Format Error", "Shortest path must only use letters N/E/S/W."))
+    if output.bad_hex:
+        return findings, False
+    if output.height != height or output.ragged or output.width != width:
+        findings.append(("Format Error", "Grid dimensions in output file do not match WIDTH/HEIGHT."))
+        return findings, False
+    maze_grid = output.grid()
+    cells = maze_grid.cells
+
+    if trailer[0].replace(" ", "") != f"{entry[0]},{entry[1]}":
+        findings.append(("Format Error", "ENTRY line does not match config ENTRY."))
+    if trailer[1].replace(" ", "") != f"{exit_[0]},{exit_[1]}":
+        findings.append(("Format Error", "EXIT line does not match config EXIT."))
+
+    # Border walls must be closed.
+    border_messages = {
+        "N": "Top border cells must have North wall closed.",
+        "S": "Bottom border cells must have South wall closed.",
+        "W": "Left border cells must have West wall closed.",
+        "E": "Right border cells must have East wall closed.",
+    }
+    for side in maze_grid.open_borders():
+        findings.append(("Maze Validity", border_messages[side]))
+
+    # Neighbor wall coherence (first incoherent wall of each row).
+    for kind, x, y in maze_grid.incoherent_walls():
+        if kind == "NS":
+            message = f"Incoherent N/S wall between ({x},{y}) and ({x},{y-1})."
+        else:
+            message = f"Incoherent E/W wall between ({x},{y}) and ({x+1},{y})."
+        findings.append(("Maze Coherence", message))
+
+    # No 3x3 fully open area.
+    for x, y in maze_grid.open_areas(3):
+        findings.append(("Maze Validity", f"Forbidden 3x3 open area found near ({x},{y})."))
+
+    findings.extend(_pattern_42_findings(width, height, maze_grid.count(maze.CLOSED), runtime_output))
+
+    def is_closed(cell, direction):
+        # bit mapping from subject: N=0 E=1 S=2 W=3
+        return ((cell >> direction) & 1) == 1
+
+    moves = {"N": (0, -1, 0), "E": (1, 0, 1), "S": (0, 1, 2), "W": (-1, 0, 3)}
+
+    # One union-find pass over the passages plus one BFS from ENTRY answer
+    # connectivity, shortest distance and the PERFECT check below.
+    analysis = maze_grid.analyze(entry)
+
+    # Connectivity check: subject allows isolated cells for the "42" pattern.
+    # We tolerate disconnected cells only if they are fully closed (0xF).
+    disconnected_open = analysis.unreachable_open
+    if disconnected_open:
+        x, y = disconnected_open[0]
+        findings.append((
+            "Maze Validity",
+            "Maze has disconnected non-closed cells; only isolated fully closed pattern cells are tolerated. "
+            f"{len(disconnected_open)} open cell(s) cannot be reached from ENTRY, the first at ({x},{y}) "
+            f"({analysis.components} separate open areas, {analysis.isolated_closed} isolated closed cells).",
+        ))
+
+    # Shortest path correctness from trailer.
+    path = trailer[2].strip()
+    cx, cy = entry
+    path_ok = True
+    for step in path:
+        dx, dy, bit = moves[step]
+        if is_closed(cells[cy * width + cx], bit):
+            path_ok = False
+            break
+        cx += dx
+        cy += dy
+        if not (0 <= cx < width and 0 <= cy < height):
+            path_ok = False
+            break
+    if not path_ok or (cx, cy) != exit_:
+        findings.append(("Path Error", "Provided path is invalid or does not reach EXIT."))
+    else:
+        shortest_len = analysis.distance_to(*exit_)
+        if shortest_len is None or len(path) != shortest_len:
+            findings.append(("Path Error", "Provided path is not a shortest valid path."))
+
+    # PERFECT=True must imply unique path between entry and exit.
+    # We evaluate this on the traversable component from ENTRY: any passage
+    # closing a loop there means it is not a tree.
+    if perfect:
+        loops = analysis.loops_through(*entry)
+        if loops:
+            (ax, ay), (bx, by) = loops[0]
+            findings.append((
+                "Perfect Maze Error",
+                "PERFECT=True but traversable maze component is not a tree: "
+                f"{len(loops)} loop(s), e.g. through the passage between ({ax},{ay}) and ({bx},{by}).",
+            ))
+    return findings, True
+
+
+def _sweep_cases(count, width, height, entry, exit_, perfect, base_seed):
+    """
+    ``count`` configs for ``--sweep``: consecutive seeds after ``base_seed``
+    (the main run already covers it), PERFECT alternating starting from the
+    configured value, and from the second config on a random size (by seed)
+    that still holds ENTRY and EXIT, up to twice the configured one.
+    """
+    min_width = max(entry[0], exit_[0], 1) + 1
+    min_height = max(entry[1], exit_[1], 1) + 1
+    cases = []
+    for index in range(count):
+        seed = base_seed + 1 + index
+        if index:
+            rng = random.Random(seed)
+            size = (
+                rng.randint(min_width, max(min_width, 2 * width)),
+                rng.randint(min_height, max(min_height, 2 * height)),
+            )
+        else:
+            size = (width, height)
+        cases.append({
+            "seed": seed, "width": size[0], "height": size[1], "entry": entry, "exit": exit_,
+            "perfect": perfect if index % 2 == 0 else not perfect,
+        })
+    return cases
+
+
+def _run_sweep_case(main_path, cfg_path, output_path, case):
+    """Runs the generator on one ``--sweep`` config and checks its output; returns the findings."""
+    try:
+        result = BaseTester.script_runner.run(
+            [sys.executable, main_path, cfg_path],
+            timeout=20,
+            env={**os.environ, "TERM": "dumb"},
+        )
+    except Exception as e:
+        return [("Run Error", str(e))]
+    if result.killed_by:
+        return [("Run Error", result.stderr.rstrip().rsplit("\n", 1)[-1])]
+    if not os.path.exists(output_path):
+        return [("Missing Output", f"No output file was written (exit code {result.returncode}).")]
+    findings, _ = _check_output(
+        maze.read_output(output_path),
+        width=case["width"],
+        height=case["height"],
+        entry=case["entry"],
+        exit_=case["exit"],
+        perfect=case["perfect"],
+        runtime_output=(result.stdout or "") + (result.stderr or ""),
+    )
+    return findings
+
+
 class Tester(BaseTester):
     def __init__(self):
         super().__init__()
@@ -32,6 +255,8 @@ class Tester(BaseTester):
         self.test_reusable_module()
         self.test_main_script_and_output()
         self.test_seed_interactive_regen_logic()
+        if getattr(self, "sweep", 0):
+            self.test_seed_sweep(self.sweep)
 
         self.display_error_report()
 
@@ -288,23 +513,23 @@ class Tester(BaseTester):
             console.print("[red]KO (style)[/red]")
             return
 
-        run_cmd = [os.sys.executable, str(main_path), str(cfg_path)]
+        run_cmd = [sys.executable, str(main_path), str(cfg_path)]
+        # Taken before the run: only an output this run rewrote may stand in for a seed run.
+        output_before = _output_signature(cfg_path)
         try:
-            result = subprocess.run(
+            result = self.script_runner.run(
                 run_cmd,
-                capture_output=True,
-                text=True,
                 timeout=15,
                 env={**os.environ, "TERM": "dumb"},
             )
-        except subprocess.TimeoutExpired:
+        except Exception as e:
+            self.record_error(label, "Run Error", str(e))
+            return
+        if result.killed_by == "timeout":
             self.warnings.append(
                 "Runtime check timed out (likely interactive display); skipped strict run validation."
             )
             return
-        except Exception as e:
-            self.record_error(label, "Run Error", str(e))
-            return
 
         # Some projects require an interactive TTY for curses/graphics; mark warning.
         combined = (result.stdout or "") + (result.stderr or "")
@@ -318,15 +543,11 @@ class Tester(BaseTester):
         # Validate output file format and maze consistency if available.
         cfg_txt = cfg_path.read_text(encoding="utf-8", errors="replace")
         m = re.search(r"^\s*OUTPUT_FILE\s*=\s*(.+?)\s*$", cfg_txt, re.MULTILINE)
-        width_m = re.search(r"^\s*WIDTH\s*=\s*(\d+)\s*$", cfg_txt, re.MULTILINE)
-        height_m = re.search(r"^\s*HEIGHT\s*=\s*(\d+)\s*$", cfg_txt, re.MULTILINE)
-        entry_m = re.search(r"^\s*ENTRY\s*=\s*(\d+)\s*,\s*(\d+)\s*$", cfg_txt, re.MULTILINE)
-        exit_m = re.search(r"^\s*EXIT\s*=\s*(\d+)\s*,\s*(\d+)\s*$", cfg_txt, re.MULTILINE)
-        perfect_m = re.search(r"^\s*PERFECT\s*=\s*(True|False)\s*$", cfg_txt, re.MULTILINE)
+        settings = _maze_settings(cfg_txt)
         if not m:
             self.record_error(label, "Config Error", "OUTPUT_FILE not found in config.txt")
             return
-        if not (width_m and height_m and entry_m and exit_m and perfect_m):
+        if settings is None:
             self.record_error(
                 label,
                 "Config Error",
@@ -334,11 +555,7 @@ class Tester(BaseTester):
             )
             return
         out_name = m.group(1).strip()
-        width = int(width_m.group(1))
-        height = int(height_m.group(1))
-        entry = (int(entry_m.group(1)), int(entry_m.group(2)))
-        exit_ = (int(exit_m.group(1)), int(exit_m.group(2)))
-        perfect = perfect_m.group(1) == "True"
+        width, height, entry, exit_, perfect = settings
         out_path = Path(out_name)
         if not out_path.is_absolute():
             out_path = Path.cwd() / out_name
@@ -350,201 +567,27 @@ class Tester(BaseTester):
             )
             return
 
-        lines = out_path.read_text(encoding="utf-8", errors="replace").splitlines()
-        if "" not in lines:
-            self.record_error(label, "Format Error", "Output file must contain an empty separator line.")
-            return
-        sep = lines.index("")
-        grid = lines[:sep]
-        trailer = lines[sep + 1 :]
-        if len(trailer) != 3:
-            self.record_error(
-                label,
-                "Format Error",
-                "Output trailer must contain exactly 3 lines: ENTRY, EXIT, shortest path.",
-            )
-            return
-        if not grid:
-            self.record_error(label, "Format Error", "Hex grid section is empty.")
+        output = maze.read_output(out_path)
+        findings, validated = _check_output(
+            output, width=width, height=height, entry=entry, exit_=exit_, perfect=perfect, runtime_output=combined
+        )
+        for error_type, message in findings:
+            self.record_error(label, error_type, message)
+        if validated is None:
             return
-        hex_re = re.compile(r"^[0-9A-Fa-f]+$")
-        if any(not hex_re.match(row) for row in grid):
-            self.record_error(label, "Format Error", "Grid rows must be hex digits only.")
-        coord_re = re.compile(r"^\d+,\d+$")
-        if not coord_re.match(trailer[0]) or not coord_re.match(trailer[1]):
-            self.record_error(label, "Format Error", "ENTRY/EXIT lines must be `x,y` coordinates.")
-        if not re.fullmatch(r"[NESW]*", trailer[2]):
-            self.record_error(label, "Format Error", "Shortest path must only use letters N/E/S/W.")
-        parsed = []
-        for row in grid:
-            parsed.append([int(c, 16) for c in row])
-        if len(parsed) != height or any(len(r) != width for r in parsed):
-            self.record_error(
-                label,
-                "Format Error",
-                "Grid dimensions in output file do not match WIDTH/HEIGHT.",
-            )
+        if not validated:
             console.print("[red]KO[/red]")
             return
-
-        if trailer[0].replace(" ", "") != f"{entry[0]},{entry[1]}":
-            self.record_error(label, "Format Error", "ENTRY line does not match config ENTRY.")
-        if trailer[1].replace(" ", "") != f"{exit_[0]},{exit_[1]}":
-            self.record_error(label, "Format Error", "EXIT line does not match config EXIT.")
-
-        def is_closed(cell, direction):
-            # bit mapping from subject: N=0 E=1 S=2 W=3
-            return ((cell >> direction) & 1) == 1
-
-        # Border walls must be closed.
-        for x in range(width):
-            if not is_closed(parsed[0][x], 0):
-                self.record_error(label, "Maze Validity", "Top border cells must have North wall closed.")
-                break
-        for x in range(width):
-            if not is_closed(parsed[height - 1][x], 2):
-                self.record_error(label, "Maze Validity", "Bottom border cells must have South wall closed.")
-                break
-        for y in range(height):
-            if not is_closed(parsed[y][0], 3):
-                self.record_error(label, "Maze Validity", "Left border cells must have West wall closed.")
-                break
-        for y in range(height):
-            if not is_closed(parsed[y][width - 1], 1):
-                self.record_error(label, "Maze Validity", "Right border cells must have East wall closed.")
-                break
-
-        # Neighbor wall coherence.
-        for y in range(height):
-            for x in range(width):
-                v = parsed[y][x]
-                if y > 0 and is_closed(v, 0) != is_closed(parsed[y - 1][x], 2):
-                    self.record_error(
-                        label,
-                        "Maze Coherence",
-                        f"Incoherent N/S wall between ({x},{y}) and ({x},{y-1}).",
-                    )
-                    break
-                if x < width - 1 and is_closed(v, 1) != is_closed(parsed[y][x + 1], 3):
-                    self.record_error(
-                        label,
-                        "Maze Coherence",
-                        f"Incoherent E/W wall between ({x},{y}) and ({x+1},{y}).",
-                    )
-                    break
-
-        # No 3x3 fully open area.
-        for y in range(height - 2):
-            for x in range(width - 2):
-                all_open = True
-                for yy in range(y, y + 3):
-                    for xx in range(x, x + 3):
-                        if parsed[yy][xx] != 0:
-                            all_open = False
-                            break
-                    if not all_open:
-                        break
-                if all_open:
-                    self.record_error(
-                        label,
-                        "Maze Validity",
-                        f"Forbidden 3x3 open area found near ({x},{y}).",
-                    )
-                    break
-
-        self._check_42_pattern_requirement(
-            parsed=parsed,
-            width=width,
-            height=height,
-            runtime_output=combined,
-            exercise_label=label,
-        )
-
-        moves = {"N": (0, -1, 0), "E": (1, 0, 1), "S": (0, 1, 2), "W": (-1, 0, 3)}
-
-        def neighbors(x, y):
-            v = parsed[y][x]
-            out = []
-            for d, (dx, dy, bit) in moves.items():
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < width and 0 <= ny < height and not is_closed(v, bit):
-                    out.append((nx, ny, d))
-            return out
-
-        # Connectivity check: subject allows isolated cells for the "42" pattern.
-        # We tolerate disconnected cells only if they are fully closed (0xF).
-        q = deque([(entry[0], entry[1])])
-        seen = {(entry[0], entry[1])}
-        while q:
-            cx, cy = q.popleft()
-            for nx, ny, _ in neighbors(cx, cy):
-                if (nx, ny) not in seen:
-                    seen.add((nx, ny))
-                    q.append((nx, ny))
-        disconnected_open = []
-        for y in range(height):
-            for x in range(width):
-                if (x, y) not in seen and parsed[y][x] != 0xF:
-                    disconnected_open.append((x, y))
-        if disconnected_open:
-            self.record_error(
-                label,
-                "Maze Validity",
-                "Maze has disconnected non-closed cells; only isolated fully closed pattern cells are tolerated.",
-            )
-
-        # Shortest path correctness from trailer.
-        path = trailer[2].strip()
-        cx, cy = entry
-        path_ok = True
-        for step in path:
-            dx, dy, bit = moves[step]
-            if is_closed(parsed[cy][cx], bit):
-                path_ok = False
-                break
-            cx += dx
-            cy += dy
-            if not (0 <= cx < width and 0 <= cy < height):
-                path_ok = False
-                break
-        if not path_ok or (cx, cy) != exit_:
-            self.record_error(label, "Path Error", "Provided path is invalid or does not reach EXIT.")
-        else:
-            dist = {entry: 0}
-            q2 = deque([entry])
-            while q2:
-                px, py = q2.popleft()
-                for nx, ny, _ in neighbors(px, py):
-                    if (nx, ny) not in dist:
-                        dist[(nx, ny)] = dist[(px, py)] + 1
-                        q2.append((nx, ny))
-            shortest_len = dist.get(exit_)
-            if shortest_len is None or len(path) != shortest_len:
-                self.record_error(label, "Path Error", "Provided path is not a shortest valid path.")
-
-        # PERFECT=True must imply unique path between entry and exit.
-        # We evaluate this on the traversable component from ENTRY.
-        if perfect:
-            if seen:
-                edge_count = 0
-                for (x, y) in seen:
-                    if x < width - 1 and (x + 1, y) in seen and not is_closed(parsed[y][x], 1):
-                        edge_count += 1
-                    if y < height - 1 and (x, y + 1) in seen and not is_closed(parsed[y][x], 2):
-                        edge_count += 1
-                nodes = len(seen)
-                if edge_count != nodes - 1:
-                    self.record_error(
-                        label,
-                        "Perfect Maze Error",
-                        "PERFECT=True but traversable maze component is not a tree.",
-                    )
         if self._error_count(label) == before:
             console.print("[green]OK[/green]")
         else:
             console.print("[red]KO[/red]")
 
-        self.test_seed_regeneration_behavior(main_path, cfg_path)
+        # The seed check can reuse this run's grid if the run wrote it (not a stale file).
+        main_output = None
+        if not result.killed_by and _output_signature(cfg_path) not in (None, output_before):
+            main_output = (out_name, output.digest)
+        self.test_seed_regeneration_behavior(main_path, cfg_path, main_output)
 
     def _check_42_pattern_requirement(
         self,
@@ -554,27 +597,12 @@ class Tester(BaseTester):
         height,
         runtime_output,
         exercise_label,
+        closed_cells=None,
     ):
-        # Subject v2.1: a visible "42" should be drawn using fully closed cells.
-        # If maze size is too small, omission is allowed but should be reported.
-        closed_cells = sum(1 for row in parsed for cell in row if cell == 0xF)
-        too_small = width < 5 or height < 5
-
-        if too_small:
-            if closed_cells == 0 and not re.search(r"too small|42", runtime_output, re.IGNORECASE):
-                self.record_error(
-                    exercise_label,
-                    "Maze Validity",
-                    'Maze is too small to draw "42", but no explanatory message was printed.',
-                )
-            return
-
-        if closed_cells < 6:
-            self.record_error(
-                exercise_label,
-                "Maze Validity",
-                'Maze should contain a visible "42" made of several fully closed cells (0xF).',
-            )
+        if closed_cells is None:
+            closed_cells = sum(1 for row in parsed for cell in row if cell == 0xF)
+        for error_type, message in _pattern_42_findings(width, height, closed_cells, runtime_output):
+            self.record_error(exercise_label, error_type, message)
 
     def _extract_active_seed(self, cfg_text):
         for raw in cfg_text.splitlines():
@@ -588,10 +616,13 @@ class Tester(BaseTester):
                 return value.strip()
         return None
 
-    def _render_cfg_for_seed_test(self, cfg_text, output_file, seed_value):
+    def _render_cfg_for_seed_test(self, cfg_text, output_file, seed_value, overrides=None):
+        # ``overrides`` ({"WIDTH": 12, ...}) replaces or adds other keys (``--sweep``).
+        overrides = {key.upper(): value for key, value in (overrides or {}).items()}
         out_lines = []
         has_output = False
         has_seed = False
+        seen = set()
         for raw in cfg_text.splitlines():
             stripped = raw.strip()
             if not stripped or stripped.startswith("#") or "=" not in raw:
@@ -608,94 +639,190 @@ class Tester(BaseTester):
                 else:
                     out_lines.append(f"SEED={seed_value}")
                 has_seed = True
+            elif key_up in overrides:
+                out_lines.append(f"{key_up}={overrides[key_up]}")
+                seen.add(key_up)
             else:
                 out_lines.append(raw)
         if not has_output:
             out_lines.append(f"OUTPUT_FILE={output_file}")
         if seed_value is not None and not has_seed:
             out_lines.append(f"SEED={seed_value}")
+        out_lines.extend(f"{key}={value}" for key, value in overrides.items() if key not in seen)
         return "\n".join(out_lines) + "\n"
 
-    def _run_and_read_grid(self, main_path, cfg_text, output_path):
-        with tempfile.NamedTemporaryFile("w", suffix=".cfg", delete=False) as cfg_tmp:
-            cfg_tmp.write(cfg_text)
-            cfg_tmp_path = Path(cfg_tmp.name)
-        try:
-            run_cmd = [os.sys.executable, str(main_path), str(cfg_tmp_path)]
+    def _run_and_read_grid(self, main_path, cfg_txt, seed_value):
+        # Config and output live in a temporary directory of this run's own.
+        with tempfile.TemporaryDirectory(prefix="germinette-seed-") as tmp_dir:
+            output_path = Path(tmp_dir) / "maze.txt"
+            cfg_tmp_path = Path(tmp_dir) / "config.txt"
+            cfg_tmp_path.write_text(
+                self._render_cfg_for_seed_test(cfg_txt, str(output_path), seed_value), encoding="utf-8"
+            )
+            run_cmd = [sys.executable, str(main_path), str(cfg_tmp_path)]
             try:
-                subprocess.run(
+                result = self.script_runner.run(
                     run_cmd,
-                    capture_output=True,
-                    text=True,
                     timeout=20,
                     env={**os.environ, "TERM": "dumb"},
                 )
             except Exception:
                 return None
-            if not output_path.exists():
+            if result.killed_by:
                 return None
-            lines = output_path.read_text(encoding="utf-8", errors="replace").splitlines()
-            if "" not in lines:
+            if not output_path.exists():
                 return None
-            sep = lines.index("")
-            return lines[:sep]
-        finally:
-            try:
-                cfg_tmp_path.unlink(missing_ok=True)
-            except Exception:
-                pass
-
-    def test_seed_regeneration_behavior(self, main_path, cfg_path):
+            # The grid rows' digest: equal grids compare equal without holding both in memory.
+            return maze.read_output(output_path).digest
+
+    def _run_seed_pair(self, main_path, cfg_txt, seeds, main_output=None):
+        """
+        Grid digests of runs with each of ``seeds`` (None: SEED commented out).
+
+        ``main_output`` is ``(OUTPUT_FILE value, digest)`` of the main run: one
+        run whose config would be byte-identical to config.txt reuses it. The
+        others run concurrently, so the check costs about one run.
+        """
+        digests = [None] * len(seeds)
+        pending = list(range(len(seeds)))
+        if main_output is not None:
+            out_name, digest = main_output
+            reused = next(
+                (i for i in pending if self._render_cfg_for_seed_test(cfg_txt, out_name, seeds[i]) == cfg_txt),
+                None,
+            )
+            if reused is not None:
+                digests[reused] = digest
+                pending.remove(reused)
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                runs = {i: executor.submit(self._run_and_read_grid, main_path, cfg_txt, seeds[i]) for i in pending}
+            for i, run in runs.items():
+                digests[i] = run.result()
+        return digests
+
+    def test_seed_regeneration_behavior(self, main_path, cfg_path, main_output=None):
         label = "Seed Behavior"
         console.print("\n[bold]Checking SEED regeneration behavior[/bold]")
         before = self._error_count(label)
         cfg_txt = cfg_path.read_text(encoding="utf-8", errors="replace")
         active_seed = self._extract_active_seed(cfg_txt)
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_root = Path(tmp_dir)
-            out_a = tmp_root / "maze_a.txt"
-            out_b = tmp_root / "maze_b.txt"
-            if active_seed is not None:
-                try:
-                    seed_a = int(active_seed)
-                except ValueError:
-                    self.record_error(label, "Seed Parse Error", "SEED must be an integer.")
-                    console.print("[red]KO[/red]")
-                    return
-                cfg_a = self._render_cfg_for_seed_test(cfg_txt, str(out_a), seed_a)
-                cfg_b = self._render_cfg_for_seed_test(cfg_txt, str(out_b), seed_a + 1)
-                grid_a = self._run_and_read_grid(main_path, cfg_a, out_a)
-                grid_b = self._run_and_read_grid(main_path, cfg_b, out_b)
-                if grid_a is None or grid_b is None:
-                    self.warnings.append(
-                        "Could not complete SEED behavior runtime check in this environment."
-                    )
-                elif grid_a == grid_b:
-                    self.record_error(
-                        label,
-                        "Seed Behavior Error",
-                        "SEED is active but maze does not change when seed value changes.",
-                    )
-            else:
-                cfg_a = self._render_cfg_for_seed_test(cfg_txt, str(out_a), None)
-                cfg_b = self._render_cfg_for_seed_test(cfg_txt, str(out_b), None)
-                grid_a = self._run_and_read_grid(main_path, cfg_a, out_a)
-                grid_b = self._run_and_read_grid(main_path, cfg_b, out_b)
-                if grid_a is None or grid_b is None:
-                    self.warnings.append(
-                        "Could not complete non-SEED determinism check in this environment."
-                    )
-                elif grid_a != grid_b:
-                    self.record_error(
-                        label,
-                        "Seed Behavior Error",
-                        "SEED is absent/commented, but maze changes between identical runs.",
-                    )
+        if active_seed is not None:
+            try:
+                seed_a = int(active_seed)
+            except ValueError:
+                self.record_error(label, "Seed Parse Error", "SEED must be an integer.")
+                console.print("[red]KO[/red]")
+                return
+            grid_a, grid_b = self._run_seed_pair(main_path, cfg_txt, (seed_a, seed_a + 1), main_output)
+            if grid_a is None or grid_b is None:
+                self.warnings.append(
+                    "Could not complete SEED behavior runtime check in this environment."
+                )
+            elif grid_a == grid_b:
+                self.record_error(
+                    label,
+                    "Seed Behavior Error",
+                    "SEED is active but maze does not change when seed value changes.",
+                )
+        else:
+            grid_a, grid_b = self._run_seed_pair(main_path, cfg_txt, (None, None), main_output)
+            if grid_a is None or grid_b is None:
+                self.warnings.append(
+                    "Could not complete non-SEED determinism check in this environment."
+                )
+            elif grid_a != grid_b:
+                self.record_error(
+                    label,
+                    "Seed Behavior Error",
+                    "SEED is absent/commented, but maze changes between identical runs.",
+                )
         if self._error_count(label) == before:
             console.print("[green]OK[/green]")
         else:
             console.print("[red]KO[/red]")
 
+    def test_seed_sweep(self, count):
+        """
+        ``--sweep N``: N generated configs (SEED, WIDTH / HEIGHT, PERFECT
+        varied), each run and checked with the output rules of the main run on
+        a pool of worker processes; the failing ones are listed in a table.
+        """
+        label = "Seed Sweep"
+        console.print(f"\n[bold]Sweeping {count} generated configs[/bold]")
+        main_path = Path("a_maze_ing.py")
+        cfg_path = Path("config.txt")
+        if not main_path.exists() or not cfg_path.exists():
+            return
+        cfg_txt = cfg_path.read_text(encoding="utf-8", errors="replace")
+        settings = _maze_settings(cfg_txt)
+        if settings is None:
+            self.warnings.append("Seed sweep skipped: could not parse WIDTH/HEIGHT/ENTRY/EXIT/PERFECT from config.txt.")
+            return
+        try:
+            base_seed = int(self._extract_active_seed(cfg_txt) or 0)
+        except ValueError:
+            base_seed = 0
+        cases = _sweep_cases(count, *settings, base_seed)
+        with tempfile.TemporaryDirectory(prefix="germinette-sweep-") as tmp_dir:
+            runs = []
+            for index, case in enumerate(cases):
+                case_dir = Path(tmp_dir) / f"case-{index}"
+                case_dir.mkdir()
+                output_path = case_dir / "maze.txt"
+                case_cfg = case_dir / "config.txt"
+                overrides = {"WIDTH": case["width"], "HEIGHT": case["height"], "PERFECT": case["perfect"]}
+                case_cfg.write_text(
+                    self._render_cfg_for_seed_test(cfg_txt, str(output_path), case["seed"], overrides),
+                    encoding="utf-8",
+                )
+                runs.append((str(main_path), str(case_cfg), str(output_path), case))
+            results = self._map_sweep(runs)
+
+        failing = [(case, findings) for (_, _, _, case), findings in zip(runs, results) if findings]
+        if not failing:
+            console.print(f"[green]OK ({count} configs)[/green]")
+            return
+        from rich.markup import escape
+        from rich.table import Table
+
+        table = Table(title=f"{len(failing)} of {count} generated configs fail")
+        table.add_column("SEED", justify="right")
+        table.add_column("Size", justify="right")
+        table.add_column("PERFECT")
+        table.add_column("First problem", overflow="fold")
+        for case, findings in failing:
+            error_type, message = findings[0]
+            more = f" (+{len(findings) - 1} more)" if len(findings) > 1 else ""
+            table.add_row(
+                str(case["seed"]), f"{case['width']}x{case['height']}", str(case["perfect"]),
+                escape(f"{error_type}: {message}{more}"),
+            )
+        console.print(table)
+        console.print("[red]KO[/red]")
+        seeds = ", ".join(str(case["seed"]) for case, _ in failing[:10])
+        if len(failing) > 10:
+            seeds += ", ..."
+        self.record_error(
+            label,
+            "Seed Sweep Error",
+            f"{len(failing)} of {count} generated configs produce an invalid maze (SEED {seeds}). "
+            "Re-run one with its SEED, WIDTH/HEIGHT and PERFECT from the table to reproduce it.",
+        )
+
+    def _map_sweep(self, runs):
+        """Findings of each ``_run_sweep_case`` call, on ``--jobs`` forked workers (serial by default)."""
+        workers = min(getattr(self, "jobs", 1) or 1, len(runs))
+        if workers <= 1 or not hasattr(os, "fork"):
+            return [_run_sweep_case(*run) for run in runs]
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            return list(pool.map(_run_sweep_case, *zip(*runs)))
+
     def test_seed_interactive_regen_logic(self):
         label = "Seed Behavior"
         console.print("\n[bold]Checking interactive regen SEED logic[/bold]")
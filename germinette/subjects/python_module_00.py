@@ -1,4 +1,5 @@
 from germinette.core import BaseTester
+from germinette.profiling import timed
 from germinette.utils import IOTester
 from rich.console import Console
 from rich.panel import Panel
@@ -37,6 +38,7 @@ class Tester(BaseTester):
             "ft_seed_inventory": set(),
         }
 
+    @timed("import")
     def _load_func(self, module_name, exercise_label="Unknown Exercise", func_name=None):
         if not func_name:
             func_name = module_name
@@ -1,4 +1,5 @@
 from germinette.core import BaseTester
+from germinette.profiling import timed
 from germinette.utils import IOTester
 from rich.console import Console
 from rich.panel import Panel
@@ -25,6 +26,7 @@ class Tester(BaseTester):
             ("ft_garden_analytics", self.test_garden_analytics),
         ]
 
+    @timed("import")
     def _load_module(self, module_name, exercise_label):
         cwd = os.getcwd()
         base_dir = os.path.join(cwd, "python_module_01") if os.path.exists(os.path.join(cwd, "python_module_01")) else cwd
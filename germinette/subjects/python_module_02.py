@@ -5,6 +5,7 @@ import ast
 from rich.console import Console
 from rich.panel import Panel
 from germinette.core import BaseTester
+from germinette.profiling import timed
 from germinette.utils import IOTester
 
 console = Console()
@@ -37,6 +38,7 @@ class Tester(BaseTester):
                 return n
         return None
 
+    @timed("import")
     def _load_module(self, module_name, exercise_label):
         cwd = os.getcwd()
         if os.path.exists(os.path.join(cwd, "python_module_02")):
@@ -4,6 +4,7 @@ import importlib.util
 from rich.console import Console
 from rich.panel import Panel
 from germinette.core import BaseTester
+from germinette.profiling import timed
 from germinette.utils import IOTester
 
 console = Console()
@@ -24,6 +25,7 @@ class Tester(BaseTester):
             ("ft_data_alchemist", self.test_data_alchemist),
         ]
 
+    @timed("import")
     def _load_module(self, module_name, exercise_label):
         cwd = os.getcwd()
         if os.path.exists(os.path.join(cwd, "python_module_03")):
@@ -145,12 +147,11 @@ class Tester(BaseTester):
                                   allowed_imports=["math"],
                                   enforce_try_except=True): return
 
-        import subprocess
         # Test Case 1: Valid
         try:
              cmd = [sys.executable, path]
-             proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-             stdout, stderr = proc.communicate(input="3,4,0\n4,5,6\n")
+             result = self.script_runner.run(cmd, input="3,4,0\n4,5,6\n")
+             stdout, stderr = result.stdout, result.stderr
              out = stdout + stderr
 
              if self.check_for_crash(out, exercise_label): return
@@ -172,8 +173,8 @@ class Tester(BaseTester):
 
         # Test Case 2: Invalid (requires try/except handling)
         try:
-             proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-             stdout, stderr = proc.communicate(input="3,abc,0\n3,4,0\n4,5,6\n")
+             result = self.script_runner.run(cmd, input="3,abc,0\n3,4,0\n4,5,6\n")
+             stdout, stderr = result.stdout, result.stderr
              out = stdout + stderr
 
              # Should not crash unhandled, should show error message
@@ -363,14 +364,9 @@ class Tester(BaseTester):
              console.print(f"[red]KO (AST Error: {e})[/red]")
 
     def _run_script_args(self, path, args):
-        import subprocess
         try:
             cmd = [sys.executable, path] + args
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True
-            )
+            result = self.script_runner.run(cmd)
             return result.stdout + result.stderr
         except Exception as e:
             return str(e)
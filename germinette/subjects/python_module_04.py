@@ -5,6 +5,7 @@ import importlib.util
 from rich.console import Console
 from rich.panel import Panel
 from germinette.core import BaseTester
+from germinette.profiling import timed
 from germinette.utils import IOTester
 
 console = Console()
@@ -38,6 +39,7 @@ class Tester(BaseTester):
         except Exception as e:
             console.print(f"[red]Warning: Failed to create test data: {e}[/red]")
 
+    @timed("import")
     def _load_module(self, module_name, exercise_label):
         cwd = os.getcwd()
         if os.path.exists(os.path.join(cwd, "python_module_04")):
@@ -120,6 +122,7 @@ class Tester(BaseTester):
             pass
         return True
 
+    @timed("import")
     def _load_module_object(self, path):
         module_name = f"_germinette_mod04_{os.path.basename(path).replace('.py', '')}"
         spec = importlib.util.spec_from_file_location(module_name, path)
@@ -146,11 +149,10 @@ class Tester(BaseTester):
         if not self._enforce_no_with_before_ex3(path, exercise_label):
             return
 
-        import subprocess
         # Test 1: File exists
         try:
             cmd = [sys.executable, path, "ancient_fragment.txt"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self.script_runner.run(cmd)
             out = result.stdout + result.stderr
             if self.check_for_crash(out, exercise_label): return
 
@@ -171,8 +173,10 @@ class Tester(BaseTester):
         # Test 2: No Arguments
         try:
              cmd = [sys.executable, path]
-             result = subprocess.run(cmd, capture_output=True, text=True)
+             result = self.script_runner.run(cmd)
              out = result.stdout + result.stderr
+             # A stopped run (timeout, limits) carries "Error:" but handled nothing.
+             if result.killed_by and self.check_for_crash(out, exercise_label): return
              if "Usage:" in out or "Error:" in out or "provide" in out.lower():
                   console.print("[green]OK (No Args handled)[/green]")
              else:
@@ -187,9 +191,11 @@ class Tester(BaseTester):
         # matching "no such file" and "error" without colon.
         try:
              cmd = [sys.executable, path, "non_existent_file.txt"]
-             result = subprocess.run(cmd, capture_output=True, text=True)
+             result = self.script_runner.run(cmd)
              out = result.stdout + result.stderr
              out_lower = out.lower()
+             # A stopped run (timeout, limits) carries "Error:" but handled nothing.
+             if result.killed_by and self.check_for_crash(out, exercise_label): return
              if "filenotfounderror" in out_lower or "error" in out_lower or "not found" in out_lower or "no such file" in out_lower:
                   console.print("[green]OK (Missing file handled)[/green]")
              else:
@@ -219,11 +225,10 @@ class Tester(BaseTester):
         if os.path.exists(target_file):
             os.remove(target_file)
 
-        import subprocess
         try:
             cmd = [sys.executable, path, "ancient_fragment.txt"]
-            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            stdout, stderr = proc.communicate(input=f"{target_file}\n")
+            result = self.script_runner.run(cmd, input=f"{target_file}\n")
+            stdout, stderr = result.stdout, result.stderr
             out = stdout + stderr
 
             if self.check_for_crash(out, exercise_label): return
@@ -292,12 +297,11 @@ class Tester(BaseTester):
         except Exception:
             pass
 
-        import subprocess
         input_str = "/etc/passwd\n"
         try:
             cmd = [sys.executable, path, "ancient_fragment.txt"]
-            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            stdout, stderr = proc.communicate(input=input_str)
+            result = self.script_runner.run(cmd, input=input_str)
+            stdout, stderr = result.stdout, result.stderr
             
             if self.check_for_crash(stdout + stderr, exercise_label): return
 
@@ -358,10 +362,9 @@ class Tester(BaseTester):
         except Exception:
             pass
 
-        import subprocess
         try:
             cmd = [sys.executable, path]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self.script_runner.run(cmd)
             out = result.stdout + result.stderr
             if self.check_for_crash(out, exercise_label): return
 
@@ -5,6 +5,7 @@ import builtins
 from rich.console import Console
 from rich.panel import Panel
 from germinette.core import BaseTester
+from germinette.profiling import timed
 
 console = Console()
 
@@ -18,6 +19,7 @@ class Tester(BaseTester):
             ("data_pipeline", self.test_data_pipeline),
         ]
 
+    @timed("import")
     def _load_module(self, module_name, exercise_label):
         cwd = os.getcwd()
         if os.path.exists(os.path.join(cwd, "python_module_05")):
@@ -95,10 +97,9 @@ class Tester(BaseTester):
         ):
             return
 
-        import subprocess
         try:
             cmd = [sys.executable, path]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self.script_runner.run(cmd)
             out = result.stdout + result.stderr
             if self.check_for_crash(out, exercise_label): return
 
@@ -158,10 +159,9 @@ class Tester(BaseTester):
         ):
             return
 
-        import subprocess
         try:
             cmd = [sys.executable, path]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self.script_runner.run(cmd)
             out = result.stdout + result.stderr
             if self.check_for_crash(out, exercise_label): return
 
@@ -257,10 +257,9 @@ class Tester(BaseTester):
         except Exception:
             pass
 
-        import subprocess
         try:
             cmd = [sys.executable, path]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self.script_runner.run(cmd)
             out = result.stdout + result.stderr
             if self.check_for_crash(out, exercise_label): return
 
@@ -1,4 +1,6 @@
 from germinette.core import BaseTester
+from germinette.profiling import timed
+from germinette.source_index import source_index
 import subprocess
 import sys
 import ast
@@ -55,6 +57,7 @@ class Tester(BaseTester):
             "ft_kaboom_1.py",
         ]
 
+    @timed("import")
     def _load_module(self, module_name, exercise_label):
         cwd = os.getcwd()
         base_dir = cwd
@@ -95,10 +98,10 @@ class Tester(BaseTester):
 
     def check_strict_forbidden(self, path, exercise_label):
         try:
-            with open(path, "r") as f:
-                tree = ast.parse(f.read())
+            source = source_index.get(path)
+            candidates = sorted(source.attributes + source.calls, key=source.order.__getitem__)
             
-            for node in ast.walk(tree):
+            for node in candidates:
                 if isinstance(node, ast.Attribute):
                     if isinstance(node.value, ast.Name) and node.value.id == 'sys' and node.attr == 'path':
                          console.print("[red]KO (Forbidden Path Mod)[/red]")
@@ -149,11 +152,10 @@ class Tester(BaseTester):
 
     def check_imports_are_project_local(self, path, exercise_label):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
+            imports = source_index.get(path).imports
             allowed_roots = self._allowed_local_import_roots()
             bad = []
-            for node in ast.walk(tree):
+            for node in imports:
                 if isinstance(node, ast.Import):
                     for alias in node.names:
                         root = alias.name.split(".")[0]
@@ -181,13 +183,10 @@ class Tester(BaseTester):
 
     def check_import_type(self, path, exercise_label, require_from=False, forbidden_module=None):
         try:
-            with open(path, "r") as f:
-                tree = ast.parse(f.read())
-            
             has_import = False
             has_import_from = False
 
-            for node in ast.walk(tree):
+            for node in source_index.get(path).imports:
                 if isinstance(node, ast.Import):
                     has_import = True
                     # Check if they imported something forbidden
@@ -228,8 +227,7 @@ class Tester(BaseTester):
         # Must use "import ..." structure to access elements.py directly
         # Should not use `from`
         try:
-             with open(path, "r") as f: tree = ast.parse(f.read())
-             has_import_from = any(isinstance(n, ast.ImportFrom) for n in ast.walk(tree))
+             has_import_from = any(isinstance(n, ast.ImportFrom) for n in source_index.get(path).imports)
              if has_import_from:
                  console.print("[red]KO (import type)[/red]")
                  self.record_error(exercise_label, "Import Style", "Must use 'import ...' structure. Found 'from' import.")
@@ -271,8 +269,7 @@ class Tester(BaseTester):
         if not self.check_strict_forbidden(path, exercise_label): return
 
         try:
-             with open(path, "r") as f: tree = ast.parse(f.read())
-             has_import_from = any(isinstance(n, ast.ImportFrom) for n in ast.walk(tree))
+             has_import_from = any(isinstance(n, ast.ImportFrom) for n in source_index.get(path).imports)
              if has_import_from:
                  console.print("[red]KO (import type)[/red]")
                  return
@@ -310,8 +307,7 @@ class Tester(BaseTester):
         if not self.check_strict_forbidden(path, exercise_label): return
 
         try:
-             with open(path, "r") as f: tree = ast.parse(f.read())
-             has_import_from = any(isinstance(n, ast.ImportFrom) for n in ast.walk(tree))
+             has_import_from = any(isinstance(n, ast.ImportFrom) for n in source_index.get(path).imports)
              if has_import_from:
                  console.print("[red]KO (import type)[/red]")
                  return
@@ -364,8 +360,7 @@ class Tester(BaseTester):
         if not status: return
         
         try:
-             with open(path, "r") as f: tree = ast.parse(f.read())
-             has_import_from = any(isinstance(n, ast.ImportFrom) for n in ast.walk(tree))
+             has_import_from = any(isinstance(n, ast.ImportFrom) for n in source_index.get(path).imports)
              if has_import_from:
                  console.print("[red]KO (import type)[/red]")
                  return
@@ -398,11 +393,9 @@ class Tester(BaseTester):
             )
             return
         try:
-            with open(recipes_path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
             has_absolute = False
             has_relative = False
-            for node in ast.walk(tree):
+            for node in source_index.get(recipes_path).imports:
                 if isinstance(node, ast.Import):
                     has_absolute = True
                 elif isinstance(node, ast.ImportFrom):
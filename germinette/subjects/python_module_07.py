@@ -7,12 +7,12 @@ import sys
 import os
 import ast
 import traceback
-import subprocess
 import builtins
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from germinette.core import BaseTester
+from germinette.source_index import source_index
 
 console = Console()
 
@@ -94,10 +94,8 @@ class Tester(BaseTester):
         try:
             root_dir = self._find_root_dir()
             allowed_roots = self._allowed_import_roots(root_dir)
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
             bad = []
-            for node in ast.walk(tree):
+            for node in source_index.get(path).imports:
                 if isinstance(node, ast.Import):
                     for alias in node.names:
                         root = alias.name.split(".")[0]
@@ -167,7 +165,7 @@ class Tester(BaseTester):
 
         try:
             cmd = [sys.executable, "battle.py"]
-            result = subprocess.run(cmd, cwd=root_dir, capture_output=True, text=True)
+            result = self.script_runner.run(cmd, cwd=root_dir)
             out = result.stdout + result.stderr
             if self.check_for_crash(out, exercise_label): return
 
@@ -203,7 +201,7 @@ class Tester(BaseTester):
 
         try:
             cmd = [sys.executable, "capacitor.py"]
-            result = subprocess.run(cmd, cwd=root_dir, capture_output=True, text=True)
+            result = self.script_runner.run(cmd, cwd=root_dir)
             out = result.stdout + result.stderr
             if self.check_for_crash(out, exercise_label): return
 
@@ -247,7 +245,7 @@ class Tester(BaseTester):
 
         try:
             cmd = [sys.executable, "tournament.py"]
-            result = subprocess.run(cmd, cwd=root_dir, capture_output=True, text=True)
+            result = self.script_runner.run(cmd, cwd=root_dir)
             out = result.stdout + result.stderr
             if self.check_for_crash(out, exercise_label): return
 
@@ -283,9 +281,9 @@ class Tester(BaseTester):
         if exercise_name:
             super().run(exercise_name)
         else:
-            visited = set()
+            unique = []
             for name, func in self.exercises:
-                if func not in visited:
-                    func()
-                    visited.add(func)
+                if func not in unique:
+                    unique.append(func)
+            self.run_exercises(unique)
             self.display_error_report()
@@ -1,10 +1,10 @@
 import sys
 import os
-import subprocess
 import builtins
 from rich.console import Console
 from rich.panel import Panel
 from germinette.core import BaseTester
+from germinette.profiling import timed
 
 console = Console()
 
@@ -28,6 +28,7 @@ class Tester(BaseTester):
             "ZION_ENDPOINT",
         ]
 
+    @timed("import")
     def _load_module_path(self, ex_dir_name, main_file):
         cwd = os.getcwd()
         # Direct check
@@ -130,7 +131,7 @@ class Tester(BaseTester):
         try:
             cmd = [sys.executable, path]
             cwd = os.path.dirname(path)
-            result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+            result = self.script_runner.run(cmd, cwd=cwd)
             out = result.stdout + result.stderr
             if self.check_for_crash(out, exercise_label): return
 
@@ -248,7 +249,7 @@ class Tester(BaseTester):
         try:
             cmd = [sys.executable, path]
             cwd = os.path.dirname(path)
-            result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+            result = self.script_runner.run(cmd, cwd=cwd)
             out = result.stdout + result.stderr
             if self.check_for_crash(out, exercise_label): return
             
@@ -360,7 +361,7 @@ class Tester(BaseTester):
             # Run with cleaned env to ensure no interference? 
             # But we need basic env vars.
             # Just run it.
-            result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+            result = self.script_runner.run(cmd, cwd=cwd)
             out = result.stdout + result.stderr
             if self.check_for_crash(out, exercise_label): return
 
@@ -388,11 +389,11 @@ class Tester(BaseTester):
                 "LOG_LEVEL": "DEBUG",
                 "ZION_ENDPOINT": "http://localhost:9999",
             })
-            prod_result = subprocess.run(
-                cmd, cwd=cwd, capture_output=True, text=True, env=env_prod
+            prod_result = self.script_runner.run(
+                cmd, cwd=cwd, env=env_prod
             )
-            dev_result = subprocess.run(
-                cmd, cwd=cwd, capture_output=True, text=True, env=env_dev
+            dev_result = self.script_runner.run(
+                cmd, cwd=cwd, env=env_dev
             )
             out_prod = prod_result.stdout + prod_result.stderr
             out_dev = dev_result.stdout + dev_result.stderr
@@ -425,9 +426,9 @@ class Tester(BaseTester):
         if exercise_name:
             super().run(exercise_name)
         else:
-            visited = set()
+            unique = []
             for name, func in self.exercises:
-                if func not in visited:
-                    func()
-                    visited.add(func)
+                if func not in unique:
+                    unique.append(func)
+            self.run_exercises(unique)
             self.display_error_report()
@@ -1,10 +1,12 @@
+from germinette import isolation
 from germinette.core import BaseTester
+from germinette.profiling import timed
+from germinette.source_index import source_index
 from germinette.utils import IOTester
 from rich.console import Console
 from rich.panel import Panel
 import sys
 import os
-import importlib.util
 import traceback
 import ast
 from datetime import datetime, date
@@ -478,6 +480,7 @@ class Tester(BaseTester):
             return False
         return True
 
+    @timed("import")
     def _load_module(self, ex_num, main_file):
         """Standardized loading logic for python_module_09 structure"""
         cwd = os.getcwd()
@@ -507,16 +510,13 @@ class Tester(BaseTester):
         
         return None, None
 
+    @timed("import")
     def _load_from_path(self, path):
         try:
-            spec = importlib.util.spec_from_file_location("mod_09_test", path)
-            mod = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(mod)
-            return mod, path
+            return isolation.load(path, "mod_09_test"), path
         except Exception as e:
             console.print(f"[red]Failed to load {path}: {e}[/red]")
-            import traceback
-            traceback.print_exc()
+            isolation.print_traceback(e)
             return None, path
 
     def common_strict_check(self, path, label, extra_imports=None):
@@ -577,15 +577,14 @@ class Tester(BaseTester):
 
     def _assert_pydantic_v2_validators(self, path, exercise_label, require_model_validator):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
+            functions = source_index.get(path).functions
         except Exception as e:
             self.record_error(exercise_label, "AST Error", f"Could not parse file: {e}")
             return False
 
         has_model_validator = False
         has_deprecated_validator = False
-        for node in ast.walk(tree):
+        for node in functions:
             if isinstance(node, ast.FunctionDef):
                 for deco in node.decorator_list:
                     deco_name = None
@@ -1037,9 +1036,9 @@ class Tester(BaseTester):
         if exercise_name:
             super().run(exercise_name)
         else:
-            visited = set()
+            unique = []
             for name, func in self.exercises:
-                if func not in visited:
-                    func()
-                    visited.add(func)
+                if func not in unique:
+                    unique.append(func)
+            self.run_exercises(unique)
             self.display_error_report()
@@ -1,10 +1,12 @@
+from germinette import isolation
 from germinette.core import BaseTester
+from germinette.profiling import timed
+from germinette.source_index import source_index
 from germinette.utils import IOTester
 from rich.console import Console
 from rich.panel import Panel
 import sys
 import os
-import importlib.util
 import ast
 import traceback
 import sysconfig
@@ -29,6 +31,7 @@ class Tester(BaseTester):
             ("ex4", self.test_masters_tower),
         ]
 
+    @timed("import")
     def _load_module(self, ex_num, main_file):
         """Standardized loading logic for python_module_10"""
         cwd = os.getcwd()
@@ -58,12 +61,10 @@ class Tester(BaseTester):
         
         return None, None
 
+    @timed("import")
     def _load_from_path(self, path):
         try:
-            spec = importlib.util.spec_from_file_location("mod_10_test", path)
-            mod = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(mod)
-            return mod, path
+            return isolation.load(path, "mod_10_test"), path
         except Exception as e:
             console.print(f"[red]Failed to load {path}: {e}[/red]")
             return None, path
@@ -120,10 +121,8 @@ class Tester(BaseTester):
 
     def _check_forbidden_eval_exec(self, path, label):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            for node in source_index.get(path).calls:
+                if isinstance(node.func, ast.Name):
                     if node.func.id in {"eval", "exec"}:
                         self.record_error(
                             label,
@@ -138,9 +137,7 @@ class Tester(BaseTester):
 
     def _check_no_module_globals(self, path, label):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-            for node in tree.body:
+            for node in source_index.get(path).tree.body:
                 if isinstance(node, (ast.Assign, ast.AnnAssign)):
                     targets = []
                     if isinstance(node, ast.Assign):
@@ -179,11 +176,10 @@ class Tester(BaseTester):
 
     def _check_no_external_imports(self, path, label):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
+            imports = source_index.get(path).imports
             allowed_roots = self._allowed_import_roots(path)
             bad = []
-            for node in ast.walk(tree):
+            for node in imports:
                 if isinstance(node, ast.Import):
                     for alias in node.names:
                         root = alias.name.split(".")[0]
@@ -212,23 +208,14 @@ class Tester(BaseTester):
     def check_lambda_usage(self, path, required_count=1):
         """Checks if lambda is used in the file."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-            
-            lambda_count = 0
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Lambda):
-                    lambda_count += 1
-            
-            return lambda_count
+            return len(source_index.get(path).lambdas)
         except Exception:
             return 0
 
     def _check_ex3_reducer_operator_constraint(self, path, label):
         """Exercise 3 requires operator-style reducer handlers, not lambda substitutions."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
+            tree = source_index.get(path).tree
         except Exception as e:
             self.record_error(label, "AST Error", f"Failed Ex3 reducer-policy check: {e}")
             return False
@@ -723,9 +710,9 @@ class Tester(BaseTester):
         if exercise_name:
             super().run(exercise_name)
         else:
-            visited = set()
+            unique = []
             for name, func in self.exercises:
-                if func not in visited:
-                    func()
-                    visited.add(func)
+                if func not in unique:
+                    unique.append(func)
+            self.run_exercises(unique)
             self.display_error_report()
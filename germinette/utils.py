@@ -2,11 +2,7 @@ import sys
 import os
 import io
 import contextlib
-import urllib.request
 import re
-from rich.console import Console
-
-console = Console()
 
 class IOTester:
     @staticmethod
@@ -68,6 +64,54 @@ class IOTester:
         else:
             return False, f"Expected:\n{expected_clean}\n\nGot:\n{actual_clean}"
 
+def user_cache_dir(*parts):
+    """
+    Returns germinette's per-user cache directory (created on demand).
+
+    Honours ``XDG_CACHE_HOME``; defaults to ``~/.cache/germinette``. Extra
+    ``parts`` name a subdirectory, e.g. ``user_cache_dir("mypy")``.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    path = os.path.join(base, "germinette", *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+UPDATE_URL = "https://raw.githubusercontent.com/ExceptedPrism3/germinette/main/germinette/__init__.py"
+# How long a fetched remote version (or a failed attempt) is trusted before asking GitHub again.
+UPDATE_CHECK_TTL = 6 * 3600
+UPDATE_CHECK_RETRY_TTL = 15 * 60
+
+
+def _parse_version(v):
+    return tuple(map(int, v.split(".")))
+
+
+def _compare_versions(remote_version, current_version):
+    """Returns the ``check_update`` tuple for a fetched ``remote_version``."""
+    if remote_version is None:
+        return False, None, False
+    try:
+        if remote_version != current_version and _parse_version(remote_version) > _parse_version(current_version):
+            return True, remote_version, True
+    except ValueError:
+        return False, None, False
+    return False, remote_version, True
+
+
+def _fetch_remote_version(timeout=2):
+    """Reads ``__version__`` from GitHub main; None on network / parse failure."""
+    import urllib.request
+
+    try:
+        with urllib.request.urlopen(UPDATE_URL, timeout=timeout) as response:
+            content = response.read().decode("utf-8")
+    except Exception:
+        return None
+    # Regex to find __version__ = "1.0.0"
+    match = re.search(r'__version__\s*=\s*"(.*?)"', content)
+    return match.group(1) if match else None
+
+
 def check_update(current_version):
     """
     Checks if a newer version is available on GitHub main.
@@ -82,36 +126,94 @@ def check_update(current_version):
         - remote_version: Parsed __version__ from GitHub when check_ok else None.
         - check_ok: True if the version string was fetched and parsed successfully.
     """
-    def parse_v(v):
-        return tuple(map(int, v.split(".")))
-
     debug_remote = os.environ.get("GERMINETTE_DEBUG_REMOTE_VERSION", "").strip()
     if debug_remote:
+        return _compare_versions(debug_remote, current_version)
+    return _compare_versions(_fetch_remote_version(), current_version)
+
+
+class UpdateCheck:
+    """
+    Update check that never delays startup.
+
+    The last fetched remote version is kept in ``~/.cache/germinette/update_check.json``
+    with its timestamp; while that is fresh no request is made. Otherwise GitHub
+    is queried on a daemon thread and ``result()`` is only consulted for the
+    footer, once the run is over.
+
+    The thread must not import anything: the main thread forks (``--jobs``
+    workers, import probes, batch graders) while it runs, and a child forked
+    while the thread holds a module's import lock hangs when it imports that
+    module. ``start()`` therefore loads what the fetch needs beforehand.
+    """
+
+    def __init__(self, current_version):
+        self.current_version = current_version
+        self._result = None
+        self._thread = None
+
+    @staticmethod
+    def _state_path():
+        return os.path.join(user_cache_dir(), "update_check.json")
+
+    def _load_cached(self):
+        import json
+        import time
+
         try:
-            if debug_remote != current_version and parse_v(debug_remote) > parse_v(current_version):
-                return True, debug_remote, True
-            return False, debug_remote, True
-        except ValueError:
-            return False, None, False
+            with open(self._state_path(), "r", encoding="utf-8") as f:
+                state = json.load(f)
+            checked_at = float(state["checked_at"])
+            remote_version = state.get("remote_version")
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        ttl = UPDATE_CHECK_TTL if remote_version else UPDATE_CHECK_RETRY_TTL
+        if not 0 <= time.time() - checked_at < ttl:
+            return None
+        return _compare_versions(remote_version, self.current_version)
 
-    url = "https://raw.githubusercontent.com/ExceptedPrism3/germinette/main/germinette/__init__.py"
+    def _save(self, remote_version):
+        import json
+        import time
 
-    try:
-        # Set timeout to 2 seconds to not block startup
-        with urllib.request.urlopen(url, timeout=2) as response:
-            content = response.read().decode("utf-8")
+        try:
+            path = self._state_path()
+            tmp = path + f".{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"checked_at": time.time(), "remote_version": remote_version}, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
 
-        # Regex to find __version__ = "1.0.0"
-        match = re.search(r'__version__\s*=\s*"(.*?)"', content)
-        if not match:
-            return False, None, False
+    def _run(self):
+        remote_version = _fetch_remote_version()
+        self._save(remote_version)
+        self._result = _compare_versions(remote_version, self.current_version)
 
-        remote_version = match.group(1)
-        if remote_version != current_version:
-            if parse_v(remote_version) > parse_v(current_version):
-                return True, remote_version, True
-        return False, remote_version, True
-    except Exception:
-        pass  # Network / parse failure
+    def start(self):
+        """Uses the on-disk result when fresh, otherwise fetches in the background."""
+        debug_remote = os.environ.get("GERMINETTE_DEBUG_REMOTE_VERSION", "").strip()
+        if debug_remote:
+            self._result = _compare_versions(debug_remote, self.current_version)
+            return self
+        try:
+            self._result = self._load_cached()
+        except OSError:
+            self._result = None
+        if self._result is None:
+            import threading
+            import urllib.request  # noqa: F401  (see the class docstring)
 
-    return False, None, False
+            # Hostnames are IDNA-encoded on connect, which loads the codec lazily.
+            "github.com".encode("idna")
+            self._thread = threading.Thread(target=self._run, name="germinette-update-check", daemon=True)
+            self._thread.start()
+        return self
+
+    def result(self, wait=1.0):
+        """Returns the ``check_update`` tuple; unknown (not ok) if still pending after ``wait`` seconds."""
+        if self._thread is not None:
+            self._thread.join(wait)
+        if self._result is None:
+            return False, None, False
+        return self._result
@@ -0,0 +1,296 @@
+"""
+``germinette --watch``: re-grade the submission every time a file is saved.
+
+The process stays alive between runs, so the subject checker, the parsed
+sources, the in-process flake8 and the dmypy daemon stay warm, and the
+update check runs once. Changes are picked up with inotify on Linux (through
+ctypes, no extra dependency) and by polling file stats elsewhere. Bursts of
+saves are debounced into one run, and a path only counts as changed when its
+contents differ from the tree as it was after the last run: files the checker
+or the graded scripts write (temporary files, a maze's OUTPUT_FILE) are part
+of that snapshot and do not trigger another run.
+
+Each run is incremental (see ``germinette.incremental``): only exercises
+whose inputs changed are re-run, the others replay their verdict silently.
+After every run a compact diff of exercise verdicts is printed.
+"""
+import os
+import select
+import struct
+import sys
+import time
+
+from rich.console import Console
+
+from germinette import lint
+from germinette.cache import file_digest
+
+console = Console()
+
+# Quiet period that ends a burst of saves, and the longest a burst may delay a run.
+DEBOUNCE_SECONDS = 0.3
+MAX_BURST_SECONDS = 3.0
+POLL_INTERVAL = 0.5
+# Larger trees are not watched file by file.
+MAX_WATCHED_FILES = 2000
+
+# inotify(7) constants
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+               | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF)
+_EVENT = struct.Struct("iIII")
+
+
+def _skipped(name):
+    return name.startswith(".") or name in lint._PRUNE_DIRS
+
+
+def _walk_dirs(root):
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = [
+            d for d in dirnames if not _skipped(d) and not os.path.exists(os.path.join(dirpath, d, "pyvenv.cfg"))
+        ]
+        yield dirpath
+
+
+class InotifyWatcher:
+    """Linux inotify on every directory of the tree (new directories are added as they appear)."""
+
+    def __init__(self, root):
+        import ctypes
+        import ctypes.util
+
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._dirs = {}
+        try:
+            self._add_tree(root)
+        except BaseException:
+            self.close()
+            raise
+
+    def _add_tree(self, top):
+        for directory in _walk_dirs(top):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+            if wd >= 0:
+                self._dirs[wd] = directory
+
+    def changes(self, timeout=None):
+        """Paths changed since the last call, waiting up to ``timeout`` seconds for the first one."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    # Events were dropped: treat every file as possibly changed.
+                    changed.update(lint.walk_files(self.root, "", MAX_WATCHED_FILES) or ())
+                    continue
+                directory = self._dirs.get(wd)
+                if mask & _IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                if directory is None or not name or _skipped(name):
+                    continue
+                path = os.path.join(directory, name)
+                if mask & _IN_ISDIR:
+                    if mask & (_IN_CREATE | _IN_MOVED_TO):
+                        self._add_tree(path)
+                        changed.update(lint.walk_files(path, "", MAX_WATCHED_FILES) or ())
+                    continue
+                changed.add(path)
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher:
+    """Compares file stats of the whole tree every ``interval`` seconds."""
+
+    def __init__(self, root, interval=POLL_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self._stats = self._scan()
+
+    def _scan(self):
+        stats = {}
+        for path in lint.walk_files(self.root, "", MAX_WATCHED_FILES) or ():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def changes(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            stats = self._scan()
+            changed = {p for p in stats.keys() | self._stats.keys() if stats.get(p) != self._stats.get(p)}
+            self._stats = stats
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            wait = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(wait)
+
+    def close(self):
+        pass
+
+
+def make_watcher(root):
+    """inotify on Linux, polling elsewhere (or when inotify is unavailable)."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root)
+
+
+def next_batch(watcher, debounce=DEBOUNCE_SECONDS, max_burst=MAX_BURST_SECONDS):
+    """Blocks until something changes, then collects changes until ``debounce`` seconds pass quietly."""
+    changed = set()
+    while not changed:
+        changed = watcher.changes(timeout=None)
+    deadline = time.monotonic() + max_burst
+    while time.monotonic() < deadline:
+        more = watcher.changes(timeout=debounce)
+        if not more:
+            break
+        changed |= more
+    return changed
+
+
+def snapshot(root):
+    """``{path: content digest}`` of the tree as the last run left it."""
+    return {path: file_digest(path) for path in lint.walk_files(root, "", MAX_WATCHED_FILES) or ()}
+
+
+def content_changes(paths, graded):
+    """Paths whose contents differ from ``graded`` (updated in place)."""
+    changed = set()
+    for path in paths:
+        digest = file_digest(path) if os.path.isfile(path) else None
+        if digest != graded.get(path):
+            changed.add(path)
+            if digest is None:
+                graded.pop(path, None)
+            else:
+                graded[path] = digest
+    return changed
+
+
+def verdicts(tester):
+    """``{exercise: "pass" | "fail"}`` of the last run (error labels for checkers without exercises)."""
+    found = dict(getattr(tester, "verdicts", None) or {})
+    if not found:
+        found = {label: "fail" for label in getattr(tester, "grouped_errors", {}) or {}}
+    return found
+
+
+def diff_verdicts(before, after):
+    """``[(exercise, old, new)]`` for every verdict that changed, in ``after`` order."""
+    changes = [(name, before.get(name), status) for name, status in after.items() if before.get(name) != status]
+    changes.extend((name, status, None) for name, status in before.items() if name not in after)
+    return changes
+
+
+_LABELS = {"pass": "[green]OK[/green]", "fail": "[red]KO[/red]", None: "[dim]—[/dim]"}
+
+
+def print_diff(before, after, rerun):
+    changes = diff_verdicts(before, after)
+    passed = sum(1 for status in after.values() if status == "pass")
+    console.rule("[bold cyan]Watch[/bold cyan]")
+    for name, old, new in changes:
+        icon = "[green]✔[/green]" if new == "pass" else "[red]✘[/red]"
+        console.print(f"{icon} {name}: {_LABELS[old]} → {_LABELS[new]}")
+    if not changes:
+        console.print("[dim]No verdict changed.[/dim]")
+    console.print(
+        f"[bold]{passed}/{len(after)} passing[/bold] [dim]({len(rerun)} re-run, "
+        f"{len(after) - len(rerun)} unchanged)[/dim]"
+    )
+
+
+def _forget_student_modules(root):
+    """Drops student modules from ``sys.modules`` so the next run imports the saved code."""
+    prefix = root + os.sep
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.abspath(path).startswith(prefix):
+            del sys.modules[name]
+
+
+def watch(runner, module_name, exercise=None, verbose=False, jobs=1, force=False):
+    """Grades, then re-grades on every save until interrupted; returns the last run's outcome."""
+    from germinette.core import ModuleDetector
+
+    if module_name is None:
+        module_name = ModuleDetector.detect()
+        if module_name is None:
+            console.print("[yellow]Could not auto-detect the module to watch.[/yellow]")
+            console.print("Run with: [bold]germinette <module_name> --watch[/bold]")
+            return None
+
+    root = os.getcwd()
+    watcher = make_watcher(root)
+    outcome = runner.run_module(module_name, exercise, verbose=verbose, jobs=jobs, force=force)
+    graded = snapshot(root)
+    if runner.tester is None:
+        watcher.close()
+        return outcome
+    previous = verdicts(runner.tester)
+    kind = "inotify" if isinstance(watcher, InotifyWatcher) else "polling"
+    try:
+        while True:
+            console.print(f"\n[bold blue]👀 Watching {root} for changes ({kind}); Ctrl+C to stop.[/bold blue]")
+            changed = set()
+            while not changed:
+                changed = content_changes(next_batch(watcher), graded)
+            names = sorted(os.path.relpath(p, root) for p in changed)
+            shown = ", ".join(names[:5]) + (f" and {len(names) - 5} more" if len(names) > 5 else "")
+            console.print(f"\n[bold]Changed:[/bold] {shown}")
+            _forget_student_modules(root)
+            outcome = runner.run_module(
+                module_name, exercise, verbose=verbose, jobs=jobs, force=force, quiet_replay=True
+            )
+            graded = snapshot(root)
+            current = verdicts(runner.tester) if runner.tester is not None else {}
+            replayed = getattr(runner.tester, "replayed", None) or set()
+            print_diff(previous, current, [name for name in current if name not in replayed])
+            previous = current
+    except KeyboardInterrupt:
+        console.print("\n[dim]Stopped watching.[/dim]")
+    finally:
+        watcher.close()
+    return outcome
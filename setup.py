@@ -11,7 +11,7 @@ setup(
     version=version,
     description="Testing tool for 42 Python projects",
     author="ExceptedPrism3",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     entry_points={
         "console_scripts": [
             "germinette=germinette.__main__:main",
@@ -25,6 +25,9 @@ setup(
         "dev": [
             "pytest>=8",
         ],
+        "fast": [
+            "numpy",  # Vectorized A-Maze-ing grid checks
+        ],
     },
     python_requires=">=3.10",
 )
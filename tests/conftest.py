@@ -0,0 +1,13 @@
+from pathlib import Path
+
+import pytest
+
+from germinette.cache import result_cache
+
+
+@pytest.fixture(autouse=True)
+def _isolated_result_cache(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep every test away from the user's ~/.cache/germinette (and from each other)."""
+    cache_home: Path = tmp_path_factory.mktemp("xdg-cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    monkeypatch.setattr(result_cache, "directory", None)
@@ -110,3 +110,138 @@ def _loop(seed=None):
         display_src=display_src,
     )
     assert any("increments seed without a guard" in msg for msg in errors)
+
+
+SEEDED_MAIN_SRC = """
+import sys
+import time
+
+lines = open(sys.argv[1]).read().splitlines()
+cfg = dict(line.split("=", 1) for line in lines if "=" in line and not line.startswith("#"))
+start = time.time()
+time.sleep(1)
+with open(cfg["OUTPUT_FILE"], "w") as out:
+    out.write("%X\\n\\n0,0\\n0,0\\nE\\n" % (int(cfg.get("SEED", "0")) % 16))
+with open("runs.log", "a") as log:
+    log.write("%r %r\\n" % (start, time.time()))
+"""
+
+
+def _run_seed_regeneration_check(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, main_output: tuple[str, str] | None
+) -> tuple[list[str], list[tuple[float, float]]]:
+    from germinette.subjects.a_maze_ing import Tester
+
+    _write_file(tmp_path / "a_maze_ing.py", SEEDED_MAIN_SRC)
+    _write_file(tmp_path / "config.txt", "WIDTH=1\nHEIGHT=1\nOUTPUT_FILE=maze.txt\nSEED=1")
+    monkeypatch.chdir(tmp_path)
+    tester = Tester()
+    tester.test_seed_regeneration_behavior(Path("a_maze_ing.py"), Path("config.txt"), main_output)
+    lines = (tmp_path / "runs.log").read_text(encoding="utf-8").splitlines()
+    runs = [(float(start), float(end)) for start, end in (line.split() for line in lines)]
+    return tester.grouped_errors.get("Seed Behavior", []) + tester.warnings, runs
+
+
+def test_seed_regeneration_runs_concurrently(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    errors, runs = _run_seed_regeneration_check(tmp_path, monkeypatch, main_output=None)
+
+    assert not errors
+    assert len(runs) == 2
+    # Each run sleeps a second: they overlap when one starts before the other ends.
+    (first_start, first_end), (second_start, second_end) = sorted(runs)
+    assert second_start < first_end
+
+
+def test_seed_regeneration_reuses_identical_main_run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from germinette import maze
+
+    (tmp_path / "maze.txt").write_text("1\n\n0,0\n0,0\nE\n", encoding="utf-8")
+    main_output = ("maze.txt", maze.read_output(tmp_path / "maze.txt").digest)
+
+    errors, runs = _run_seed_regeneration_check(tmp_path, monkeypatch, main_output=main_output)
+
+    assert not errors
+    assert len(runs) == 1
+
+
+@pytest.mark.parametrize("writes_output", [True, False])
+def test_main_run_output_is_reused_only_when_the_run_wrote_it(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, writes_output: bool
+) -> None:
+    from germinette.subjects.a_maze_ing import Tester
+
+    grid = "D7\n\n0,0\n1,0\nE\n"
+    # Fresh mtime either way: only the run itself may count as having written it.
+    _write_file(tmp_path / "maze.txt", grid)
+    body = f"open('maze.txt', 'w').write({grid!r})\n" if writes_output else "pass\n"
+    _write_file(tmp_path / "a_maze_ing.py", body)
+    _write_file(
+        tmp_path / "config.txt", "WIDTH=2\nHEIGHT=1\nENTRY=0,0\nEXIT=1,0\nOUTPUT_FILE=maze.txt\nPERFECT=True\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    reused: list[object] = []
+    monkeypatch.setattr(Tester, "check_flake8", lambda self, path: "")
+    monkeypatch.setattr(
+        Tester, "test_seed_regeneration_behavior", lambda self, main, cfg, main_output=None: reused.append(main_output)
+    )
+
+    Tester().test_main_script_and_output()
+
+    assert len(reused) == 1
+    assert (reused[0] is not None) == writes_output
+
+
+SWEEP_MAIN_SRC = """
+import sys
+
+lines = open(sys.argv[1]).read().splitlines()
+cfg = dict(line.split("=", 1) for line in lines if "=" in line and not line.startswith("#"))
+width, height, seed = int(cfg["WIDTH"]), int(cfg["HEIGHT"]), int(cfg["SEED"])
+cell = "X" if seed % 3 == 0 else "F"
+with open(cfg["OUTPUT_FILE"], "w") as out:
+    out.write((cell * width + "\\n") * height + "\\n0,0\\n0,0\\n\\n")
+"""
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_seed_sweep_lists_failing_seeds(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], jobs: int
+) -> None:
+    from germinette.subjects.a_maze_ing import Tester
+
+    _write_file(tmp_path / "a_maze_ing.py", SWEEP_MAIN_SRC)
+    _write_file(
+        tmp_path / "config.txt",
+        "WIDTH=6\nHEIGHT=5\nENTRY=0,0\nEXIT=0,0\nOUTPUT_FILE=maze.txt\nPERFECT=True\nSEED=10",
+    )
+    monkeypatch.chdir(tmp_path)
+    tester = Tester()
+    tester.jobs = jobs
+
+    tester.test_seed_sweep(8)
+
+    errors = tester.grouped_errors.get("Seed Sweep", [])
+    assert len(errors) == 1
+    # SEED=10 itself is the main run's: the sweep covers 11..18.
+    assert "3 of 8 generated configs" in errors[0] and "(SEED 12, 15, 18)" in errors[0]
+    assert "Grid rows must be hex digits only." in capsys.readouterr().out
+    assert not (tmp_path / "maze.txt").exists()
+
+
+def test_sweep_starts_after_the_main_seed() -> None:
+    from germinette.subjects.a_maze_ing import _sweep_cases
+
+    cases = _sweep_cases(3, 6, 5, (0, 0), (5, 4), True, 10)
+
+    assert [case["seed"] for case in cases] == [11, 12, 13]
+    assert [case["perfect"] for case in cases] == [True, False, True]
+
+
+def test_sweep_rejects_negative_counts(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    from germinette.__main__ import main
+
+    monkeypatch.setattr("sys.argv", ["germinette", "a_maze_ing", "--sweep", "-1"])
+    with pytest.raises(SystemExit):
+        main()
+
+    assert "--sweep must be a non-negative integer" in capsys.readouterr().err
@@ -0,0 +1,138 @@
+"""Batch grading: one isolated process per submission, results streamed in completion order."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+from germinette import batch
+from germinette.core import BaseTester, console
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="batch grading tests rely on fork")
+
+
+class _AnswerTester(BaseTester):
+    """Grades ``answer.txt`` in the current directory: ok, fail, hang or crash."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.exercises = [("ex0", self.test_answer)]
+
+    def test_answer(self) -> None:
+        answer = Path("answer.txt").read_text(encoding="utf-8").strip()
+        console.print(f"cwd={os.path.basename(os.getcwd())} tmp={tempfile.gettempdir() != '/tmp'}")
+        if answer == "hang":
+            time.sleep(60)
+        elif answer == "spawn-and-hang":
+            helper = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+            Path("helper.pid").write_text(str(helper.pid), encoding="utf-8")
+            time.sleep(60)
+        elif answer == "crash":
+            os._exit(3)
+        elif answer != "ok":
+            self.record_error("Exercise 0", "Output Error", f"got {answer}")
+        else:
+            self.mark_ok()
+
+
+@pytest.fixture
+def cohort(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    module = types.ModuleType("germinette.subjects.fake_batch")
+    module.Tester = _AnswerTester
+    monkeypatch.setitem(sys.modules, "germinette.subjects.fake_batch", module)
+    for name, answer in [("alice", "ok"), ("bob", "wrong"), ("carol", "hang"), ("dave", "crash")]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "answer.txt").write_text(answer, encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("not a submission", encoding="utf-8")
+    return tmp_path
+
+
+def test_discover_only_returns_directories(cohort: Path) -> None:
+    found = batch.discover(str(cohort / "*"))
+
+    assert [os.path.basename(p) for p in found] == ["alice", "bob", "carol", "dave"]
+
+
+def test_run_batch_isolates_and_classifies_submissions(cohort: Path) -> None:
+    streamed: list[str] = []
+    submissions = batch.discover(str(cohort / "*"))
+
+    start = time.monotonic()
+    results = batch.run_batch(
+        "fake_batch", submissions, jobs=4, timeout=3, on_result=lambda r: streamed.append(r["submission"])
+    )
+
+    assert time.monotonic() - start < 30
+    assert [r["status"] for r in results] == ["pass", "fail", "timeout", "error"]
+    assert "cwd=alice tmp=True" in results[0]["log"]
+    assert results[1]["failed"] == ["Exercise 0"] and results[1]["ko"] == 1
+    assert results[3]["error"] == "grader exited with code 3"
+    # Streamed as each finished: the hanging submission comes last.
+    assert sorted(streamed) == sorted(submissions)
+    assert streamed[-1].endswith("carol")
+    assert os.getcwd() != str(cohort / "alice")
+
+
+def _alive(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+    except OSError:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+
+def test_timeout_kills_what_the_grader_started(cohort: Path) -> None:
+    (cohort / "erin").mkdir()
+    (cohort / "erin" / "answer.txt").write_text("spawn-and-hang", encoding="utf-8")
+
+    results = batch.run_batch("fake_batch", [str(cohort / "erin")], timeout=2)
+
+    assert results[0]["status"] == "timeout"
+    pid = int((cohort / "erin" / "helper.pid").read_text(encoding="utf-8"))
+    deadline = time.monotonic() + 5
+    while _alive(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _alive(pid)
+
+
+def test_main_exit_code_and_logs(cohort: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    logs = cohort / "logs"
+    pattern = str(cohort / "[ab]*")
+
+    assert batch.main(["fake_batch", pattern, "-j", "2", "--log-dir", str(logs)]) == 1
+
+    out = capsys.readouterr().out
+    assert "2 submission(s)" in out and "PASS 1" in out and "FAIL 1" in out
+    assert len(list(logs.iterdir())) == 2
+
+
+def test_main_rejects_unknown_module(cohort: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert batch.main(["python_module_77", str(cohort / "*")]) == 2
+    assert "not found" in capsys.readouterr().out
+
+
+def test_main_jsonl_streams_submission_records(cohort: Path, capfd: pytest.CaptureFixture[str]) -> None:
+    # Graders are separate processes writing to file descriptor 1: capture at fd level.
+    assert batch.main(["fake_batch", str(cohort / "[ab]*"), "-j", "2", "--format", "jsonl"]) == 1
+
+    captured = capfd.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    submissions = {os.path.basename(r["submission"]): r for r in records if r["event"] == "submission"}
+    assert {name: r["status"] for name, r in submissions.items()} == {"alice": "pass", "bob": "fail"}
+    failure = next(r for r in records if r["event"] == "result")
+    assert failure["submission"].endswith("bob") and failure["check"] == "output-error"
+    assert "batch summary" in captured.err
@@ -0,0 +1,48 @@
+"""``benchmarks/``: synthetic submissions and the regression threshold."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from benchmarks import run, scenarios
+
+
+def test_scenarios_build_expected_trees(tmp_path: Path) -> None:
+    found = scenarios.scenarios()
+
+    assert "python_module_07-golden" in found
+    assert {name.rsplit("-", 1)[1] for name in found} == {"clean", "broken", "golden"}
+    for name in ("python_module_00-clean", "python_module_06-broken", "python_module_07-golden"):
+        subject, builder = found[name]
+        root = tmp_path / name
+        builder(str(root))
+        for relpath in scenarios.SUBJECT_FILES[subject]:
+            assert (root / relpath).is_file(), relpath
+    assert not (tmp_path / "python_module_07-golden" / "__pycache__").exists()
+    assert "eval(" in (tmp_path / "python_module_06-broken" / "ft_alembic_0.py").read_text(encoding="utf-8")
+
+
+def test_compare_flags_regressions_past_threshold() -> None:
+    baseline = {
+        "a": {"wall_seconds": 1.0, "subprocesses": 4, "peak_rss_kb": 1000},
+        "b": {"wall_seconds": 0.1, "subprocesses": 4, "peak_rss_kb": 1000},
+    }
+    current = {
+        "a": {"wall_seconds": 1.3, "subprocesses": 5, "peak_rss_kb": 1300},
+        # +40%, but under the absolute noise floor.
+        "b": {"wall_seconds": 0.14, "subprocesses": 4, "peak_rss_kb": 1200},
+        "new": {"wall_seconds": 9.0, "subprocesses": 9, "peak_rss_kb": 9000},
+    }
+
+    regressions = run.compare(current, baseline, threshold=0.25)
+
+    assert [name for name, _ in regressions] == ["a", "a", "a"]
+    assert run.compare(current, baseline, threshold=0.5) == [("a", "subprocesses 4 -> 5")]
+
+
+def test_committed_baseline_covers_every_scenario() -> None:
+    baseline = run.load_baseline(run.BASELINE)
+
+    assert set(baseline["scenarios"]) == set(scenarios.scenarios())
+    assert run.load_baseline(os.path.join("missing", "baseline.json")) == {"machine": None, "scenarios": {}}
@@ -0,0 +1,63 @@
+"""
+Cold-start guard: --version / --help must not pay for rich, the runner or subjects.
+
+The guard is the set of imported modules, which does not depend on the host.
+The import-time budget is an opt-in benchmark: set
+``GERMINETTE_IMPORT_BUDGET_MS`` (e.g. 80) to run it.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+HEAVY_PREFIXES = (
+    "rich", "requests", "germinette.core", "germinette.subjects", "germinette.lint", "germinette.batch",
+    "germinette.watch", "urllib.request", "http.client", "ssl", "multiprocessing", "concurrent",
+)
+# Import time of germinette itself and everything it pulls in, best of 3 runs (opt-in).
+BUDGET_MS = os.environ.get("GERMINETTE_IMPORT_BUDGET_MS")
+
+
+def _importtime(*args: str) -> tuple[list[str], float]:
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "germinette", *args],
+        capture_output=True, text=True, env=env, timeout=60,
+    )
+    modules, total_us, seen_germinette = [], 0, False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append(name.strip())
+        seen_germinette = seen_germinette or name.strip() == "germinette"
+        # Top-level entries only (nested ones are included in their parent's cumulative time).
+        if seen_germinette and not name.startswith("  "):
+            total_us += int(cumulative)
+    return modules, total_us / 1000
+
+
+@pytest.mark.parametrize("args", [("--version",), ("--help",), ("--jobs", "0")])
+def test_fast_paths_skip_heavy_imports(args: tuple[str, ...]) -> None:
+    modules, _ = _importtime(*args)
+
+    assert "germinette" in modules
+    assert [m for m in modules if _is_heavy(m)] == []
+
+
+def _is_heavy(module: str) -> bool:
+    return any(module == prefix or module.startswith(prefix + ".") for prefix in HEAVY_PREFIXES)
+
+
+@pytest.mark.skipif(not BUDGET_MS, reason="benchmark: set GERMINETTE_IMPORT_BUDGET_MS to run it")
+def test_version_import_time_budget() -> None:
+    budget = float(BUDGET_MS or 0)
+    best = min(_importtime("--version")[1] for _ in range(3))
+
+    assert best < budget, f"germinette --version imports took {best:.1f} ms (budget {budget:g} ms)"
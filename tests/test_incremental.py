@@ -0,0 +1,151 @@
+"""Incremental re-grading: unchanged exercises replay their cached verdict."""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from germinette.core import BaseTester, GerminetteRunner
+
+CALLS: list[str] = []
+
+
+class _FilesTester(BaseTester):
+    """ex0 reads a.txt in-process, ex1 runs b.py (which imports helper.py)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.exercises = [("ex0", self.test_read), ("ex1", self.test_script)]
+
+    def test_read(self) -> None:
+        CALLS.append("ex0")
+        print("reading a.txt")
+        if Path("a.txt").read_text(encoding="utf-8").strip() != "ok":
+            self.record_error("Exercise 0", "Output Error", "a.txt is not ok")
+        else:
+            self.mark_ok()
+
+    def test_script(self) -> None:
+        CALLS.append("ex1")
+        result = self.script_runner.run([sys.executable, "b.py"])
+        if result.stdout.strip() != "ok":
+            self.record_error("Exercise 1", "Output Error", f"b.py printed {result.stdout.strip()!r}")
+
+
+@pytest.fixture
+def submission(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    module = types.ModuleType("germinette.subjects.fake_incremental")
+    module.Tester = _FilesTester
+    monkeypatch.setitem(sys.modules, "germinette.subjects.fake_incremental", module)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.txt").write_text("ok\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("from helper import WORD\nprint(WORD)\n", encoding="utf-8")
+    (tmp_path / "helper.py").write_text('WORD = "ok"\n', encoding="utf-8")
+    CALLS.clear()
+    return tmp_path
+
+
+def _grade(force: bool = False) -> GerminetteRunner:
+    runner = GerminetteRunner()
+    runner.run_module("fake_incremental", force=force)
+    return runner
+
+
+def test_unchanged_exercises_replay_output_and_verdict(submission: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    (submission / "a.txt").write_text("bad\n", encoding="utf-8")
+    first = _grade()
+    first_out = capsys.readouterr().out
+    CALLS.clear()
+
+    second = _grade()
+
+    assert CALLS == []
+    out = capsys.readouterr().out
+    assert out.count("cached result") == 2
+    assert "reading a.txt" in out
+    assert second.tester.grouped_errors == first.tester.grouped_errors
+    assert (second.tester.ok_count, second.tester.ko_count) == (first.tester.ok_count, first.tester.ko_count)
+    assert "cached result" not in first_out
+
+
+def test_only_exercises_with_changed_inputs_rerun(submission: Path) -> None:
+    _grade()
+    CALLS.clear()
+
+    (submission / "a.txt").write_text("bad\n", encoding="utf-8")
+    runner = _grade()
+    assert CALLS == ["ex0"]
+    assert list(runner.tester.grouped_errors) == ["Exercise 0"]
+
+    # The script's import is read by another process: any source change near it counts.
+    CALLS.clear()
+    (submission / "helper.py").write_text('WORD = "changed"\n', encoding="utf-8")
+    runner = _grade()
+    assert CALLS == ["ex1"]
+    assert list(runner.tester.grouped_errors) == ["Exercise 0", "Exercise 1"]
+
+
+def test_new_files_and_force_rerun_everything(submission: Path) -> None:
+    _grade()
+    CALLS.clear()
+
+    (submission / "notes.md").write_text("new\n", encoding="utf-8")
+    _grade()
+    assert CALLS == ["ex0", "ex1"]
+
+    CALLS.clear()
+    _grade(force=True)
+    assert CALLS == ["ex0", "ex1"]
+
+
+def test_direct_tester_runs_are_not_cached(submission: Path) -> None:
+    _FilesTester().run()
+    _FilesTester().run()
+
+    assert CALLS == ["ex0", "ex1", "ex0", "ex1"]
+
+
+@pytest.mark.parametrize("backend", ["pool", "subprocess"])
+def test_script_data_files_count_but_files_it_writes_do_not(
+    submission: Path, backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if backend == "subprocess":
+        # No list of opened files: every file around the script counts.
+        monkeypatch.setenv("GERMINETTE_NO_SCRIPT_POOL", "1")
+    (submission / "b.py").write_text(
+        "import random\n"
+        "from helper import WORD\n"
+        "with open('out.txt', 'w') as f:\n"
+        "    f.write(str(random.random()))\n"
+        "with open('config.txt') as f:\n"
+        "    print(WORD if f.read().strip() == 'ok' else 'bad')\n",
+        encoding="utf-8",
+    )
+    (submission / "config.txt").write_text("ok\n", encoding="utf-8")
+    (submission / "out.txt").write_text("", encoding="utf-8")
+    _grade()
+    CALLS.clear()
+
+    # out.txt changed during the run: an output, not an input.
+    _grade()
+    assert CALLS == []
+
+    (submission / "config.txt").write_text("no\n", encoding="utf-8")
+    runner = _grade()
+    assert CALLS == ["ex1"]
+    assert list(runner.tester.grouped_errors) == ["Exercise 1"]
+
+
+def test_checker_sources_are_part_of_the_key(submission: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from germinette import incremental
+
+    _grade()
+    CALLS.clear()
+
+    # Any other file of the package (here a pretend edit of germinette/maze.py).
+    monkeypatch.setattr(incremental, "_package", "edited")
+    _grade()
+    assert CALLS == ["ex0", "ex1"]
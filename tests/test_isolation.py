@@ -0,0 +1,105 @@
+"""``germinette.isolation``: probing student imports and not leaking them."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from germinette import isolation
+
+
+def _write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_load_returns_a_working_module_without_leaking_imports(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    _write(tmp_path / "ex0" / "helper_iso.py", "def double(x):\n    return 2 * x\n")
+    path = _write(
+        tmp_path / "ex0" / "spells_iso.py",
+        "import sys, os, colorsys\n"
+        "sys.path.insert(0, os.path.dirname(__file__))\n"
+        "import helper_iso\n"
+        "def quadruple(x):\n"
+        "    return helper_iso.double(helper_iso.double(x))\n",
+    )
+    path_before = list(sys.path)
+
+    mod = isolation.load(str(path), "mod_iso_test")
+
+    assert mod.quadruple(3) == 12
+    assert sys.path == path_before
+    assert "helper_iso" not in sys.modules
+    assert "mod_iso_test" not in sys.modules
+    # Standard-library imports stay warm.
+    assert "colorsys" in sys.modules
+
+
+@pytest.mark.skipif(not hasattr(__import__("os"), "fork"), reason="needs os.fork")
+@pytest.mark.parametrize(
+    "source, message",
+    [
+        ("def f(:\n", "invalid syntax"),
+        ("raise ValueError('bad import')\n", "bad import"),
+        ("import sys\nsys.exit(3)\n", "exits while being imported (exit code 3)"),
+        ("import os\nos._exit(4)\n", "interpreter stopped during the import (exit status 4)"),
+        ("input()\n", "EOF when reading a line"),
+    ],
+)
+def test_failing_imports_are_reported_not_run_in_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, source: str, message: str
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    path = _write(tmp_path / "broken_iso.py", "print('side effect')\n" + source)
+
+    with pytest.raises(isolation.ImportFailed) as failure:
+        isolation.load(str(path), "mod_iso_test")
+
+    assert message in str(failure.value)
+    if "exit status" not in message:
+        assert "broken_iso.py" in failure.value.details
+
+
+@pytest.mark.skipif(not hasattr(__import__("os"), "fork"), reason="needs os.fork")
+def test_hanging_imports_are_killed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    path = _write(tmp_path / "loop_iso.py", "while True:\n    pass\n")
+    started = time.monotonic()
+
+    with pytest.raises(isolation.ImportFailed, match="did not finish within 0.5 seconds"):
+        isolation.load(str(path), "mod_iso_test", timeout=0.5)
+
+    assert time.monotonic() - started < 5
+
+
+def test_top_level_runs_twice_and_the_second_run_is_timed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    counter = tmp_path / "runs.txt"
+    # Fast the first time; the second run (in the grader) finds the file and loops.
+    path = _write(
+        tmp_path / "twice_iso.py",
+        "import os\n"
+        f"path = {str(counter)!r}\n"
+        "seen = os.path.exists(path)\n"
+        "with open(path, 'a') as f:\n"
+        "    f.write('run\\n')\n"
+        "while seen:\n"
+        "    pass\n",
+    )
+    started = time.monotonic()
+
+    with pytest.raises(isolation.ImportFailed, match="when run again in the grader"):
+        isolation.load(str(path), "mod_iso_test", timeout=0.5)
+
+    assert time.monotonic() - started < 5
+    assert counter.read_text(encoding="utf-8") == "run\nrun\n"
+    assert "mod_iso_test" not in sys.modules
@@ -0,0 +1,114 @@
+"""The warm lint backends must report exactly what the flake8/mypy CLIs report."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from germinette import lint
+
+_SOURCE = "import os\n\n\ndef add(a: int, b: int) -> int:\n    return a + b  \n\n\nx: str = add(1, 2)\n"
+
+
+@pytest.fixture
+def student_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    (tmp_path / "student.py").write_text(_SOURCE, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    lint.shutdown()
+    monkeypatch.setattr(lint, "_daemon", None)
+    return "student.py"
+
+
+def _cli(tool: str, path: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-m", tool, path], capture_output=True, text=True, timeout=60
+    )
+
+
+def test_in_process_flake8_matches_cli(student_file: str) -> None:
+    result = lint.run_flake8(student_file)
+    expected = _cli("flake8", student_file)
+
+    assert result is not None
+    assert result.returncode == expected.returncode == 1
+    assert result.stdout == expected.stdout
+
+
+def test_dmypy_matches_cli(student_file: str) -> None:
+    try:
+        result = lint.run_mypy(student_file, timeout=60)
+        if result is None:
+            pytest.skip("dmypy daemon unavailable here")
+        expected = _cli("mypy", student_file)
+
+        assert result.returncode == expected.returncode == 1
+        assert result.stdout == expected.stdout
+    finally:
+        lint.shutdown()
+
+
+def test_backends_can_be_disabled(student_file: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GERMINETTE_NO_LINT_DAEMON", "1")
+
+    assert lint.run_flake8(student_file) is None
+    assert lint.run_mypy(student_file) is None
+
+
+@pytest.mark.parametrize("warm", [True, False], ids=["warm", "subprocess"])
+def test_batch_results_match_per_file_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, warm: bool
+) -> None:
+    for name, source in {
+        "ex0/ft_a.py": _SOURCE,
+        "ex0/ft_b.py": "def ok() -> None:\n    pass\n",
+        "ex1/ft_c.py": "def bad(x):\n    return x.missing  # noqa\n\n\ny: int = 'no'\n",
+    }.items():
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text(source, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    if not warm:
+        monkeypatch.setenv("GERMINETTE_NO_LINT_DAEMON", "1")
+    lint.shutdown()
+    monkeypatch.setattr(lint, "_daemon", None)
+    paths = [str(tmp_path / n) for n in ("ex0/ft_a.py", "ex0/ft_b.py", "ex1/ft_c.py")]
+
+    try:
+        batch = lint.lint_many(paths)
+        for path in paths:
+            flake8_result, mypy_result = batch[path]
+            assert flake8_result is not None and mypy_result is not None
+            for tool, result in (("flake8", flake8_result), ("mypy", mypy_result)):
+                expected = _cli(tool, path)
+                assert (result.returncode, result.stdout) == (expected.returncode, expected.stdout)
+    finally:
+        lint.shutdown()
+
+
+@pytest.mark.parametrize("warm", [True, False], ids=["warm", "subprocess"])
+def test_batch_reports_errors_of_imported_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, warm: bool
+) -> None:
+    (tmp_path / "ex0").mkdir()
+    (tmp_path / "ex0" / "ft_b.py").write_text("x: int = 'no'\n", encoding="utf-8")
+    (tmp_path / "ex0" / "ft_a.py").write_text("import ft_b\n\n\ny: int = ft_b.x\n", encoding="utf-8")
+    (tmp_path / "ex0" / "ft_c.py").write_text("z: int = 1\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    if not warm:
+        monkeypatch.setenv("GERMINETTE_NO_LINT_DAEMON", "1")
+    lint.shutdown()
+    monkeypatch.setattr(lint, "_daemon", None)
+    paths = [str(tmp_path / "ex0" / n) for n in ("ft_a.py", "ft_b.py", "ft_c.py")]
+
+    try:
+        batch = lint.lint_many(paths)
+        for path in paths:
+            result = batch[path][1]
+            expected = _cli("mypy", path)
+            assert result is not None
+            assert (result.returncode, result.stdout) == (expected.returncode, expected.stdout)
+        assert batch[paths[0]][1].returncode == 1
+    finally:
+        lint.shutdown()
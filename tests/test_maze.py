@@ -0,0 +1,207 @@
+"""``germinette.maze``: the A-Maze-ing grid engine against the per-cell reference loops."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from germinette import maze
+
+BACKENDS = [False] + ([True] if maze.numpy is not None else [])
+
+
+def _closed(cell: int, bit: int) -> bool:
+    return ((cell >> bit) & 1) == 1
+
+
+def _reference(rows: list[list[int]]) -> tuple[list, list, list]:
+    """The checker's original nested loops."""
+    height, width = len(rows), len(rows[0])
+    borders = []
+    if any(not _closed(rows[0][x], 0) for x in range(width)):
+        borders.append("N")
+    if any(not _closed(rows[height - 1][x], 2) for x in range(width)):
+        borders.append("S")
+    if any(not _closed(rows[y][0], 3) for y in range(height)):
+        borders.append("W")
+    if any(not _closed(rows[y][width - 1], 1) for y in range(height)):
+        borders.append("E")
+    walls = []
+    for y in range(height):
+        for x in range(width):
+            v = rows[y][x]
+            if y > 0 and _closed(v, 0) != _closed(rows[y - 1][x], 2):
+                walls.append(("NS", x, y))
+                break
+            if x < width - 1 and _closed(v, 1) != _closed(rows[y][x + 1], 3):
+                walls.append(("EW", x, y))
+                break
+    areas = []
+    for y in range(height - 2):
+        for x in range(width - 2):
+            if all(rows[yy][xx] == 0 for yy in range(y, y + 3) for xx in range(x, x + 3)):
+                areas.append((x, y))
+                break
+    return borders, walls, areas
+
+
+def _random_rows(rng: random.Random, width: int, height: int) -> list[list[int]]:
+    # Mostly open cells, so 3x3 areas and incoherent walls both show up.
+    return [[rng.choice([0, 0, 0, 0, rng.randrange(16)]) for _ in range(width)] for _ in range(height)]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_engine_matches_reference_loops(use_numpy: bool) -> None:
+    rng = random.Random(42)
+    for _ in range(300):
+        rows = _random_rows(rng, rng.randint(1, 9), rng.randint(1, 9))
+        text = ["".join("%x" % v if rng.random() < 0.5 else "%X" % v for v in row) for row in rows]
+        grid = maze.Grid.parse(text, use_numpy=use_numpy)
+
+        assert grid.rows() == rows
+        assert (grid.open_borders(), grid.incoherent_walls(), grid.open_areas(3)) == _reference(rows)
+        assert grid.count(maze.CLOSED) == sum(row.count(0xF) for row in rows)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_valid_maze_has_no_findings(use_numpy: bool) -> None:
+    rows = ["FFFF", "D557", "FFFF"]
+    grid = maze.Grid.parse(rows, use_numpy=use_numpy)
+
+    assert (grid.width, grid.height, grid.cell(1, 1)) == (4, 3, 0x5)
+    assert grid.open_borders() == []
+    assert grid.incoherent_walls() == []
+    assert grid.open_areas(3) == []
+
+
+@pytest.mark.parametrize("rows", [["12", "3G"], ["12", "345"], ["1é"]])
+def test_parse_rejects_non_hex_and_ragged_rows(rows: list[str]) -> None:
+    with pytest.raises(ValueError):
+        maze.Grid.parse(rows)
+
+
+def test_large_grid_is_validated_quickly() -> None:
+    import time
+
+    # 1000 x 1000 with a fully open interior: every window row off the border has an open area.
+    rows = ["9" + "1" * 998 + "3"] + ["8" + "0" * 998 + "2"] * 998 + ["C" + "4" * 998 + "6"]
+    started = time.perf_counter()
+    grid = maze.Grid.parse(rows)
+    borders, walls, areas = grid.open_borders(), grid.incoherent_walls(), grid.open_areas(3)
+    elapsed = time.perf_counter() - started
+
+    assert borders == []
+    assert walls == []
+    assert len(areas) == 996 and areas[0] == (1, 1)
+    assert elapsed < 2.0
+
+
+def _output(tmp_path, content: bytes) -> maze.Output:
+    path = tmp_path / "output_maze.txt"
+    path.write_bytes(content)
+    return maze.read_output(path)
+
+
+def test_read_output_matches_text_mode_reading(tmp_path) -> None:
+    for newline in (b"\n", b"\r\n"):
+        content = newline.join([b"FFFF", b"d557", b"FFFF", b"", b"0,1", b"3,1", b"EEE"]) + newline
+        output = _output(tmp_path, content)
+
+        assert output.trailer == ["0,1", "3,1", "EEE"]
+        assert (output.width, output.height, output.ragged, output.bad_hex) == (4, 3, False, False)
+        assert output.grid().rows() == maze.Grid.parse(["FFFF", "D557", "FFFF"]).rows()
+        assert isinstance(output.grid().cells, bytearray)
+
+
+def test_read_output_flags_bad_rows_and_missing_separator(tmp_path) -> None:
+    assert _output(tmp_path, b"").trailer is None
+    assert _output(tmp_path, b"FFFF\nFFFF\n").trailer is None
+    assert _output(tmp_path, b"\n1,1\n").height == 0
+
+    bad = _output(tmp_path, b"FF\nFG\n\na\nb\nc\nd\n")
+    assert bad.bad_hex and not bad.ragged and bad.height == 2 and len(bad.trailer) == 4
+    ragged = _output(tmp_path, b"FF\nFFF\n\n")
+    assert ragged.ragged and not ragged.bad_hex and ragged.trailer == []
+    with pytest.raises(ValueError):
+        ragged.grid()
+
+
+def test_read_output_digest_compares_grid_rows_only(tmp_path) -> None:
+    first = _output(tmp_path, b"FFFF\nFFFF\n\n0,0\n1,1\nE\n").digest
+    same_grid = _output(tmp_path, b"FFFF\r\nFFFF\r\n\r\n0,0\r\n1,1\r\nES\r\n").digest
+    other_grid = _output(tmp_path, b"FFFF\nFFFE\n\n0,0\n1,1\nE\n").digest
+
+    assert first == same_grid
+    assert first != other_grid
+
+
+def _coherent_rows(rng: random.Random, width: int, height: int) -> list[list[int]]:
+    rows = [[0] * width for _ in range(height)]
+    for y in range(height):
+        for x in range(width):
+            if rng.random() < 0.1:
+                rows[y][x] = maze.CLOSED
+    for y in range(height):
+        for x in range(width):
+            if x == width - 1 or rows[y][x] == maze.CLOSED or rows[y][x + 1] == maze.CLOSED or rng.random() < 0.4:
+                rows[y][x] |= 1 << maze.EAST
+                if x < width - 1:
+                    rows[y][x + 1] |= 1 << maze.WEST
+            if y == height - 1 or rows[y][x] == maze.CLOSED or rows[y + 1][x] == maze.CLOSED or rng.random() < 0.4:
+                rows[y][x] |= 1 << maze.SOUTH
+                if y < height - 1:
+                    rows[y + 1][x] |= 1 << maze.NORTH
+        rows[y][0] |= 1 << maze.WEST
+    rows[0] = [cell | 1 << maze.NORTH for cell in rows[0]]
+    return rows
+
+
+def _reference_traversal(rows: list[list[int]], entry: tuple[int, int]) -> tuple[dict, bool]:
+    """The checker's original BFS distances and edge-count tree test."""
+    height, width = len(rows), len(rows[0])
+    moves = [(0, -1, 0), (1, 0, 1), (0, 1, 2), (-1, 0, 3)]
+    dist = {entry: 0}
+    queue = [entry]
+    for x, y in queue:
+        for dx, dy, bit in moves:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and not _closed(rows[y][x], bit) and (nx, ny) not in dist:
+                dist[(nx, ny)] = dist[(x, y)] + 1
+                queue.append((nx, ny))
+    edges = 0
+    for x, y in dist:
+        edges += x < width - 1 and (x + 1, y) in dist and not _closed(rows[y][x], 1)
+        edges += y < height - 1 and (x, y + 1) in dist and not _closed(rows[y][x], 2)
+    return dist, edges == len(dist) - 1
+
+
+def test_analysis_matches_reference_traversal() -> None:
+    rng = random.Random(7)
+    for _ in range(300):
+        width, height = rng.randint(1, 9), rng.randint(1, 9)
+        rows = _coherent_rows(rng, width, height)
+        entry = (rng.randrange(width), rng.randrange(height))
+        analysis = maze.Grid(width, height, bytes(sum(rows, []))).analyze(entry)
+        dist, is_tree = _reference_traversal(rows, entry)
+
+        for y in range(height):
+            for x in range(width):
+                assert analysis.distance_to(x, y) == dist.get((x, y))
+        assert analysis.unreachable_open == [
+            (x, y) for y in range(height) for x in range(width) if (x, y) not in dist and rows[y][x] != maze.CLOSED
+        ]
+        assert (not analysis.loops_through(*entry)) == is_tree
+
+
+def test_analysis_locates_loops_and_counts_areas() -> None:
+    # A 2x2 open room on the left, fully closed cells, and an unreachable open cell at (3, 0).
+    analysis = maze.Grid.parse(["93FD", "C6FF"]).analyze((0, 0))
+
+    assert analysis.loops == [((0, 1), (1, 1))]
+    assert analysis.loops_through(0, 0) == analysis.loops
+    assert analysis.loops_through(3, 0) == []
+    assert analysis.unreachable_open == [(3, 0)]
+    assert (analysis.components, analysis.isolated_closed) == (2, 3)
+    assert analysis.distance_to(1, 1) == 2
+    assert analysis.distance_to(9, 9) is None
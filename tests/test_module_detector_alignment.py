@@ -47,3 +47,53 @@ def test_detector_prefers_stronger_module09_file_signature(
 
     monkeypatch.chdir(tmp_path)
     assert ModuleDetector.detect() == "python_module_09"
+
+
+def test_detector_lists_directories_once_and_reports_confidence(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    from germinette.core import ModuleDetector
+
+    for ex, name in enumerate(["lambda_spells", "higher_magic", "scope_mysteries", "functools_artifacts"]):
+        _touch(tmp_path / f"ex{ex}" / f"{name}.py")
+    _touch(tmp_path / "notes" / "todo.txt")
+    monkeypatch.chdir(tmp_path)
+    listed: list[str] = []
+    real_scandir = os.scandir
+
+    def scandir(path: str = ".") -> object:
+        listed.append(os.path.relpath(path, tmp_path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    monkeypatch.setattr(os.path, "exists", lambda _: pytest.fail("stat per signature entry"))
+
+    detection = ModuleDetector.detect_with_confidence()
+    assert detection.module == "python_module_10"
+    assert 0.5 < detection.confidence < 1
+    assert sorted(listed) == [".", "ex0", "ex1", "ex2", "ex3"]
+
+    # Unchanged directory: answered from the fingerprint cache.
+    listed.clear()
+    assert ModuleDetector.detect_with_confidence() is detection
+    assert listed == ["."]
+
+    _touch(tmp_path / "ex4" / "decorator_mastery.py")
+    better = ModuleDetector.detect_with_confidence()
+    assert better.module == "python_module_10"
+    assert better.confidence > detection.confidence
+
+
+def test_detector_confidence_drops_for_ambiguous_layouts(tmp_path: Path) -> None:
+    from germinette.core import ModuleDetector
+
+    for ex in range(3):
+        _touch(tmp_path / f"ex{ex}" / "__init__.py")
+
+    detection = ModuleDetector.detect_with_confidence(str(tmp_path))
+
+    assert detection is not None
+    assert detection.confidence < 0.3
+    assert ModuleDetector.detect_with_confidence(str(tmp_path / "missing")) is None
@@ -34,6 +34,8 @@ def test_check_flake8_graceful_on_mypy_internal_error(tmp_path: Path, monkeypatc
         return original_run(args, **kwargs)
 
     monkeypatch.setattr(subprocess, "run", mock_run)
+    # Exercise the subprocess path rather than the warm lint backends.
+    monkeypatch.setenv("GERMINETTE_NO_LINT_DAEMON", "1")
 
     tester = MockTester()
     result = tester.check_flake8(str(test_file))
@@ -0,0 +1,118 @@
+"""Regression tests for the opt-in parallel exercise runner (``--jobs``)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from germinette.core import BaseTester, console
+
+
+class _FakeTester(BaseTester):
+    def __init__(self) -> None:
+        super().__init__()
+        self.exercises = [
+            ("ex0", self.test_ok),
+            ("ex1", self.test_ko),
+            ("ex2", self.test_ok_again),
+            ("ex3", self.test_ko_twice),
+        ]
+
+    def test_ok(self) -> None:
+        console.print("\n[bold]Testing Exercise 0[/bold]")
+        print("plain print from exercise 0")
+        console.print("[green]OK[/green]")
+        self.mark_ok()
+
+    def test_ko(self) -> None:
+        console.print("\n[bold]Testing Exercise 1[/bold]")
+        console.print("[red]KO[/red]")
+        self.record_error("Exercise 1", "Output Error", "expected foo")
+
+    def test_ok_again(self) -> None:
+        console.print("\n[bold]Testing Exercise 2[/bold]")
+        console.print("[green]OK[/green]")
+        self.mark_ok()
+
+    def test_ko_twice(self) -> None:
+        console.print("\n[bold]Testing Exercise 3[/bold]")
+        self.record_error("Exercise 3", "Style Error", "E501 line too long")
+        self.record_error("Exercise 1", "Late Error", "shared label")
+
+
+def _run(jobs: int, capsys: pytest.CaptureFixture[str]) -> tuple[str, _FakeTester]:
+    tester = _FakeTester()
+    tester.jobs = jobs
+    tester.run()
+    return capsys.readouterr().out, tester
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="parallel mode needs os.fork")
+def test_parallel_run_matches_serial_report(
+    capsys: pytest.CaptureFixture[str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Empty cwd: nothing for the lint pre-pass to pick up.
+    monkeypatch.chdir(tmp_path)
+    serial_out, serial = _run(1, capsys)
+    parallel_out, parallel = _run(4, capsys)
+
+    assert parallel_out == serial_out
+    assert parallel.grouped_errors == serial.grouped_errors
+    assert list(parallel.grouped_errors) == ["Exercise 1", "Exercise 3"]
+    assert (parallel.ok_count, parallel.ko_count) == (serial.ok_count, serial.ko_count)
+
+
+class _RaisingTester(BaseTester):
+    def __init__(self) -> None:
+        super().__init__()
+        self.exercises = [("ex0", self.test_raises), ("ex1", self.test_ok)]
+
+    def test_raises(self) -> None:
+        console.print("\n[bold]Testing Exercise 0[/bold]")
+        raise KeyError("missing [key]")
+
+    def test_ok(self) -> None:
+        console.print("\n[bold]Testing Exercise 1[/bold]")
+        self.mark_ok()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="parallel mode needs os.fork")
+def test_raising_exercise_is_reported_alike_serial_and_parallel(
+    capsys: pytest.CaptureFixture[str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    reports = []
+    for jobs in (1, 2):
+        tester = _RaisingTester()
+        tester.jobs = jobs
+        tester.run()
+        reports.append((capsys.readouterr().out, tester))
+    (serial_out, serial), (parallel_out, parallel) = reports
+
+    assert parallel_out == serial_out
+    assert "Testing Exercise 1" in parallel_out
+    assert parallel.grouped_errors == serial.grouped_errors
+    (message,) = parallel.grouped_errors["ex0"]
+    assert "Checker Error" in message
+    assert "Traceback (most recent call last):" in message
+    assert "in test_raises" in message and "KeyError: 'missing \\[key]'" in message
+    assert (parallel.ok_count, parallel.ko_count) == (serial.ok_count, serial.ko_count) == (1, 1)
+    assert parallel.verdicts == {"ex0": "fail", "ex1": "pass"}
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="parallel mode needs os.fork")
+def test_dead_worker_is_reported_with_its_traceback(
+    capsys: pytest.CaptureFixture[str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    tester = _RaisingTester()
+    monkeypatch.setattr(tester, "test_raises", lambda: os._exit(3))
+    tester.exercises = [("ex0", tester.test_raises), ("ex1", tester.test_ok)]
+    tester.jobs = 2
+
+    tester.run()
+
+    assert "BrokenProcessPool" in tester.grouped_errors["ex0"][0]
+    assert tester.verdicts["ex0"] == "fail"
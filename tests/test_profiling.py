@@ -0,0 +1,106 @@
+"""``--profile``: timing spans per check, script run, import and exercise."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from rich.console import Console
+
+from germinette import profiling
+from germinette.core import BaseTester
+from germinette.profiling import profiler, timed
+
+
+class _ProfiledTester(BaseTester):
+    def __init__(self, script: Path) -> None:
+        super().__init__()
+        self.script = script
+        self.exercises = [("ex0", self.test_run), ("ex1", self.test_import)]
+
+    def test_run(self) -> None:
+        self.script_runner.run([sys.executable, str(self.script)])
+        self.check_docstrings(str(self.script))
+
+    def test_import(self) -> None:
+        self._load(str(self.script))
+
+    @timed("import")
+    def _load(self, path: str) -> None:
+        self._load_again(path)
+
+    @timed("import")
+    def _load_again(self, path: str) -> None:
+        pass
+
+
+@pytest.fixture
+def profiled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.chdir(tmp_path)
+    script = tmp_path / "hello.py"
+    script.write_text('"""Says hello."""\nprint("hello")\n', encoding="utf-8")
+    profiler.take()
+    profiler.enable()
+    try:
+        yield script
+    finally:
+        profiler.enabled = False
+        profiler.take()
+
+
+def test_spans_cover_checks_scripts_imports_and_exercises(profiled: Path) -> None:
+    _ProfiledTester(profiled).run()
+
+    spans = {(s["phase"], s["name"], s["exercise"]) for s in profiler.spans}
+    assert ("exercise", "ex0", "ex0") in spans
+    assert ("script", "run(hello.py)", "ex0") in spans
+    assert ("docstrings", "check_docstrings(hello.py)", "ex0") in spans
+    # The nested import span is folded into the outer one.
+    assert [s["name"] for s in profiler.spans if s["phase"] == "import"] == ["_load(hello.py)"]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="parallel mode needs os.fork")
+def test_parallel_workers_send_spans_back(profiled: Path) -> None:
+    tester = _ProfiledTester(profiled)
+    tester.jobs = 2
+    tester.run()
+
+    exercises = sorted(s["exercise"] for s in profiler.spans if s["phase"] == "exercise")
+    assert exercises == ["ex0", "ex1"]
+
+
+def test_self_time_excludes_nested_spans() -> None:
+    spans = [
+        {"phase": "exercise", "name": "ex0", "exercise": "ex0", "start": 0.0, "duration": 1.0, "pid": 1},
+        {"phase": "flake8", "name": "a", "exercise": "ex0", "start": 0.1, "duration": 0.5, "pid": 1},
+        {"phase": "script", "name": "b", "exercise": "ex0", "start": 0.7, "duration": 0.2, "pid": 1},
+        {"phase": "exercise", "name": "ex1", "exercise": "ex1", "start": 0.2, "duration": 0.3, "pid": 2},
+    ]
+
+    summary = profiling.summarize(spans, top=2)
+
+    phases = {row["phase"]: row for row in summary["phases"]}
+    assert phases["exercise"]["self"] == pytest.approx(0.3 + 0.3)
+    assert phases["exercise"]["total"] == pytest.approx(1.3)
+    assert [s["name"] for s in summary["slowest"]] == ["a", "b"]
+    assert summary["exercises"][0]["phases"] == pytest.approx({"exercise": 0.3, "flake8": 0.5, "script": 0.2})
+
+
+def test_report_and_chrome_trace(profiled: Path, tmp_path: Path) -> None:
+    _ProfiledTester(profiled).run()
+    console = Console(record=True, width=120)
+
+    profiling.print_report(console, profiler.spans, wall=1.0, top=3)
+    trace = tmp_path / "trace.json"
+    profiling.write_trace(str(trace), profiler.spans, profiler.started)
+
+    text = console.export_text()
+    assert "Time by phase" in text and "Slowest 3 operations" in text and "ex0" in text
+    events = json.loads(trace.read_text(encoding="utf-8"))["traceEvents"]
+    complete = [e for e in events if e["ph"] == "X"]
+    assert len(complete) == len(profiler.spans)
+    assert all(e["ts"] >= 0 and e["dur"] >= 0 for e in complete)
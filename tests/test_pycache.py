@@ -0,0 +1,105 @@
+"""``germinette.pycache``: no bytecode in the submission, targeted cleanup."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from germinette import pycache
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+def test_grading_leaves_no_bytecode_behind(tmp_path: Path) -> None:
+    (tmp_path / "helper.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tmp_path / "script.py").write_text("import helper\nprint(helper.VALUE)\n", encoding="utf-8")
+    driver = (
+        "import importlib, sys\n"
+        "from germinette import pycache\n"
+        "from germinette.core import ScriptRunner\n"
+        "pycache.avoid_writes()\n"
+        "sys.path.insert(0, '.')\n"
+        "importlib.import_module('helper')\n"
+        "print(ScriptRunner().run([sys.executable, 'script.py']).stdout, end='')\n"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    env["PYTHONPATH"] = str(REPO)
+
+    result = subprocess.run(
+        [sys.executable, "-c", driver], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=60
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "1\n"
+    assert not (tmp_path / "__pycache__").exists()
+
+
+def test_shared_prefix_is_content_validated(tmp_path: Path) -> None:
+    submission = tmp_path / "submission"
+    submission.mkdir()
+    (submission / "helper.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (submission / "script.py").write_text("import helper\nprint(helper.VALUE)\n", encoding="utf-8")
+    prefix = tmp_path / "prefix"
+    driver = (
+        "import importlib, sys\n"
+        "from germinette import pycache\n"
+        "from germinette.core import ScriptRunner\n"
+        f"pycache.redirect({str(prefix)!r})\n"
+        "pycache.prime()\n"
+        "sys.path.insert(0, '.')\n"
+        "print(importlib.import_module('helper').VALUE)\n"
+        "print(ScriptRunner().run([sys.executable, 'script.py']).stdout, end='')\n"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    env["PYTHONPATH"] = str(REPO)
+
+    def grade() -> str:
+        result = subprocess.run(
+            [sys.executable, "-c", driver], cwd=submission, env=env, capture_output=True, text=True, timeout=60
+        )
+        assert result.returncode == 0, result.stderr
+        return result.stdout
+
+    assert grade() == "1\n1\n"
+    cached = list(prefix.rglob("helper.*.pyc"))
+    assert len(cached) == 1
+    flags = int.from_bytes(cached[0].read_bytes()[4:8], "little")
+    assert flags == 0b11  # hash-based, checked against the source
+    # Same size, same mtime: only the contents tell the edit apart.
+    stat = (submission / "helper.py").stat()
+    (submission / "helper.py").write_text("VALUE = 2\n", encoding="utf-8")
+    os.utime(submission / "helper.py", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert grade() == "2\n2\n"
+    assert not list(submission.rglob("__pycache__"))
+
+
+def test_cleanup_only_removes_directories_this_process_created(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sys, "dont_write_bytecode", sys.dont_write_bytecode)
+    monkeypatch.setenv("PYTHONDONTWRITEBYTECODE", "1")
+    monkeypatch.setattr(pycache, "_created", set())
+    # Created by the student, in another process.
+    subprocess.run(
+        [sys.executable, "-c", "import os; os.makedirs('mine/__pycache__')"], cwd=tmp_path, check=True
+    )
+    pycache.avoid_writes()
+    ours = tmp_path / "ex0" / "__pycache__"
+    in_venv = tmp_path / "venv" / "lib" / "__pycache__"
+    in_custom_env = tmp_path / "py311" / "lib" / "__pycache__"
+    elsewhere = tmp_path.parent / f"{tmp_path.name}-other" / "__pycache__"
+    for path in (ours, in_venv, in_custom_env, elsewhere):
+        path.mkdir(parents=True)
+    (tmp_path / "py311" / "pyvenv.cfg").write_text("", encoding="utf-8")
+
+    pycache.cleanup(str(tmp_path))
+
+    assert not ours.exists()
+    assert (tmp_path / "mine" / "__pycache__").exists()
+    assert in_venv.exists() and in_custom_env.exists() and elsewhere.exists()
+    assert sys.dont_write_bytecode
@@ -0,0 +1,83 @@
+"""On-disk result cache: round trips, LRU eviction and check_flake8 reuse."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from germinette import lint
+from germinette.cache import ResultCache
+from germinette.core import BaseTester
+
+
+def test_round_trip_including_none(tmp_path: Path) -> None:
+    cache = ResultCache(directory=str(tmp_path))
+    key = ResultCache.key("docstrings", "abc")
+
+    assert cache.lookup(key) == (False, None)
+    cache.store(key, None)
+    assert cache.lookup(key) == (True, None)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_prune_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = ResultCache(directory=str(tmp_path), max_bytes=2600)
+    keys = [ResultCache.key("k", str(i)) for i in range(3)]
+    for age, key in enumerate(keys):
+        cache.store(key, "x" * 1000)
+        entry = cache._entry_path(key)
+        os.utime(entry, (1000 + age, 1000 + age))
+    cache.lookup(keys[0])  # refreshes the oldest entry
+
+    cache.prune()
+
+    assert [cache.contains(k) for k in keys] == [True, False, True]
+
+
+def test_cached_checks_are_keyed_by_germinette_sources(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from germinette import incremental
+
+    student = tmp_path / "ft_student.py"
+    student.write_text("x = 1\n", encoding="utf-8")
+    tester = BaseTester()
+    calls: list[str] = []
+
+    def check(path: str) -> str:
+        calls.append(path)
+        return "diagnostics"
+
+    assert tester._cached_check("docstrings", str(student), check) == "diagnostics"
+    assert tester._cached_check("docstrings", str(student), check) == "diagnostics"
+    assert len(calls) == 1
+
+    # Same version, edited checker (e.g. _check_docstrings): the entry must not be reused.
+    monkeypatch.setattr(incremental, "_package", "edited")
+    tester._cached_check("docstrings", str(student), check)
+    assert len(calls) == 2
+
+
+def test_check_flake8_reuses_cached_results(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    student = tmp_path / "ft_student.py"
+    student.write_text("x = 1  \n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    tester = BaseTester()
+    try:
+        first = tester.check_flake8(str(student))
+    finally:
+        lint.shutdown()
+    assert first and "W291" in first
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("linters must not run on a cache hit")
+
+    keys = lint.cache_keys(str(student))
+    monkeypatch.setattr(lint, "run_flake8", fail)
+    monkeypatch.setattr(lint, "run_mypy", fail)
+    monkeypatch.setattr(subprocess, "run", fail)
+    assert tester.check_flake8(str(student)) == first
+
+    student.write_text("x = 2  \n", encoding="utf-8")
+    assert all(new != old for new, old in zip(lint.cache_keys(str(student)), keys))
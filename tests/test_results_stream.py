@@ -0,0 +1,116 @@
+"""``--format jsonl``: structured records streamed while the run is in progress."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import types
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from germinette import results
+from germinette.core import BaseTester, GerminetteRunner
+
+
+class _FakeTester(BaseTester):
+    def __init__(self) -> None:
+        super().__init__()
+        self.exercises = [("ex0", self.test_style), ("ex1", self.test_ok), ("ex2", self.test_output)]
+
+    def test_style(self) -> None:
+        self.record_error(
+            "Exercise 0",
+            "Style Error (flake8)",
+            "[bold]Flake8[/bold]\nex0/hello.py:3:80: E501 line too long (91 > 79 characters)",
+        )
+
+    def test_ok(self) -> None:
+        self.mark_ok()
+
+    def test_output(self) -> None:
+        self.record_error("Exercise 2", "Forbidden Function", "Line 7: You used 'eval()' which is NOT authorized.")
+
+
+@pytest.fixture
+def stream(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.chdir(tmp_path)
+    out = tmp_path / "results.jsonl"
+    with open(out, "w", encoding="utf-8") as f:
+        results.open_stream(f)
+        try:
+            yield out
+        finally:
+            results.close_stream()
+
+
+def _records(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_result_records_are_structured(stream: Path) -> None:
+    _FakeTester().run()
+
+    records = _records(stream)
+    failures = [r for r in records if r["event"] == "result"]
+    assert [(r["exercise"], r["check"], r["severity"]) for r in failures] == [
+        ("Exercise 0", "style-error-flake8", "error"),
+        ("Exercise 2", "forbidden-function", "error"),
+    ]
+    assert failures[0]["message"].startswith("Flake8\nex0/hello.py:3:80")  # markup stripped
+    assert (failures[0]["file"], failures[0]["line"]) == ("ex0/hello.py", 3)
+    assert (failures[1]["file"], failures[1]["line"]) == (None, 7)
+    exercises = [(r["exercise"], r["status"]) for r in records if r["event"] == "exercise"]
+    assert exercises == [("ex0", "fail"), ("ex1", "pass"), ("ex2", "fail")]
+    assert all(isinstance(r["duration"], float) for r in records if r["event"] == "exercise")
+
+
+def test_timed_check_supplies_file_and_duration(stream: Path, tmp_path: Path) -> None:
+    student = tmp_path / "student.py"
+    student.write_text("x = 1\n", encoding="utf-8")
+    tester = _FakeTester()
+
+    assert tester.check_docstrings(str(student))
+    tester.record_error("Exercise 3", "Docstring Error", "Missing docstrings")
+
+    record = _records(stream)[-1]
+    assert record["file"] == str(student)
+    assert record["duration"] >= 0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="parallel mode needs os.fork")
+def test_parallel_workers_stream_each_record_once(stream: Path) -> None:
+    tester = _FakeTester()
+    tester.jobs = 3
+    tester.run()
+
+    records = _records(stream)
+    assert sorted(r["exercise"] for r in records if r["event"] == "exercise") == ["ex0", "ex1", "ex2"]
+    assert len([r for r in records if r["event"] == "result"]) == 2
+    assert len(tester.grouped_errors) == 2
+
+
+def test_run_module_brackets_the_run(stream: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = types.ModuleType("germinette.subjects.fake_stream")
+    module.Tester = _FakeTester
+    monkeypatch.setitem(sys.modules, "germinette.subjects.fake_stream", module)
+    results.set_context(submission="alice")
+
+    assert GerminetteRunner().run_module("fake_stream") is False
+
+    records = _records(stream)
+    assert records[0]["event"] == "run_start" and records[0]["module"] == "fake_stream"
+    end = records[-1]
+    assert (end["event"], end["status"], end["errors"], end["failed"]) == (
+        "run_end", "fail", 2, ["Exercise 0", "Exercise 2"]
+    )
+    assert all(r["submission"] == "alice" for r in records)
+
+
+def test_disabled_stream_emits_nothing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    assert not results.enabled()
+    _FakeTester().run()
+    results.emit("result", message="dropped")
@@ -0,0 +1,152 @@
+"""Scripts run through the warm fork server must behave like ``python script.py``."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from germinette import script_pool
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="the script pool needs os.fork")
+
+_SCRIPT = """\
+import os
+import sys
+
+print("argv:", sys.argv)
+print("cwd:", os.path.basename(os.getcwd()))
+print("name:", __name__, os.path.basename(__file__))
+print("path0:", os.path.basename(sys.path[0]))
+print("env:", os.environ.get("GERMINETTE_TEST_VAR"))
+if len(sys.argv) > 1 and sys.argv[1] == "stdin":
+    print("read:", input())
+if len(sys.argv) > 1 and sys.argv[1] == "boom":
+    raise ValueError("boom")
+if len(sys.argv) > 1 and sys.argv[1] == "exit":
+    sys.exit("bye")
+print("leak:", "germinette" in sys.modules, "csv" in sys.modules)
+import csv  # noqa: E402,F401  (must not be visible to the next run)
+"""
+
+
+@pytest.fixture
+def script(tmp_path: Path) -> Path:
+    path = tmp_path / "student.py"
+    path.write_text(_SCRIPT, encoding="utf-8")
+    (tmp_path / "broken.py").write_text("def f(:\n", encoding="utf-8")
+    return path
+
+
+def _fresh(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+    stdin = None if "input" in kwargs else subprocess.DEVNULL
+    return subprocess.run(cmd, capture_output=True, text=True, stdin=stdin, timeout=30, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "args, kwargs",
+    [
+        ([], {}),
+        (["stdin"], {"input": "hello\n"}),
+        (["boom"], {}),
+        (["exit"], {"env": {**os.environ, "GERMINETTE_TEST_VAR": "set"}}),
+        (["missing.py"], {}),
+    ],
+)
+def test_pool_matches_fresh_interpreter(script: Path, args: list[str], kwargs: dict) -> None:
+    cmd = [sys.executable, str(script)] + args
+    if args == ["missing.py"]:
+        cmd = [sys.executable, str(script.parent / "missing.py")]
+
+    expected = _fresh(cmd, **kwargs)
+    result = script_pool.pool.run(cmd, **kwargs)
+
+    assert (result.returncode, result.stdout, result.stderr) == (
+        expected.returncode,
+        expected.stdout,
+        expected.stderr,
+    )
+
+
+def test_relative_script_and_cwd(script: Path) -> None:
+    cmd = [sys.executable, script.name]
+
+    expected = _fresh(cmd, cwd=script.parent)
+    script_pool.pool.run(cmd, cwd=script.parent)
+    result = script_pool.pool.run(cmd, cwd=script.parent)
+
+    assert result.stdout == expected.stdout
+    assert "leak: False" in result.stdout
+
+
+def test_inherits_the_callers_current_directory(script: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    script_pool.run([sys.executable, "-c", "pass"])  # server started from the old cwd
+    monkeypatch.chdir(script.parent)
+
+    result = script_pool.pool.run([sys.executable, script.name])
+
+    assert f"cwd: {script.parent.name}" in result.stdout
+
+
+def test_syntax_error_matches_fresh_interpreter(script: Path) -> None:
+    cmd = [sys.executable, str(script.parent / "broken.py")]
+
+    expected = _fresh(cmd)
+    result = script_pool.pool.run(cmd)
+
+    assert result.returncode == expected.returncode == 1
+    assert result.stderr == expected.stderr
+
+
+def test_timeout_kills_the_script(tmp_path: Path) -> None:
+    loop = tmp_path / "loop.py"
+    loop.write_text("while True:\n    pass\n", encoding="utf-8")
+
+    start = time.monotonic()
+    result = script_pool.run([sys.executable, str(loop)], timeout=0.5)
+    assert result.timed_out
+    assert result.returncode == -9
+    assert time.monotonic() - start < 5
+    # The server survives a killed script.
+    assert script_pool.run([sys.executable, "-c", "print(1)"]).stdout == "1\n"
+
+
+def test_disabled_pool_uses_subprocess(script: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GERMINETTE_NO_SCRIPT_POOL", "1")
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("pool used while disabled")
+
+    monkeypatch.setattr(script_pool.pool, "run", fail)
+    result = script_pool.run([sys.executable, str(script)])
+
+    assert result.returncode == 0
+    assert "argv:" in result.stdout
+
+
+def test_runs_get_their_own_hash_seed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("PYTHONHASHSEED", raising=False)
+    script = tmp_path / "hashes.py"
+    script.write_text("print(hash('abc'))\n", encoding="utf-8")
+    cmd = [sys.executable, str(script)]
+
+    hashes = {script_pool.pool.run(cmd).stdout for _ in range(3)}
+
+    assert len(hashes) == 3
+
+
+def test_trace_lists_opened_files(tmp_path: Path) -> None:
+    (tmp_path / "config.txt").write_text("WIDTH=4\n", encoding="utf-8")
+    (tmp_path / "data").mkdir()
+    script = tmp_path / "reader.py"
+    script.write_text("import os\nopen('config.txt').read()\nos.listdir('data')\n", encoding="utf-8")
+    cmd = [sys.executable, str(script)]
+
+    traced = script_pool.pool.run(cmd, cwd=str(tmp_path), trace=True)
+
+    assert {("file", str(tmp_path / "config.txt")), ("dir", str(tmp_path / "data"))} <= set(traced.opened)
+    assert script_pool.pool.run(cmd, cwd=str(tmp_path)).opened is None
@@ -0,0 +1,127 @@
+"""``ScriptRunner`` must stop pathological scripts and report why, with or without the pool."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from germinette.core import SCRIPT_STOPPED_PREFIX, BaseTester, ScriptRunner
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="rlimits are POSIX-only")
+
+
+class MockTester(BaseTester):
+    pass
+
+
+@pytest.fixture(params=["pool", "subprocess"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "subprocess":
+        monkeypatch.setenv("GERMINETTE_NO_SCRIPT_POOL", "1")
+    return request.param
+
+
+def _script(tmp_path: Path, source: str) -> list[str]:
+    path = tmp_path / "student.py"
+    path.write_text(source, encoding="utf-8")
+    return [sys.executable, str(path)]
+
+
+def test_normal_run_result(tmp_path: Path, backend: str) -> None:
+    cmd = _script(tmp_path, "import sys\nprint(input())\nprint('err', file=sys.stderr)\nsys.exit(3)\n")
+
+    result = ScriptRunner().run(cmd, input="hi\n")
+
+    assert (result.returncode, result.stdout, result.stderr) == (3, "hi\n", "err\n")
+    assert result.killed_by is None
+    assert not result.truncated
+    assert result.duration > 0
+    assert result.peak_rss_kb and result.peak_rss_kb > 0
+    assert result.cpu_seconds is not None
+
+
+def test_wall_clock_timeout(tmp_path: Path, backend: str) -> None:
+    cmd = _script(tmp_path, "import time\nprint('started', flush=True)\ntime.sleep(60)\n")
+
+    start = time.monotonic()
+    result = ScriptRunner(timeout=0.5).run(cmd)
+
+    assert time.monotonic() - start < 5
+    assert result.killed_by == "timeout"
+    assert result.stdout == "started\n"
+    assert result.stderr == f"{SCRIPT_STOPPED_PREFIX}timed out after 0.5 seconds.\n"
+
+
+def test_cpu_limit(tmp_path: Path, backend: str) -> None:
+    cmd = _script(tmp_path, "while True:\n    pass\n")
+
+    result = ScriptRunner(timeout=30, cpu_seconds=1).run(cmd)
+
+    assert result.killed_by == "cpu"
+    assert result.duration < 10
+    assert "exceeded the CPU time limit (1 seconds)" in result.stderr
+
+
+def test_memory_limit(tmp_path: Path, backend: str) -> None:
+    cmd = _script(tmp_path, "data = bytearray(2 * 1024 ** 3)\n")
+
+    result = ScriptRunner(memory_bytes=512 * 1024 ** 2).run(cmd)
+
+    assert result.killed_by == "memory"
+    assert "MemoryError" in result.stderr
+    assert "exceeded the memory limit (512 MiB)" in result.stderr
+
+
+def test_output_is_capped(tmp_path: Path, backend: str) -> None:
+    cmd = _script(tmp_path, "while True:\n    print('x' * 99)\n")
+
+    result = ScriptRunner(timeout=30, max_output_bytes=10_000, max_file_bytes=1024 ** 2).run(cmd)
+
+    assert result.killed_by == "output"
+    assert result.truncated
+    assert len(result.stdout) == 10_000
+    assert result.duration < 10
+
+
+def test_files_may_exceed_the_output_cap(tmp_path: Path, backend: str) -> None:
+    cmd = _script(tmp_path, "with open('maze.txt', 'w') as f:\n    f.write('F' * 200_000)\nprint('done')\n")
+
+    result = ScriptRunner(max_output_bytes=10_000).run(cmd, cwd=str(tmp_path))
+
+    assert (result.returncode, result.killed_by, result.stdout) == (0, None, "done\n")
+    assert (tmp_path / "maze.txt").stat().st_size == 200_000
+
+
+def test_file_size_limit(tmp_path: Path, backend: str) -> None:
+    cmd = _script(tmp_path, "with open('maze.txt', 'w') as f:\n    f.write('F' * 2 * 1024 ** 2)\n")
+
+    result = ScriptRunner(max_file_bytes=1024 ** 2).run(cmd, cwd=str(tmp_path))
+
+    assert result.killed_by == "file"
+    assert not result.truncated
+    assert "File too large" in result.stderr
+    assert result.stderr.endswith("wrote a file larger than the file-size limit (1 MiB).\n")
+
+
+def test_killed_by_signal(tmp_path: Path, backend: str) -> None:
+    cmd = _script(tmp_path, "import os, signal\nos.kill(os.getpid(), signal.SIGSEGV)\n")
+
+    result = ScriptRunner().run(cmd)
+
+    assert result.killed_by == "signal"
+    assert result.returncode == -11
+    assert result.stderr.endswith("was killed by SIGSEGV.\n")
+
+
+def test_run_script_reports_the_real_timeout(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    cmd = _script(tmp_path, "while True:\n    pass\n")
+    tester = MockTester()
+
+    output = tester._run_script(cmd[1], timeout=0.5)
+
+    assert output == f"{SCRIPT_STOPPED_PREFIX}timed out after 0.5 seconds.\n"
+    assert tester.check_for_crash(output, "Exercise 0")
+    assert tester.grouped_errors["Exercise 0"]
@@ -0,0 +1,75 @@
+"""SourceIndex parses each file once and serves the same node lists as ast.walk."""
+
+from __future__ import annotations
+
+import ast
+import os
+from pathlib import Path
+
+import pytest
+
+from germinette import source_index as source_index_module
+from germinette.source_index import SourceIndex
+
+_SOURCE = '''import os
+from sys import path
+
+
+class A:
+    def m(self) -> None:
+        try:
+            open("x")
+        except OSError:
+            os.getcwd()
+
+
+async def f() -> None:
+    print(sorted(path, key=lambda p: p))
+'''
+
+
+def test_node_lists_follow_walk_order(tmp_path: Path) -> None:
+    target = tmp_path / "mod.py"
+    target.write_text(_SOURCE, encoding="utf-8")
+    source = SourceIndex().get(str(target))
+    walked = list(ast.walk(ast.parse(_SOURCE)))
+
+    def names(nodes: list[ast.AST]) -> list[str]:
+        return [ast.dump(n) for n in nodes]
+
+    assert names(source.calls) == names([n for n in walked if isinstance(n, ast.Call)])
+    assert names(source.imports) == names(
+        [n for n in walked if isinstance(n, (ast.Import, ast.ImportFrom))]
+    )
+    assert [n.name for n in source.definitions] == ["A", "f", "m"]
+    assert len(source.tries) == 1 and len(source.attributes) == 1 and len(source.lambdas) == 1
+
+
+def test_parses_once_until_file_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    target = tmp_path / "mod.py"
+    target.write_text("x = 1\n", encoding="utf-8")
+    parses = []
+    real_parse = ast.parse
+    monkeypatch.setattr(source_index_module.ast, "parse", lambda src: parses.append(src) or real_parse(src))
+    index = SourceIndex()
+
+    assert index.get(str(target)) is index.get(str(tmp_path / "." / "mod.py"))
+    assert len(parses) == 1
+
+    target.write_text("x = 22\n", encoding="utf-8")
+    assert index.get(str(target)).source == "x = 22\n"
+    assert len(parses) == 2
+
+
+def test_syntax_errors_are_remembered(tmp_path: Path) -> None:
+    target = tmp_path / "broken.py"
+    target.write_text("def (:\n", encoding="utf-8")
+    index = SourceIndex()
+
+    for _ in range(2):
+        with pytest.raises(SyntaxError):
+            index.get(str(target))
+
+    os.remove(target)
+    with pytest.raises(OSError):
+        index.get(str(target))
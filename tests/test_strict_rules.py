@@ -0,0 +1,71 @@
+"""verify_strict evaluates every rule in one traversal and reports all violations."""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from germinette import strict_rules
+from germinette.core import BaseTester
+
+_SOURCE = """import os
+import json
+from . import sibling
+
+
+def main() -> None:
+    data = open("x").read()
+    name = input()
+    print(eval(name), data, os.sep, json)
+    raise ValueError(len(data))
+"""
+
+
+def test_all_violations_are_recorded_in_one_pass(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "ft_strict.py"
+    target.write_text(_SOURCE, encoding="utf-8")
+    visits = []
+    real_visit = strict_rules.RuleVisitor.visit
+    monkeypatch.setattr(
+        strict_rules.RuleVisitor,
+        "visit",
+        lambda self, node: visits.append(node) or real_visit(self, node),
+    )
+    tester = BaseTester()
+
+    ok = tester.verify_strict(
+        str(target), "Exercise 0", ["print", "len"], allowed_imports=["sys"], enforce_try_except=True
+    )
+
+    assert not ok
+    # One traversal: each node is visited once (ast.Load & co. are shared singletons).
+    nodes = [n for n in visits if not isinstance(n, ast.expr_context)]
+    assert len(nodes) == len({id(n) for n in nodes})
+    errors = tester.grouped_errors["Exercise 0"]
+    assert [e.split("\n", 1)[0] for e in errors] == [
+        "[bold]Forbidden Operation[/bold]",
+        "[bold]Forbidden Import[/bold]",
+        "[bold]Structure Error[/bold]",
+        "[bold]Authorized Functions[/bold]",
+    ]
+    report = "\n".join(errors)
+    assert "Line 1: Forbidden Import: 'os'" in report
+    assert "Line 2: Forbidden Import: 'json'" in report
+    assert "sibling" not in report
+    assert "Line 7: open()" in report
+    assert "Line 8: You used 'input()'" in report
+    assert "Line 9: You used 'eval()'" in report
+    assert "ValueError" not in report
+
+
+def test_clean_file_passes(tmp_path: Path) -> None:
+    target = tmp_path / "ft_clean.py"
+    target.write_text("import sys\n\ntry:\n    print(len(sys.argv))\nexcept ValueError:\n    pass\n")
+
+    assert BaseTester().verify_strict(
+        str(target), "Exercise 0", ["print", "len"], enforce_try_except=True
+    )
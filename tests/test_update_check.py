@@ -0,0 +1,77 @@
+"""The startup update check must not block and must reuse its on-disk result."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from germinette import utils
+from germinette.utils import UpdateCheck
+
+
+@pytest.fixture(autouse=True)
+def _no_debug_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GERMINETTE_DEBUG_REMOTE_VERSION", raising=False)
+
+
+def test_fetch_imports_happen_before_the_thread_starts(monkeypatch: pytest.MonkeyPatch) -> None:
+    import sys
+
+    monkeypatch.delitem(sys.modules, "urllib.request", raising=False)
+    monkeypatch.setattr(utils, "_fetch_remote_version", lambda timeout=2: None)
+    loaded_at_start = []
+    real_start = threading.Thread.start
+
+    def start(thread: threading.Thread) -> None:
+        loaded_at_start.append("urllib.request" in sys.modules)
+        real_start(thread)
+
+    monkeypatch.setattr(threading.Thread, "start", start)
+    UpdateCheck("1.0.0").start().result(wait=5)
+
+    assert loaded_at_start == [True]
+
+
+def test_fetch_runs_in_background_and_records_timestamp(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+
+    def slow_fetch(timeout: float = 2) -> str:
+        release.wait(5)
+        return "9.0.0"
+
+    monkeypatch.setattr(utils, "_fetch_remote_version", slow_fetch)
+    started = time.monotonic()
+    check = UpdateCheck("1.0.0").start()
+
+    assert time.monotonic() - started < 0.5
+    assert check.result(wait=0) == (False, None, False)
+
+    release.set()
+    assert check.result(wait=5) == (True, "9.0.0", True)
+    with open(UpdateCheck._state_path(), encoding="utf-8") as f:
+        state = json.load(f)
+    assert state["remote_version"] == "9.0.0"
+    assert time.time() - state["checked_at"] < 60
+
+
+def test_fresh_result_skips_the_network(monkeypatch: pytest.MonkeyPatch) -> None:
+    with open(UpdateCheck._state_path(), "w", encoding="utf-8") as f:
+        json.dump({"checked_at": time.time() - 60, "remote_version": "1.0.0"}, f)
+
+    def no_network(timeout: float = 2) -> None:
+        raise AssertionError("GitHub must not be queried while the cached result is fresh")
+
+    monkeypatch.setattr(utils, "_fetch_remote_version", no_network)
+
+    assert UpdateCheck("1.0.0").start().result(wait=0) == (False, "1.0.0", True)
+
+
+def test_stale_result_is_refreshed(monkeypatch: pytest.MonkeyPatch) -> None:
+    with open(UpdateCheck._state_path(), "w", encoding="utf-8") as f:
+        json.dump({"checked_at": time.time() - utils.UPDATE_CHECK_TTL - 1, "remote_version": "1.0.0"}, f)
+    monkeypatch.setattr(utils, "_fetch_remote_version", lambda timeout=2: None)
+
+    assert UpdateCheck("1.0.0").start().result(wait=5) == (False, None, False)
@@ -0,0 +1,177 @@
+"""``--watch``: change detection, debouncing and verdict diffs."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+from germinette import watch
+from germinette.core import BaseTester, GerminetteRunner
+
+
+def _watchers(root: Path) -> list:
+    found = [watch.PollingWatcher(str(root), interval=0.05)]
+    if sys.platform.startswith("linux"):
+        found.append(watch.InotifyWatcher(str(root)))
+    return found
+
+
+def test_watchers_report_modified_created_and_deleted_files(tmp_path: Path) -> None:
+    (tmp_path / "ex0").mkdir()
+    (tmp_path / "ex0" / "a.py").write_text("a = 1\n", encoding="utf-8")
+    (tmp_path / "gone.py").write_text("", encoding="utf-8")
+
+    for watcher in _watchers(tmp_path):
+        try:
+            (tmp_path / "ex0" / "a.py").write_text("a = 22\n", encoding="utf-8")
+            (tmp_path / "ex1").mkdir(exist_ok=True)
+            (tmp_path / "ex1" / "b.py").write_text("b = 1\n", encoding="utf-8")
+            os.remove(tmp_path / "gone.py")
+            (tmp_path / "__pycache__").mkdir(exist_ok=True)
+            (tmp_path / "__pycache__" / "a.pyc").write_bytes(b"x")
+
+            changed = watch.next_batch(watcher, debounce=0.2)
+
+            assert {os.path.relpath(p, tmp_path) for p in changed} >= {
+                os.path.join("ex0", "a.py"), os.path.join("ex1", "b.py"), "gone.py"
+            }
+            assert not any("__pycache__" in p for p in changed)
+        finally:
+            watcher.close()
+        (tmp_path / "gone.py").write_text("", encoding="utf-8")
+
+
+def test_bursts_of_saves_are_debounced_into_one_batch(tmp_path: Path) -> None:
+    target = tmp_path / "a.py"
+    target.write_text("", encoding="utf-8")
+    watcher = watch.make_watcher(str(tmp_path))
+
+    def save_three_times() -> None:
+        for i in range(3):
+            (tmp_path / f"f{i}.py").write_text("x = 1\n", encoding="utf-8")
+            time.sleep(0.05)
+
+    writer = threading.Thread(target=save_three_times)
+    try:
+        writer.start()
+        changed = watch.next_batch(watcher, debounce=0.6)
+    finally:
+        writer.join()
+        watcher.close()
+    assert {os.path.basename(p) for p in changed} >= {"f0.py", "f1.py", "f2.py"}
+
+
+def test_only_content_changes_count(tmp_path: Path) -> None:
+    kept = tmp_path / "kept.py"
+    kept.write_text("x = 1\n", encoding="utf-8")
+    graded = watch.snapshot(str(tmp_path))
+    temporary = tmp_path / "generated.txt"
+
+    os.utime(kept)  # touched, same contents
+    assert watch.content_changes({str(kept), str(temporary)}, graded) == set()
+
+    kept.write_text("x = 2\n", encoding="utf-8")
+    assert watch.content_changes({str(kept)}, graded) == {str(kept)}
+    assert watch.content_changes({str(kept)}, graded) == set()
+
+
+def test_diff_verdicts() -> None:
+    before = {"ex0": "pass", "ex1": "fail", "ex2": "fail", "old": "fail"}
+    after = {"ex0": "pass", "ex1": "pass", "ex2": "fail", "ex3": "fail"}
+
+    assert watch.diff_verdicts(before, after) == [
+        ("ex1", "fail", "pass"), ("ex3", None, "fail"), ("old", "fail", None)
+    ]
+
+
+class _CountingTester(BaseTester):
+    runs: list[str] = []
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.exercises = [("ex0", self.test_a), ("ex1", self.test_b)]
+
+    def test_a(self) -> None:
+        self.runs.append("ex0")
+        print("exercise a output")
+        Path("a.py").read_text(encoding="utf-8")
+
+    def test_b(self) -> None:
+        self.runs.append("ex1")
+        if "bad" in Path("b.py").read_text(encoding="utf-8"):
+            self.record_error("Exercise 1", "Output Error", "bad")
+
+
+def test_watch_runs_replay_unchanged_exercises_quietly(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    module = types.ModuleType("germinette.subjects.fake_watch")
+    module.Tester = _CountingTester
+    monkeypatch.setitem(sys.modules, "germinette.subjects.fake_watch", module)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.py").write_text("", encoding="utf-8")
+    (tmp_path / "b.py").write_text("", encoding="utf-8")
+    _CountingTester.runs = []
+    runner = GerminetteRunner()
+
+    runner.run_module("fake_watch")
+    (tmp_path / "b.py").write_text("bad\n", encoding="utf-8")
+    capsys.readouterr()
+    runner.run_module("fake_watch", quiet_replay=True)
+
+    assert _CountingTester.runs == ["ex0", "ex1", "ex1"]
+    assert "exercise a output" not in capsys.readouterr().out
+    assert runner.tester.verdicts == {"ex0": "pass", "ex1": "fail"}
+    assert runner.tester.replayed == {"ex0"}
+
+
+class _WritingRunner:
+    """Stands in for ``GerminetteRunner``: every run rewrites an output file, like a graded maze script."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.calls: list[dict] = []
+        self.tester = None
+
+    def run_module(self, module_name, exercise=None, **kwargs):
+        self.calls.append(kwargs)
+        (self.root / "maze.txt").write_text(f"run {len(self.calls)}\n", encoding="utf-8")
+        self.tester = types.SimpleNamespace(verdicts={"ex0": "pass"}, replayed=set())
+        return True
+
+
+def test_watch_reruns_keep_force_and_ignore_files_written_by_the_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / "a_maze_ing.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+    output = str(tmp_path / "maze.txt")
+
+    def save_source() -> set[str]:
+        source.write_text("x = 2\n", encoding="utf-8")
+        return {str(source), output}
+
+    batches = [lambda: {output}, save_source, lambda: {output}]
+
+    def fake_next_batch(watcher) -> set[str]:
+        if not batches:
+            raise KeyboardInterrupt
+        return batches.pop(0)()
+
+    monkeypatch.setattr(watch, "next_batch", fake_next_batch)
+    monkeypatch.setattr(watch, "make_watcher", lambda root: watch.PollingWatcher(root))
+    runner = _WritingRunner(tmp_path)
+
+    watch.watch(runner, "a_maze_ing", force=True)
+
+    # The output each run writes never triggers a run; the saved source does, once.
+    assert len(runner.calls) == 2
+    assert all(call["force"] is True for call in runner.calls)
+    assert runner.calls[1]["quiet_replay"] is True